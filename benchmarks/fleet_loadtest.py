@@ -0,0 +1,85 @@
+"""
+Collector Yük Testi
+Loopback üzerinde simüle edilmiş agent'larla FleetCollector verimini ölçer
+
+Kullanım:
+    python benchmarks/fleet_loadtest.py --agents 200 --results 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.fleet import FleetAgent, FleetCollector
+
+
+MESSAGES = [
+    ('critical', 'SMBv1 protokolü etkin (TEHLİKELİ!)'),
+    ('high', 'UAC (Kullanıcı Hesabı Denetimi) devre dışı'),
+    ('medium', 'Uzak Masaüstü (RDP) etkin'),
+    ('medium', 'Disk şifreleme (BitLocker) kapalı'),
+    ('low', 'Windows Script Host (WSH) etkin'),
+    ('low', 'Ekran koruyucu şifre koruması yok')
+]
+
+
+def synthetic_result(host):
+    """Rastgele bulgular içeren kompakt sonuç"""
+    return {
+        'host': host,
+        'ts': time.time(),
+        'system': 'Windows 10',
+        'duration': round(random.uniform(1, 5), 3),
+        'checks': 18,
+        'findings': [list(m) for m in random.sample(MESSAGES, random.randint(0, len(MESSAGES)))]
+    }
+
+
+async def simulate_agent(logger, port, index, results, batch_size):
+    """Tek agent: sonuçları üretip gönderir"""
+    agent = FleetAgent(logger, None, '127.0.0.1', port, batch_size=batch_size,
+                       host=f'host-{index:05d}')
+    for _ in range(results):
+        agent.enqueue(synthetic_result(agent.host))
+    try:
+        await agent.flush()
+    finally:
+        await agent.disconnect()
+    return agent.sent
+
+
+async def main(args):
+    logger = logging.getLogger('fleet-loadtest')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        collector = FleetCollector(logger, os.path.join(tmp, 'fleet.db'), '127.0.0.1', 0,
+                                   queue_size=args.queue_size)
+        await collector.start()
+
+        start = time.perf_counter()
+        sent = await asyncio.gather(*[
+            simulate_agent(logger, collector.port, i, args.results, args.batch_size)
+            for i in range(args.agents)
+        ])
+        await collector.stop()
+        elapsed = time.perf_counter() - start
+
+    total = sum(sent)
+    print(f"Agent: {args.agents}, sonuç: {total}, yazılan: {collector.written}")
+    print(f"Süre: {elapsed:.2f} s, verim: {total / elapsed * 60:,.0f} sonuç/dakika")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--agents', type=int, default=200)
+    parser.add_argument('--results', type=int, default=50, help='Agent başına sonuç')
+    parser.add_argument('--batch-size', type=int, default=25)
+    parser.add_argument('--queue-size', type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,97 @@
+"""
+Log Yükü Ölçümü
+Logger çağrısı başına maliyet: eşzamanlı yazım ile tamponlu (arka plan) yazım
+
+Her senaryo geçici bir log klasöründe ayrı bir Logger ile çalışır. Çağrı
+başına süre yalnızca çağıran tarafı ölçer; "boşaltma" tamponun diske
+yazılmasını bekleyen toplam süreyi gösterir.
+
+Kullanım:
+    python benchmarks/logging_bench.py --calls 100000 --threads 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logger import Logger
+
+
+def run(logger, calls, threads):
+    """calls çağrıyı threads iş parçacığına bölerek logla; (çağrı süresi, boşaltma dahil süre)"""
+    per_thread = calls // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        barrier.wait()
+        for i in range(per_thread):
+            logger.info("Kontrol yapılıyor: %s (%d/%d)", index, i, per_thread)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    logger.flush(timeout=60)
+    return elapsed, time.perf_counter() - start
+
+
+def disabled(logger, calls):
+    """Kapalı seviyede (DEBUG) f-string ve %-biçimi çağrılarının süresi"""
+    payload = {'check': 'smb_v1', 'status': 'ok', 'ports': list(range(20))}
+
+    start = time.perf_counter()
+    for i in range(calls):
+        logger.debug(f"Ayrıntı: {payload} ({i})")
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(calls):
+        logger.debug("Ayrıntı: %s (%s)", payload, i)
+    lazy = time.perf_counter() - start
+
+    return eager, lazy
+
+
+def main(args):
+    print(f"Çağrı: {args.calls}, iş parçacığı: 1 ve {args.threads}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, options in (
+            ('eşzamanlı', {'async_mode': False}),
+            ('tampon / block', {'overflow': 'block'}),
+            ('tampon / drop', {'overflow': 'drop'})
+        ):
+            for threads in (1, args.threads):
+                logger = Logger(f'bench-{len(os.listdir(tmp))}-{threads}', log_dir=tempfile.mkdtemp(dir=tmp),
+                                **options)
+                elapsed, drained = run(logger, args.calls, threads)
+                calls = args.calls // threads * threads
+                print(f"{mode:<15} {threads:>2} iş parçacığı: {elapsed / calls * 1e6:6.2f} µs/çağrı, "
+                      f"boşaltma dahil {drained / calls * 1e6:6.2f} µs/çağrı, düşürülen {logger.dropped}")
+                logger.close()
+
+        logger = Logger('bench-disabled', log_dir=tempfile.mkdtemp(dir=tmp))
+        eager, lazy = disabled(logger, args.calls)
+        print(f"Kapalı seviye (DEBUG): f-string {eager / args.calls * 1e6:5.2f} µs/çağrı, "
+              f"%-biçimi {lazy / args.calls * 1e6:5.2f} µs/çağrı")
+        logger.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100000)
+    parser.add_argument('--threads', type=int, default=8)
+    sys.exit(main(parser.parse_args()))
\ No newline at end of file
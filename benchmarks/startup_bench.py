@@ -0,0 +1,84 @@
+"""
+Başlangıç Süresi Ölçümü
+'main.py scan' için yorumlayıcı açılışından ilk kontrolün başlamasına kadar geçen süre
+
+Her ölçüm yeni bir yorumlayıcıda yapılır. İlk (soğuk) çalıştırma ısınma
+olarak atlanır; sonuçlar ısınmış dosya önbelleğiyle ölçülür.
+
+Kullanım:
+    python benchmarks/startup_bench.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alt süreçte çalışan ölçüm betiği: ilk sırada dağıtılan sahte bir kontrol
+# kaydedilir ve 'scan' komutu kayıt yapmadan çalıştırılır.
+PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+import main
+t_import = time.perf_counter()
+
+from modules.registry import check
+first = []
+
+@check('startup_probe', 'Başlangıç ölçümü', cost=1e9, order=0)
+async def startup_probe(ctx):
+    first.append(time.perf_counter())
+
+main.main(['scan', '--checks', 'startup_probe', '--no-record', '--output', os.devnull])
+heavy = sorted(m for m in ('modules.ui', 'colorama') if m in sys.modules)
+print(json.dumps({{'import': t_import - t0, 'first_check': first[0] - t0, 'eager': heavy}}))
+"""
+
+
+def measure(python):
+    """Tek ölçüm (yeni yorumlayıcı)"""
+    # Isınmış ölçüm için .pyc önbelleği yazılabilmeli
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    output = subprocess.run(
+        [python, '-c', PROBE.format(root=ROOT)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    measure(args.python)  # Isınma
+
+    samples = [measure(args.python) for _ in range(args.runs)]
+    imports = [s['import'] * 1000 for s in samples]
+    first = [s['first_check'] * 1000 for s in samples]
+
+    print(f"Ölçüm: {args.runs}")
+    print(f"main içe aktarma   : medyan {statistics.median(imports):6.1f} ms")
+    print(f"İlk kontrole kadar : medyan {statistics.median(first):6.1f} ms, "
+          f"en kötü {max(first):6.1f} ms (hedef < {args.target:.0f} ms)")
+
+    eager = samples[-1]['eager']
+    if eager:
+        print(f"Uyarı: tarama yolunda gereksiz yüklenen modüller: {', '.join(eager)}")
+
+    return 0 if statistics.median(first) < args.target else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--target', type=float, default=100.0, help='Hedef süre (ms)')
+    parser.add_argument('--python', default=sys.executable)
+    sys.exit(main(parser.parse_args()))
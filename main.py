@@ -1,50 +1,395 @@
-"""
-Siber Güvenlik Tarama Aracı
-Ana Program Dosyası
-"""
-
-import sys
-import os
-
-# Proje dizinini al
-current_dir = os.path.dirname(os.path.abspath(__file__))
-
-# Modül yollarını ekle
-modules_path = os.path.join(current_dir, 'modules')
-utils_path = os.path.join(current_dir, 'utils')
-
-sys.path.insert(0, modules_path)
-sys.path.insert(0, utils_path)
-
-# Import'lar (artık doğrudan)
-from ui import SecurityUI
-from scanner import SecurityScanner
-from logger import Logger
-
-def main():
-    """Ana program fonksiyonu"""
-    try:
-        # Logger başlat
-        logger = Logger()
-        logger.info("Program başlatıldı")
-        
-        # Scanner ve UI oluştur
-        scanner = SecurityScanner(logger)
-        ui = SecurityUI(scanner, logger)
-        
-        # Programı çalıştır
-        ui.run()
-        
-        logger.info("Program normal şekilde sonlandırıldı")
-        
-    except KeyboardInterrupt:
-        print("\n\n⚠ Program kullanıcı tarafından sonlandırıldı.")
-        sys.exit(0)
-    except Exception as e:
-        print(f"\n❌ Beklenmeyen hata: {e}")
-        if 'logger' in locals():
-            logger.error(f"Kritik hata: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+"""
+Siber Güvenlik Tarama Aracı
+Ana Program Dosyası
+"""
+
+import argparse
+import sys
+
+# Ağır modüller (arayüz, colorama, rapor yazıcıları, asyncio) yalnızca
+# seçilen komut ihtiyaç duyduğunda içe aktarılır.
+
+# 'scan' komutunun çıkış kodları
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_INCOMPLETE = 3
+# Ctrl+C (128 + SIGINT); yarıda kalan tarama temiz sayılmamalı
+EXIT_INTERRUPTED = 130
+RISK_EXIT_CODES = {
+    'low': 10,
+    'medium': 11,
+    'high': 12,
+    'critical': 13
+}
+
+EXIT_CODES_HELP = """\
+çıkış kodları (scan):
+  0   güvenlik açığı yok
+  1   çalışma hatası
+  2   geçersiz kullanım
+  3   açık yok ama bazı kontroller süre sınırını aştı
+  10  en yüksek risk: düşük
+  11  en yüksek risk: orta
+  12  en yüksek risk: yüksek
+  13  en yüksek risk: kritik
+  130 kullanıcı tarafından kesildi (Ctrl+C)
+"""
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını çözümle"""
+    parser = argparse.ArgumentParser(
+        description='Siber Güvenlik Tarama Aracı',
+        epilog=EXIT_CODES_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    
+    scan = subparsers.add_parser(
+        'scan',
+        help='Etkileşimsiz tarama (cron / otomasyon)',
+        epilog=EXIT_CODES_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    scan.add_argument('--format', choices=['json', 'txt', 'html'], default='json',
+                      help='Çıktı formatı (varsayılan: json)')
+    scan.add_argument('--checks', default=None,
+                      help='Virgülle ayrılmış kontrol kimlikleri (varsayılan: platformdaki tümü)')
+    scan.add_argument('--output', default='-', help='Çıktı dosyası (- = stdout)')
+    scan.add_argument('--timeout', type=float, default=None,
+                      help='Tarama süre sınırı, saniye (config scan_timeout yerine)')
+    scan.add_argument('--delta', action='store_true',
+                      help='Yalnızca önceki taramaya göre değişenleri yaz (json / txt)')
+    scan.add_argument('--no-record', action='store_true',
+                      help='Sonucu geçmişe ve maliyet modeline kaydetme')
+    scan.add_argument('--list-checks', action='store_true',
+                      help='Bu platformdaki kontrolleri listele ve çık')
+    
+    stats = subparsers.add_parser('stats', help='Tarama geçmişi istatistiklerini yazdır')
+    stats.add_argument('--rebuild', action='store_true',
+                       help='Toplamları ham geçmişten yeniden hesapla ve doğrula')
+    stats.add_argument('--trend', choices=['auto', 'hour', 'day', 'week'], default=None,
+                       help='İstatistik yerine açık eğilimini yazdır')
+    stats.add_argument('--days', type=float, default=30, help='Eğilim aralığı, gün (varsayılan: 30)')
+    stats.add_argument('--by', choices=['check', 'risk'], default=None,
+                       help='Eğilimi kontrole veya risk seviyesine göre kır')
+    stats.add_argument('--check', default=None, metavar='CHECK_ID',
+                       help='Kontrolün ilk / son görüldüğü taramaları yazdır')
+    
+    reports = subparsers.add_parser('reports', help='Oluşturulan raporları listele (yeniden eskiye)')
+    reports.add_argument('--limit', type=int, default=20, help='Sayfa boyutu (varsayılan: 20)')
+    reports.add_argument('--before', type=int, default=None, metavar='ID',
+                         help='Bu kayıttan eski raporlar (önceki sayfanın son kimliği)')
+    reports.add_argument('--format', choices=['json', 'txt', 'html'], default=None,
+                         help='Yalnızca bu formattaki raporlar')
+    reports.add_argument('--kind', choices=['report', 'delta'], default=None,
+                         help='Yalnızca tam veya fark raporları')
+    reports.add_argument('--risk', choices=['low', 'medium', 'high', 'critical'], default=None,
+                         help='Bu seviyede bulgu içeren raporlar')
+    reports.add_argument('--host', default=None, help='Yalnızca bu uç noktanın raporları')
+    reports.add_argument('--json', action='store_true', help='Listeyi JSON olarak yazdır')
+    reports.add_argument('--sync', action='store_true',
+                         help='Rapor dizinini klasörle eşitle (elle eklenen / silinen dosyalar)')
+    reports.add_argument('--prune', action='store_true',
+                         help='report_retention politikasını şimdi uygula')
+    
+    aggregate = subparsers.add_parser('aggregate', help='JSON raporlarından filo özeti oluştur')
+    aggregate.add_argument('directory', nargs='?', default=None,
+                           help='security_report_*.json dizini (varsayılan: Reports)')
+    aggregate.add_argument('--format', choices=['json', 'txt', 'html'], default='txt',
+                           help='Çıktı formatı (varsayılan: txt)')
+    aggregate.add_argument('--output', default='-', help='Çıktı dosyası (- = stdout)')
+    aggregate.add_argument('--workers', type=int, default=None,
+                           help='Ayrıştırıcı süreç sayısı (varsayılan: CPU sayısı)')
+    aggregate.add_argument('--top', type=int, default=20, help='Listelenecek bulgu / uç nokta sayısı')
+    
+    agent = subparsers.add_parser('agent', help='Başsız agent: tara ve sonucu collector\'a gönder')
+    agent.add_argument('--collector', required=True, help='Collector adresi (HOST:PORT)')
+    agent.add_argument('--interval', type=float, default=None,
+                       help='Taramalar arası saniye (verilmezse tek tarama)')
+    agent.add_argument('--batch-size', type=int, default=50, help='Çerçeve başına en fazla sonuç')
+    
+    collector = subparsers.add_parser('collector', help='Agent sonuçlarını toplayan sunucu')
+    collector.add_argument('--listen', default='0.0.0.0:8765', help='Dinlenecek adres (HOST:PORT)')
+    collector.add_argument('--db', default=None, help='SQLite veritabanı (varsayılan: data/fleet.db)')
+    
+    return parser.parse_args(argv)
+
+def scan_exit_code(scan_result):
+    """
+    Tarama sonucundan çıkış kodu
+    
+    Returns:
+        int: En yüksek riske göre 10-13, açık yoksa 0 (eksik taramada 3)
+    """
+    risks = [
+        vuln.get('risk', 'medium').lower()
+        for vuln in scan_result.get('vulnerabilities', [])
+    ]
+    codes = [RISK_EXIT_CODES.get(risk, RISK_EXIT_CODES['medium']) for risk in risks]
+    
+    if codes:
+        return max(codes)
+    if scan_result.get('scan_info', {}).get('timed_out'):
+        return EXIT_INCOMPLETE
+    return EXIT_OK
+
+def run_scan(args, logger):
+    """Etkileşimsiz taramayı çalıştır ve raporu yaz"""
+    import platform
+    from modules.registry import registry
+    
+    system = platform.system()
+    
+    if args.list_checks:
+        for spec in registry.specs(system, logger=logger):
+            print(f"{spec.id:<24} {spec.risk:<9} {spec.name}")
+        return EXIT_OK
+    
+    check_ids = None
+    if args.checks:
+        check_ids = [check_id.strip() for check_id in args.checks.split(',') if check_id.strip()]
+        try:
+            registry.specs(system, check_ids, logger)
+        except KeyError as e:
+            print(f"Hata: {e.args[0]}", file=sys.stderr)
+            return EXIT_USAGE
+    
+    if args.delta and args.format == 'html':
+        print("Hata: fark raporu yalnızca json ve txt formatında üretilir", file=sys.stderr)
+        return EXIT_USAGE
+    
+    from modules.scanner import SecurityScanner
+    
+    scanner = SecurityScanner(logger)
+    if args.timeout is not None:
+        scanner.config['scan_timeout'] = args.timeout
+    
+    try:
+        result = scanner.perform_scan(check_ids=check_ids, record=not args.no_record)
+        # Önceki tarama yoksa tüm bulgular yeni sayılır
+        baseline = (scanner.get_baseline() or {}) if args.delta else None
+    finally:
+        scanner.close()
+    
+    from utils.report import ReportGenerator
+    
+    reporter = ReportGenerator(logger)
+    if args.output == '-':
+        # Windows konsolunda Türkçe karakterler için
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(encoding='utf-8')
+        reporter.write(result, args.format, sys.stdout, baseline)
+        if args.format == 'json':
+            sys.stdout.write('\n')
+        sys.stdout.flush()
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            reporter.write(result, args.format, f, baseline)
+    
+    return scan_exit_code(result)
+
+def run_stats(args, logger):
+    """Geçmiş istatistiklerini veya açık eğilimini JSON olarak yazdır"""
+    import json
+    import time
+    from modules.scanner import SecurityScanner
+    
+    scanner = SecurityScanner(logger)
+    
+    try:
+        if args.rebuild:
+            drift = scanner.rebuild_statistics()
+            for key, before, after in drift:
+                print(f"Düzeltildi: {key}: {before} -> {after}", file=sys.stderr)
+            if not drift:
+                print("Toplamlar ham geçmişle tutarlı", file=sys.stderr)
+        
+        if args.check:
+            output = scanner.get_check_history(args.check)
+        elif args.trend:
+            end = time.time()
+            output = scanner.get_trend(end - args.days * 86400, end, args.trend, args.by)
+        else:
+            output = scanner.get_statistics()
+        
+        print(json.dumps(output, indent=4, ensure_ascii=False))
+    finally:
+        scanner.close()
+    
+    return EXIT_OK
+
+def run_reports(args, logger):
+    """Rapor dizinini listele; istenirse eşitle veya saklama politikasını uygula"""
+    import json
+    from utils.report import ReportGenerator
+    
+    reporter = ReportGenerator(logger)
+    
+    if args.sync:
+        added, removed = reporter.manifest.sync()
+        print(f"Rapor dizini eşitlendi: {added} eklendi, {removed} silindi", file=sys.stderr)
+    
+    if args.prune:
+        from modules.scanner import SecurityScanner
+        from utils.manifest import DEFAULT_RETENTION
+        
+        scanner = SecurityScanner(logger)
+        try:
+            policy = dict(DEFAULT_RETENTION, **scanner.config.get('report_retention', {}))
+        finally:
+            scanner.close()
+        result = reporter.manifest.apply_retention(policy['keep'], policy['days'], policy['compress_days'])
+        if result is None:
+            print("Saklama politikası zaten uygulanıyor", file=sys.stderr)
+        else:
+            print(f"Saklama: {result['deleted']} silindi, {result['compressed']} sıkıştırıldı", file=sys.stderr)
+    
+    Reports = reporter.list_Reports(
+        args.limit,
+        args.before,
+        format_type=args.format,
+        kind=args.kind,
+        risk=args.risk,
+        host=args.host
+    )
+    
+    if args.json:
+        print(json.dumps(Reports, indent=4, ensure_ascii=False))
+    else:
+        for report in Reports:
+            risk_counts = report['risk_counts']
+            risks = '/'.join(str(risk_counts[level]) for level in ('critical', 'high', 'medium', 'low')) if risk_counts else '-'
+            print(f"{report['id']:>7}  {report['created']}  {report['format']:<4} {report['kind']:<6} "
+                  f"{report['size']:>9}  {risks:<11} {report['filename']}")
+    
+    # Sayfa dolduysa sonraki sayfanın komutu
+    if len(Reports) == args.limit:
+        print(f"Sonraki sayfa: --before {Reports[-1]['id']}", file=sys.stderr)
+    
+    return EXIT_OK
+
+def run_aggregate(args, logger):
+    """Rapor dizinini filo özetinde birleştir ve yaz"""
+    import os
+    from utils.aggregate import FleetAggregator
+    from utils.report import ReportGenerator
+    
+    reporter = ReportGenerator(logger)
+    directory = args.directory or reporter.report_dir
+    if not os.path.isdir(directory):
+        print(f"Hata: dizin bulunamadı: {directory}", file=sys.stderr)
+        return EXIT_USAGE
+    
+    aggregator = FleetAggregator(logger, workers=args.workers).run(directory)
+    result = aggregator.as_scan_result(top=args.top)
+    
+    if args.output == '-':
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(encoding='utf-8')
+        reporter.write(result, args.format, sys.stdout)
+        if args.format == 'json':
+            sys.stdout.write('\n')
+        sys.stdout.flush()
+    else:
+        with open(args.output, 'w', encoding='utf-8', buffering=reporter.WRITE_BUFFER) as f:
+            reporter.write(result, args.format, f)
+    
+    return EXIT_OK
+
+def run_ui(logger):
+    """Etkileşimli menüyü çalıştır"""
+    from modules.scanner import SecurityScanner
+    from modules.ui import SecurityUI
+    
+    scanner = SecurityScanner(logger)
+    ui = SecurityUI(scanner, logger)
+    
+    try:
+        ui.run()
+    finally:
+        scanner.close()
+
+def run_agent(args, logger):
+    """Agent modunu çalıştır"""
+    import asyncio
+    from modules.fleet import FleetAgent, parse_address
+    from modules.scanner import SecurityScanner
+    
+    host, port = parse_address(args.collector)
+    scanner = SecurityScanner(logger)
+    agent = FleetAgent(logger, scanner, host, port, batch_size=args.batch_size)
+    
+    try:
+        asyncio.run(agent.run(interval=args.interval))
+    finally:
+        scanner.close()
+
+def run_collector(args, logger):
+    """Collector modunu çalıştır"""
+    import asyncio
+    from modules.fleet import FleetCollector, default_db_path, parse_address
+    
+    host, port = parse_address(args.listen)
+    collector = FleetCollector(logger, args.db or default_db_path(), host, port)
+    
+    async def serve():
+        await collector.start()
+        try:
+            await collector.serve_forever()
+        finally:
+            await collector.stop()
+    
+    asyncio.run(serve())
+
+def main(argv=None):
+    """
+    Ana program fonksiyonu
+    
+    Returns:
+        int: Çıkış kodu
+    """
+    args = parse_args(argv)
+    exit_code = EXIT_OK
+    
+    try:
+        # Logger başlat
+        from utils.logger import Logger
+        
+        logger = Logger()
+        logger.info("Program başlatıldı")
+        
+        if args.command == 'scan':
+            exit_code = run_scan(args, logger)
+        elif args.command == 'stats':
+            exit_code = run_stats(args, logger)
+        elif args.command == 'reports':
+            exit_code = run_reports(args, logger)
+        elif args.command == 'aggregate':
+            exit_code = run_aggregate(args, logger)
+        elif args.command == 'agent':
+            run_agent(args, logger)
+        elif args.command == 'collector':
+            run_collector(args, logger)
+        else:
+            run_ui(logger)
+        
+        logger.info("Program normal şekilde sonlandırıldı")
+    
+    except KeyboardInterrupt:
+        # Yalnızca etkileşimli menüden çıkış başarılı sayılır
+        if args.command is None:
+            print("\n\n⚠ Program kullanıcı tarafından sonlandırıldı.")
+            return EXIT_OK
+        print("\n\n⚠ Program kullanıcı tarafından sonlandırıldı.", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        print(f"\n❌ Beklenmeyen hata: {e}", file=sys.stderr if args.command in ('scan', 'stats', 'reports', 'aggregate') else sys.stdout)
+        if 'logger' in locals():
+            logger.error("Kritik hata: %s", e)
+        return EXIT_ERROR
+    
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,61 +1,70 @@
-# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['main.py'],
-    pathex=['.'],
-    binaries=[],
-    datas=[
-        ('data', 'data'),
-        ('logs', 'logs'),
-        ('icon.ico', '.'),
-    ],
-    hiddenimports=[
-        'modules',
-        'modules.ui',
-        'modules.scanner',
-        'modules.checks',
-        'utils',
-        'utils.logger',
-        'utils.report',
-        'colorama',
-        'tqdm',
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=['PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'tkinter', 'matplotlib'],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='SecurityScanner',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,  
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='icon.ico',
-    uac_admin=True,
-    uac_uiAccess=False,
-)
-
+# -*- mode: python ; coding: utf-8 -*-
+
+block_cipher = None
+
+a = Analysis(
+    ['main.py'],
+    pathex=['.'],
+    binaries=[],
+    datas=[
+        ('data', 'data'),
+        ('logs', 'logs'),
+        ('icon.ico', '.'),
+    ],
+    hiddenimports=[
+        'modules',
+        'modules.ui',
+        'modules.scanner',
+        'modules.checks',
+        'modules.registry',
+        'modules.history',
+        'modules.archive',
+        'modules.diff',
+        'modules.packs.windows',
+        'modules.packs.network',
+        'utils',
+        'utils.logger',
+        'utils.report',
+        'utils.report_templates',
+        'utils.manifest',
+        'utils.aggregate',
+        'colorama',
+        'tqdm',
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=['PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'tkinter', 'matplotlib'],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='SecurityScanner',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,  
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon='icon.ico',
+    uac_admin=True,
+    uac_uiAccess=False,
+)
+
@@ -1,17 +1,33 @@
-"""
-Modules Package
-Güvenlik tarama modüllerini içerir
-"""
-
-from .scanner import SecurityScanner
-from .checks import SecurityChecks
-from .ui import SecurityUI
-
-__all__ = [
-    'SecurityScanner',
-    'SecurityChecks',
-    'SecurityUI'
-]
-
-__version__ = '1.0.0'
-__author__ = 'Security Scanner Team'
\ No newline at end of file
+"""
+Modules Package
+Güvenlik tarama modüllerini içerir
+
+Alt modüller ilk erişimde yüklenir; 'import modules' arayüz veya
+colorama gibi ağır bağımlılıkları içe aktarmaz.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'SecurityScanner': '.scanner',
+    'SecurityChecks': '.checks',
+    'SecurityUI': '.ui'
+}
+
+__all__ = [
+    'SecurityScanner',
+    'SecurityChecks',
+    'SecurityUI'
+]
+
+__version__ = '1.0.0'
+__author__ = 'Security Scanner Team'
+
+
+def __getattr__(name):
+    """Dışa aktarılan sınıfları ilk erişimde yükle (PEP 562)"""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
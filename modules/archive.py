@@ -0,0 +1,372 @@
+"""
+Bulgu Arşivi Modülü
+Her taramanın bulgularını kontrol başına sütunlarda saklayan sıkıştırılmış arşiv
+
+Dizin yapısı (data/archive/):
+    scans.bin        Tarama zamanları (float64, tarama başına 8 bayt)
+    columns.json     Sütun sırasındaki kontrol kimlikleri
+    c<N>.risk        Kontrol N'nin tarama başına risk kodu (1 bayt, 0 = bulgu yok)
+    c<N>.msg         Kontrol N'nin tarama başına mesaj kimliği (uint32, 0 = bulgu yok)
+    messages.jsonl   Mesaj sözlüğü; her (message, details, solution, fingerprint) bir kez yazılır
+
+Bir tarama önce sütunlara, en son scans.bin'e yazılır; scans.bin'deki kayıt
+sayısı geçerli tarama sayısıdır ve açılışta sütunlar buna göre onarılır.
+"""
+
+import json
+import os
+import re
+import struct
+import threading
+from array import array
+
+from modules.history import RISK_LEVELS
+
+
+# Risk seviyesi -> sütundaki kod (0 = bulgu yok)
+RISK_CODES = {level: code for code, level in enumerate(RISK_LEVELS, 1)}
+
+TS_SIZE = struct.calcsize('d')
+MSG_SIZE = array('I').itemsize
+
+NONZERO = re.compile(rb'[^\x00]')
+
+
+class FindingsArchive:
+    """Sütunlu bulgu arşivi"""
+    
+    def __init__(self, logger, path):
+        """
+        Args:
+            logger: Logger nesnesi
+            path: Arşiv dizini (data/archive)
+        """
+        self.logger = logger
+        self.path = path
+        self._lock = threading.Lock()
+        
+        os.makedirs(path, exist_ok=True)
+        
+        self.columns = self._load_columns()
+        
+        scans_path = self._file('scans.bin')
+        self.scan_count = os.path.getsize(scans_path) // TS_SIZE if os.path.exists(scans_path) else 0
+        
+        # Mesaj sözlüğü ilk ihtiyaçta yüklenir
+        self._messages = None
+        self._message_ids = None
+        
+        self._repair()
+    
+    def append(self, ts, vulnerabilities):
+        """
+        Taramanın bulgularını arşive ekle
+        
+        Args:
+            ts: Tarama zamanı (epoch)
+            vulnerabilities: Bulgular (check_id, risk, message, details, solution)
+        
+        Returns:
+            int: Taramanın arşivdeki sırası
+        """
+        with self._lock:
+            self._ensure_messages()
+            
+            fired = {}
+            for vuln in vulnerabilities:
+                check_id = vuln.get('check_id')
+                if not check_id:
+                    continue
+                risk = RISK_CODES.get(vuln.get('risk', 'medium').lower(), RISK_CODES['medium'])
+                fired[check_id] = (risk, self._intern(vuln))
+            
+            for check_id in fired:
+                if check_id not in self.columns:
+                    self._add_column(check_id)
+            
+            for index, check_id in enumerate(self.columns):
+                risk, message_id = fired.get(check_id, (0, 0))
+                with open(self._column_file(index, 'risk'), 'ab') as f:
+                    f.write(bytes((risk,)))
+                with open(self._column_file(index, 'msg'), 'ab') as f:
+                    f.write(array('I', (message_id,)).tobytes())
+            
+            # Zaman en son yazılır; tarama ancak bu noktada arşive girmiş sayılır
+            with open(self._file('scans.bin'), 'ab') as f:
+                f.write(struct.pack('d', float(ts)))
+            
+            self.scan_count += 1
+            return self.scan_count - 1
+    
+    def first_seen(self, check_id):
+        """
+        Kontrolün ilk bulgu verdiği tarama
+        
+        Returns:
+            dict: ts, risk, message, details, solution veya None
+        """
+        with self._lock:
+            column = self._risk_column(check_id)
+            if column is None:
+                return None
+            
+            remaining = column.lstrip(b'\x00')
+            if not remaining:
+                return None
+            return self._occurrence(check_id, len(column) - len(remaining), column)
+    
+    def last_seen(self, check_id):
+        """
+        Kontrolün son bulgu verdiği tarama
+        
+        Returns:
+            dict: ts, risk, message, details, solution veya None
+        """
+        with self._lock:
+            column = self._risk_column(check_id)
+            if column is None:
+                return None
+            
+            remaining = column.rstrip(b'\x00')
+            if not remaining:
+                return None
+            return self._occurrence(check_id, len(remaining) - 1, column)
+    
+    def occurrences(self, check_id):
+        """Kontrolün bulgu verdiği tarama sayısı"""
+        with self._lock:
+            column = self._risk_column(check_id)
+            if column is None:
+                return 0
+            return len(column) - column.count(0)
+    
+    def timeline(self, check_id, start=None, end=None):
+        """
+        Kontrolün bulgu verdiği taramalar (eskiden yeniye)
+        
+        Args:
+            check_id: Kontrol kimliği
+            start: Başlangıç zamanı (epoch, dahil)
+            end: Bitiş zamanı (epoch, hariç)
+        
+        Returns:
+            list: [(ts, risk)]
+        """
+        with self._lock:
+            column = self._risk_column(check_id)
+            if column is None:
+                return []
+            
+            times = self._timestamps()
+            timeline = []
+            
+            for match in NONZERO.finditer(column):
+                ts = times[match.start()]
+                if start is not None and ts < start:
+                    continue
+                if end is not None and ts >= end:
+                    break
+                timeline.append((ts, RISK_LEVELS[column[match.start()] - 1]))
+            
+            return timeline
+    
+    def scan_findings(self, position):
+        """
+        Tek taramanın bulguları (sütun başına bir okuma)
+        
+        Args:
+            position: Taramanın arşivdeki sırası (negatif değerler sondan sayılır)
+        
+        Returns:
+            dict: scan_info ('ts') ve vulnerabilities; tarama yoksa None
+        """
+        with self._lock:
+            if position < 0:
+                position += self.scan_count
+            if not 0 <= position < self.scan_count:
+                return None
+            
+            self._ensure_messages()
+            
+            with open(self._file('scans.bin'), 'rb') as f:
+                f.seek(position * TS_SIZE)
+                ts, = struct.unpack('d', f.read(TS_SIZE))
+            
+            vulnerabilities = []
+            for check_id, index in self.columns.items():
+                with open(self._column_file(index, 'risk'), 'rb') as f:
+                    f.seek(position)
+                    risk_code = f.read(1)[0]
+                if not risk_code:
+                    continue
+                
+                with open(self._column_file(index, 'msg'), 'rb') as f:
+                    f.seek(position * MSG_SIZE)
+                    message_id = array('I', f.read(MSG_SIZE))[0]
+                
+                vulnerabilities.append(self._finding(check_id, risk_code, message_id))
+            
+            return {'scan_info': {'ts': ts}, 'vulnerabilities': vulnerabilities}
+    
+    def summary(self):
+        """
+        Tüm kontroller için ilk / son görülme ve bulgu sayısı
+        
+        Returns:
+            dict: {check_id: {'first_seen', 'last_seen', 'occurrences'}}
+        """
+        result = {}
+        for check_id in list(self.columns):
+            first = self.first_seen(check_id)
+            if first is None:
+                continue
+            result[check_id] = {
+                'first_seen': first['ts'],
+                'last_seen': self.last_seen(check_id)['ts'],
+                'occurrences': self.occurrences(check_id)
+            }
+        return result
+    
+    def clear(self):
+        """Arşivi sil"""
+        with self._lock:
+            for name in os.listdir(self.path):
+                os.remove(self._file(name))
+            
+            self.columns = {}
+            self.scan_count = 0
+            self._messages = None
+            self._message_ids = None
+    
+    def _load_columns(self):
+        """Sütun sırasını yükle"""
+        try:
+            if os.path.exists(self._file('columns.json')):
+                with open(self._file('columns.json'), 'r', encoding='utf-8') as f:
+                    return {check_id: index for index, check_id in enumerate(json.load(f))}
+        except Exception as e:
+            self.logger.error("Arşiv sütunları okunamadı: %s", e)
+        return {}
+    
+    def _add_column(self, check_id):
+        """Yeni kontrol sütunu ekle; geçmiş taramalar için sıfırla doldur"""
+        index = len(self.columns)
+        
+        with open(self._column_file(index, 'risk'), 'wb') as f:
+            f.write(bytes(self.scan_count))
+        with open(self._column_file(index, 'msg'), 'wb') as f:
+            f.write(bytes(self.scan_count * MSG_SIZE))
+        
+        self.columns[check_id] = index
+        
+        tmp_path = self._file('columns.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(list(self.columns), f)
+        os.replace(tmp_path, self._file('columns.json'))
+    
+    def _repair(self):
+        """Yarıda kalan yazımdan sonra sütunları tarama sayısına eşitle"""
+        for index in self.columns.values():
+            for kind, size in (('risk', 1), ('msg', MSG_SIZE)):
+                path = self._column_file(index, kind)
+                expected = self.scan_count * size
+                actual = os.path.getsize(path) if os.path.exists(path) else 0
+                
+                if actual == expected:
+                    continue
+                
+                with open(path, 'ab') as f:
+                    if actual > expected:
+                        f.truncate(expected)
+                    else:
+                        f.write(bytes(expected - actual))
+                self.logger.warning("Arşiv sütunu onarıldı: %s", os.path.basename(path))
+    
+    def _ensure_messages(self):
+        """Mesaj sözlüğünü yükle"""
+        if self._messages is not None:
+            return
+        
+        self._messages = []
+        self._message_ids = {}
+        
+        path = self._file('messages.jsonl')
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # Parmak izinden önceki kayıtlar üç alanlıdır
+                    key = tuple(json.loads(line)) + (None,)
+                    key = key[:4]
+                    self._messages.append(key)
+                    self._message_ids[key] = len(self._messages)
+    
+    def _intern(self, vuln):
+        """Bulgu metnini sözlüğe ekle ve kimliğini döndür (1'den başlar)"""
+        key = (
+            vuln.get('message', ''),
+            vuln.get('details', ''),
+            vuln.get('solution', ''),
+            vuln.get('fingerprint')
+        )
+        
+        message_id = self._message_ids.get(key)
+        if message_id is None:
+            with open(self._file('messages.jsonl'), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(key, ensure_ascii=False) + '\n')
+            self._messages.append(key)
+            message_id = self._message_ids[key] = len(self._messages)
+        
+        return message_id
+    
+    def _risk_column(self, check_id):
+        """Kontrolün risk sütunu (bytes) veya None"""
+        index = self.columns.get(check_id)
+        if index is None:
+            return None
+        
+        with open(self._column_file(index, 'risk'), 'rb') as f:
+            return f.read(self.scan_count)
+    
+    def _timestamps(self):
+        """Tüm tarama zamanları"""
+        times = array('d')
+        with open(self._file('scans.bin'), 'rb') as f:
+            times.frombytes(f.read(self.scan_count * TS_SIZE))
+        return times
+    
+    def _occurrence(self, check_id, position, column):
+        """Sütundaki tek bulgunun ayrıntıları"""
+        with open(self._file('scans.bin'), 'rb') as f:
+            f.seek(position * TS_SIZE)
+            ts, = struct.unpack('d', f.read(TS_SIZE))
+        
+        with open(self._column_file(self.columns[check_id], 'msg'), 'rb') as f:
+            f.seek(position * MSG_SIZE)
+            message_id = array('I', f.read(MSG_SIZE))[0]
+        
+        self._ensure_messages()
+        
+        finding = self._finding(check_id, column[position], message_id)
+        finding['ts'] = ts
+        return finding
+    
+    def _finding(self, check_id, risk_code, message_id):
+        """Sütun değerlerinden bulgu sözlüğü"""
+        message, details, solution, fingerprint = self._messages[message_id - 1]
+        
+        return {
+            'check_id': check_id,
+            'risk': RISK_LEVELS[risk_code - 1],
+            'message': message,
+            'details': details,
+            'solution': solution,
+            'fingerprint': fingerprint
+        }
+    
+    def _column_file(self, index, kind):
+        """Sütun dosyasının yolu"""
+        return self._file(f'c{index}.{kind}')
+    
+    def _file(self, name):
+        """Arşiv dizinindeki dosyanın yolu"""
+        return os.path.join(self.path, name)
\ No newline at end of file
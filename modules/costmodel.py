@@ -0,0 +1,103 @@
+"""
+Kontrol Maliyet Modeli Modülü
+Geçmiş taramalardaki kontrol sürelerinden üstel ağırlıklı ortalama ile süre tahmini
+"""
+
+import heapq
+import json
+import os
+
+
+class CostModel:
+    """Kontrol başına beklenen süre (EWMA) modeli"""
+
+    def __init__(self, logger, path, alpha=0.3):
+        """
+        Args:
+            logger: Logger nesnesi
+            path: Modelin saklandığı JSON dosyası (data/check_costs.json)
+            alpha: Yeni ölçümün ağırlığı (0-1)
+        """
+        self.logger = logger
+        self.path = path
+        self.alpha = alpha
+        self.costs = {}
+        self.load()
+
+    def load(self):
+        """Modeli dosyadan yükle"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.costs = json.load(f)
+        except Exception as e:
+            self.logger.error("Maliyet modeli yüklenemedi: %s", e)
+            self.costs = {}
+
+    def save(self):
+        """Modeli dosyaya kaydet (yarım yazılmış dosya bırakmadan)"""
+        try:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.costs, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error("Maliyet modeli kaydedilemedi: %s", e)
+
+    def expected(self, spec):
+        """
+        Kontrolün beklenen süresi
+
+        Ölçüm yoksa kontrol tanımındaki tahmin kullanılır.
+
+        Returns:
+            float: Saniye
+        """
+        entry = self.costs.get(spec.id)
+        if entry is None:
+            return float(spec.cost)
+        return entry['ewma']
+
+    def update(self, durations):
+        """
+        Ölçülen sürelerle modeli güncelle
+
+        Args:
+            durations: {check_id: saniye}
+        """
+        for check_id, duration in durations.items():
+            entry = self.costs.get(check_id)
+            if entry is None:
+                self.costs[check_id] = {'ewma': duration, 'samples': 1, 'last': duration}
+                continue
+
+            entry['ewma'] = self.alpha * duration + (1 - self.alpha) * entry['ewma']
+            entry['samples'] = entry.get('samples', 0) + 1
+            entry['last'] = duration
+
+    def dispatch_order(self, specs):
+        """
+        Kontrolleri en uzun beklenen süre önce olacak şekilde sırala (LPT)
+
+        Returns:
+            list: Sıralanmış kontrol tanımları
+        """
+        return sorted(specs, key=lambda spec: (-self.expected(spec), spec.order))
+
+    def predict_makespan(self, specs, workers):
+        """
+        LPT dağıtımıyla toplam tarama süresini tahmin et
+
+        Args:
+            specs: Kontrol tanımları
+            workers: Eşzamanlı çalışan kontrol sayısı
+
+        Returns:
+            float: Saniye
+        """
+        loads = [0.0] * max(1, min(workers, len(specs) or 1))
+
+        for spec in self.dispatch_order(specs):
+            heapq.heapreplace(loads, loads[0] + self.expected(spec))
+
+        return max(loads)
@@ -0,0 +1,203 @@
+"""
+Veri Kaynağı Planlayıcı Modülü
+Kontrollerin ihtiyaç duyduğu kayıt defteri değerlerini ve servis durumlarını
+tek seferde toplu olarak okuma
+"""
+
+import asyncio
+import json
+
+
+REGISTRY_HIVES = {
+    'HKLM': 'HKEY_LOCAL_MACHINE',
+    'HKCU': 'HKEY_CURRENT_USER',
+    'HKCR': 'HKEY_CLASSES_ROOT',
+    'HKU': 'HKEY_USERS'
+}
+
+
+def requires(registry=(), services=()):
+    """
+    Kontrolün ihtiyaç duyduğu veri kaynaklarını bildiren dekoratör
+
+    Args:
+        registry: (anahtar_yolu, değer_adı) çiftleri
+        services: Servis adları
+    """
+    def decorator(func):
+        func.data_sources = {
+            'registry': tuple(registry),
+            'services': tuple(services)
+        }
+        return func
+    return decorator
+
+
+class DataSnapshot:
+    """Bir tarama için önceden okunmuş veri kaynakları"""
+
+    def __init__(self):
+        self.registry = {}
+        self.services = {}
+        self.sources = set()
+
+    def has(self, source):
+        """Kaynak toplu olarak başarıyla okundu mu"""
+        return source in self.sources
+
+    def registry_value(self, path, name):
+        """Kayıt defteri değerini döndür (yoksa None)"""
+        return self.registry.get((path.lower(), name.lower()))
+
+    def service_status(self, name):
+        """Servis durumunu döndür ('Running', 'Stopped', ... veya yoksa None)"""
+        return self.services.get(name.lower())
+
+
+class DataPlanner:
+    """Kontrollerin veri ihtiyaçlarını toplayıp kaynak başına tek çağrıda okuyan planlayıcı"""
+
+    def __init__(self, logger, run_command):
+        """
+        Args:
+            logger: Logger nesnesi
+            run_command: Asenkron komut çalıştırıcı (SecurityChecks.run_command_async)
+        """
+        self.logger = logger
+        self.run_command = run_command
+
+    def plan(self, specs):
+        """
+        Kontrollerin bildirdiği ihtiyaçları birleştir
+
+        Args:
+            specs: Kontrol tanımları (CheckSpec)
+
+        Returns:
+            dict: {'registry': [(yol, ad), ...], 'services': [ad, ...]}
+        """
+        registry = {}
+        services = {}
+
+        for spec in specs:
+            sources = spec.sources
+            if not sources:
+                continue
+
+            for path, name in sources['registry']:
+                registry.setdefault((path.lower(), name.lower()), (path, name))
+            for service in sources['services']:
+                services.setdefault(service.lower(), service)
+
+        return {
+            'registry': list(registry.values()),
+            'services': list(services.values())
+        }
+
+    async def fetch(self, plan, timeout=15):
+        """
+        Planlanan tüm verileri kaynak türü başına tek komutla oku
+
+        Args:
+            plan: plan() çıktısı
+            timeout: Her toplu komut için zaman aşımı
+
+        Returns:
+            DataSnapshot: Okunan veriler
+        """
+        snapshot = DataSnapshot()
+        jobs = []
+
+        if plan['registry']:
+            jobs.append(self._fetch_registry(plan['registry'], snapshot, timeout))
+        if plan['services']:
+            jobs.append(self._fetch_services(plan['services'], snapshot, timeout))
+
+        if jobs:
+            await asyncio.gather(*jobs)
+
+        return snapshot
+
+    async def _fetch_registry(self, values, snapshot, timeout):
+        """Tüm kayıt defteri değerlerini tek PowerShell betiğiyle oku"""
+        data = await self._run_json(self.build_registry_script(values), timeout)
+        if data is None:
+            return
+
+        for idx, (path, name) in enumerate(values):
+            snapshot.registry[(path.lower(), name.lower())] = data.get(str(idx))
+
+        snapshot.sources.add('registry')
+        self.logger.info("%s kayıt defteri değeri toplu olarak okundu", len(values))
+
+    async def _fetch_services(self, names, snapshot, timeout):
+        """Tüm servis durumlarını tek PowerShell betiğiyle oku"""
+        data = await self._run_json(self.build_service_script(names), timeout)
+        if data is None:
+            return
+
+        for idx, name in enumerate(names):
+            snapshot.services[name.lower()] = data.get(str(idx))
+
+        snapshot.sources.add('services')
+        self.logger.info("%s servis durumu toplu olarak okundu", len(names))
+
+    async def _run_json(self, script, timeout):
+        """PowerShell betiğini çalıştır ve JSON çıktısını çözümle"""
+        stdout, stderr, returncode = await self.run_command(
+            ['powershell', '-Command', script],
+            timeout=timeout
+        )
+
+        try:
+            data = json.loads(stdout.strip())
+        except ValueError:
+            self.logger.warning("Toplu veri okuma başarısız: %s", stderr or 'geçersiz çıktı')
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _quote(value):
+        """PowerShell tek tırnaklı dize"""
+        return "'" + value.replace("'", "''") + "'"
+
+    @classmethod
+    def build_registry_script(cls, values):
+        """
+        Kayıt defteri değerlerini okuyup {indeks: değer} JSON'u yazan betik
+
+        Args:
+            values: (anahtar_yolu, değer_adı) çiftleri
+        """
+        paths = []
+        for path, _ in values:
+            hive, _, rest = path.partition('\\')
+            paths.append('Registry::' + REGISTRY_HIVES.get(hive.upper(), hive) + '\\' + rest)
+
+        return (
+            f"$paths = @({', '.join(cls._quote(p) for p in paths)}); "
+            f"$names = @({', '.join(cls._quote(name) for _, name in values)}); "
+            "$r = @{}; "
+            "for ($i = 0; $i -lt $paths.Count; $i++) { "
+            "$p = Get-ItemProperty -LiteralPath $paths[$i] -Name $names[$i] -ErrorAction SilentlyContinue; "
+            "$r[[string]$i] = if ($p) { $p.($names[$i]) } else { $null } }; "
+            "ConvertTo-Json -InputObject $r -Compress"
+        )
+
+    @classmethod
+    def build_service_script(cls, names):
+        """
+        Servis durumlarını okuyup {indeks: durum} JSON'u yazan betik
+
+        Args:
+            names: Servis adları
+        """
+        return (
+            f"$names = @({', '.join(cls._quote(n) for n in names)}); "
+            "$r = @{}; "
+            "for ($i = 0; $i -lt $names.Count; $i++) { "
+            "$s = Get-Service -Name $names[$i] -ErrorAction SilentlyContinue; "
+            "$r[[string]$i] = if ($s) { $s.Status.ToString() } else { $null } }; "
+            "ConvertTo-Json -InputObject $r -Compress"
+        )
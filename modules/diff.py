@@ -0,0 +1,133 @@
+"""
+Tarama Karşılaştırma Modülü
+Bulgu parmak izleri ve iki tarama arasındaki farkların doğrusal sürede bulunması
+"""
+
+import hashlib
+import re
+
+
+# Bulgu fark sınıfları
+NEW = 'new'
+RESOLVED = 'resolved'
+PERSISTING = 'persisting'
+CHANGED = 'changed'
+
+RISK_RANK = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_evidence(evidence):
+    """
+    Ayırt edici kanıtı sıradan ve biçimden bağımsız metne çevir
+    
+    Args:
+        evidence: None, metin, sayı veya bunların listesi (ör. portlar, paylaşım adları);
+                  listedeki çiftler (ör. (protokol, port)) kendi içinde sıralı kalır
+    
+    Returns:
+        str: Normalleştirilmiş kanıt
+    """
+    if evidence is None:
+        return ''
+    if isinstance(evidence, (list, tuple, set, frozenset)):
+        return ','.join(sorted({_normalize_item(item) for item in evidence}))
+    return _WHITESPACE.sub(' ', str(evidence)).strip().lower()
+
+
+def _normalize_item(item):
+    """Liste öğesini normalleştir (JSON'dan dönen çiftler liste olarak gelir)"""
+    if isinstance(item, (list, tuple)):
+        return '/'.join(normalize_evidence(part) for part in item)
+    return normalize_evidence(item)
+
+
+def fingerprint(check_id, evidence=None):
+    """
+    Bulgunun kararlı parmak izi
+    
+    Mesaj metni ve risk seviyesi parmak izine girmez; aynı kontrol aynı kanıtla
+    her taramada aynı parmak izini üretir.
+    
+    Args:
+        check_id: Kontrol kimliği
+        evidence: Ayırt edici kanıt (ör. açık port listesi)
+    
+    Returns:
+        str: 16 karakterlik onaltılık özet
+    """
+    key = f"{check_id}\x00{normalize_evidence(evidence)}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def finding_key(finding):
+    """Bulgunun parmak izi (eski kayıtlarda kontrol kimliğinden türetilir)"""
+    return finding.get('fingerprint') or fingerprint(finding.get('check_id') or finding.get('message', ''))
+
+
+def diff_findings(old, new):
+    """
+    İki taramanın bulgularını sınıflandır
+    
+    Parmak izi sözlüğü üzerinden tek geçişte çalışır (O(n + m)).
+    
+    Args:
+        old: Önceki taramanın bulguları
+        new: Sonraki taramanın bulguları
+    
+    Returns:
+        dict: new, resolved, persisting, changed listeleri; changed öğeleri
+              {'old': bulgu, 'new': bulgu} biçimindedir
+    """
+    old_index = {finding_key(finding): finding for finding in old}
+    
+    result = {NEW: [], RESOLVED: [], PERSISTING: [], CHANGED: []}
+    
+    for finding in new:
+        previous = old_index.pop(finding_key(finding), None)
+        
+        if previous is None:
+            result[NEW].append(finding)
+        elif _risk(previous) != _risk(finding):
+            result[CHANGED].append({'old': previous, 'new': finding})
+        else:
+            result[PERSISTING].append(finding)
+    
+    # Sözlükte kalanlar yeni taramada yok
+    result[RESOLVED] = list(old_index.values())
+    
+    return result
+
+
+def diff_scans(old_result, new_result):
+    """
+    İki tarama sonucunu karşılaştır
+    
+    Args:
+        old_result: Önceki tarama sonucu (vulnerabilities, scan_info)
+        new_result: Sonraki tarama sonucu
+    
+    Returns:
+        dict: diff_findings sonucu, ayrıca 'summary' (sınıf başına sayı) ve
+              iki taramanın scan_info'su
+    """
+    result = diff_findings(
+        (old_result or {}).get('vulnerabilities', []),
+        (new_result or {}).get('vulnerabilities', [])
+    )
+    
+    result['summary'] = {kind: len(result[kind]) for kind in (NEW, RESOLVED, PERSISTING, CHANGED)}
+    result['summary']['escalated'] = sum(
+        1 for change in result[CHANGED]
+        if RISK_RANK.get(_risk(change['new']), 2) > RISK_RANK.get(_risk(change['old']), 2)
+    )
+    result['old_scan'] = (old_result or {}).get('scan_info', {})
+    result['new_scan'] = (new_result or {}).get('scan_info', {})
+    
+    return result
+
+
+def _risk(finding):
+    """Bulgunun küçük harfli risk seviyesi"""
+    return finding.get('risk', 'medium').lower()
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+Komut Çalıştırma Modülü
+Eşzamanlı süreç sınırı, süreç ağacı sonlandırma ve çıktı boyutu sınırı ile alt süreç çalıştırma
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from collections import namedtuple
+
+
+class CommandResult(namedtuple('CommandResult', ['stdout', 'stderr', 'returncode'])):
+    """
+    Komut sonucu
+
+    (stdout, stderr, returncode) olarak açılabilir; çıktı sınırı aşıldıysa
+    truncated True olur.
+    """
+
+    truncated = False
+
+
+class CommandRunner:
+    """Alt süreç çalıştırıcı"""
+
+    READ_CHUNK = 64 * 1024
+
+    def __init__(self, logger, max_processes=4, max_output_bytes=1024 * 1024):
+        """
+        Args:
+            logger: Logger nesnesi
+            max_processes: Aynı anda çalışabilecek en fazla alt süreç
+            max_output_bytes: stdout / stderr için saklanacak en fazla bayt (0 = sınırsız)
+        """
+        self.logger = logger
+        self.max_processes = max(1, int(max_processes))
+        self.max_output_bytes = int(max_output_bytes or 0)
+        self.windows = sys.platform == 'win32'
+
+        # Semafor ilk kullanıldığı event loop'a bağlanır; her asyncio.run için yenilenir
+        self._slots = None
+        self._slots_loop = None
+
+        self.spawned = 0
+        self.killed = 0
+        self.truncated = 0
+
+    def get_stats(self):
+        """
+        Çalıştırıcı istatistiklerini döndür
+
+        Returns:
+            dict: spawned, killed (zaman aşımı / iptal), truncated
+        """
+        return {
+            'spawned': self.spawned,
+            'killed': self.killed,
+            'truncated': self.truncated
+        }
+
+    def reset_stats(self):
+        """İstatistikleri sıfırla"""
+        self.spawned = 0
+        self.killed = 0
+        self.truncated = 0
+
+    async def run(self, command, timeout=5):
+        """
+        Komutu çalıştır ve çıktısını topla
+
+        Çıktı max_output_bytes kadar saklanır; fazlası okunup atılır (boru
+        dolup süreç takılmasın diye).
+
+        Args:
+            command: Çalıştırılacak komut (liste)
+            timeout: Zaman aşımı süresi
+
+        Returns:
+            CommandResult: (stdout, stderr, returncode)
+        """
+        async with self._spawn_slots():
+            process = await self._spawn(command)
+            if isinstance(process, CommandResult):
+                return process
+
+            try:
+                (stdout, out_truncated), (stderr, err_truncated), _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_capped(process.stdout),
+                        self._read_capped(process.stderr),
+                        process.wait()
+                    ),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                await self._kill_tree(process)
+                self.logger.warning("Komut zaman aşımına uğradı: %s", ' '.join(command))
+                return CommandResult("", "Timeout", -1)
+            except asyncio.CancelledError:
+                await asyncio.shield(self._kill_tree(process))
+                raise
+
+        result = CommandResult(
+            stdout.decode('utf-8', errors='ignore'),
+            stderr.decode('utf-8', errors='ignore'),
+            process.returncode
+        )
+
+        if out_truncated or err_truncated:
+            result.truncated = True
+            self.truncated += 1
+            self.logger.warning(
+                "Komut çıktısı %s bayt ile sınırlandı: %s", self.max_output_bytes, ' '.join(command)
+            )
+
+        return result
+
+    async def stream(self, command, on_line, timeout=5):
+        """
+        Komutu çalıştır ve stdout'u satır satır işleyiciye aktar
+
+        Çıktı bellekte biriktirilmez; ayrıştırıcı her satırı geldiği anda işler.
+        READ_CHUNK baytından uzun satırlar kesilerek iletilir.
+
+        Args:
+            command: Çalıştırılacak komut (liste)
+            on_line: Her stdout satırı için çağrılacak fonksiyon (str)
+            timeout: Zaman aşımı süresi
+
+        Returns:
+            CommandResult: stdout her zaman boş; (stdout, stderr, returncode)
+        """
+        async with self._spawn_slots():
+            process = await self._spawn(command)
+            if isinstance(process, CommandResult):
+                return process
+
+            async def pump():
+                pending = b''
+                overlong = False
+                while True:
+                    chunk = await process.stdout.read(self.READ_CHUNK)
+                    if not chunk:
+                        break
+
+                    lines = (pending + chunk).split(b'\n')
+                    pending = lines.pop()
+                    for line in lines:
+                        if overlong:
+                            # Kesilen satırın geri kalanı; satır zaten iletildi
+                            overlong = False
+                            continue
+                        if len(line) > self.READ_CHUNK:
+                            self.truncated += 1
+                        on_line(line[:self.READ_CHUNK].decode('utf-8', errors='ignore') + '\n')
+
+                    # Satır sonu gelmeden sınır aşıldıysa kesik satırı ilet, kalanını atla
+                    if len(pending) > self.READ_CHUNK:
+                        if not overlong:
+                            on_line(pending[:self.READ_CHUNK].decode('utf-8', errors='ignore') + '\n')
+                            self.truncated += 1
+                            overlong = True
+                        pending = b''
+
+                if pending and not overlong:
+                    on_line(pending.decode('utf-8', errors='ignore'))
+
+            try:
+                _, (stderr, _), _ = await asyncio.wait_for(
+                    asyncio.gather(pump(), self._read_capped(process.stderr), process.wait()),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                await self._kill_tree(process)
+                self.logger.warning("Komut zaman aşımına uğradı: %s", ' '.join(command))
+                return CommandResult("", "Timeout", -1)
+            except asyncio.CancelledError:
+                await asyncio.shield(self._kill_tree(process))
+                raise
+            except Exception:
+                await self._kill_tree(process)
+                raise
+
+        return CommandResult("", stderr.decode('utf-8', errors='ignore'), process.returncode)
+
+    def _spawn_slots(self):
+        """Çalışan event loop için eşzamanlı süreç semaforu"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_processes)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _spawn(self, command):
+        """
+        Alt süreci kendi süreç grubunda başlat
+
+        Returns:
+            asyncio.subprocess.Process | CommandResult: Süreç veya başlatma hatası
+        """
+        kwargs = {}
+        if self.windows:
+            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            # Torunlar da aynı gruptan sonlandırılabilsin
+            kwargs['start_new_session'] = True
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=self.READ_CHUNK,
+                **kwargs
+            )
+        except Exception as e:
+            self.logger.error("Komut çalıştırma hatası: %s", e)
+            return CommandResult("", str(e), -1)
+
+        self.spawned += 1
+        return process
+
+    async def _read_capped(self, stream):
+        """
+        Akışı sonuna kadar oku, en fazla max_output_bytes sakla
+
+        Returns:
+            tuple: (bytes, kesildi_mi)
+        """
+        chunks = []
+        size = 0
+        truncated = False
+        limit = self.max_output_bytes
+
+        while True:
+            chunk = await stream.read(self.READ_CHUNK)
+            if not chunk:
+                break
+
+            if not limit:
+                chunks.append(chunk)
+                continue
+
+            if size < limit:
+                keep = chunk[:limit - size]
+                chunks.append(keep)
+                size += len(keep)
+                if len(keep) < len(chunk):
+                    truncated = True
+            else:
+                truncated = True
+
+        return b''.join(chunks), truncated
+
+    async def _kill_tree(self, process):
+        """Süreci ve başlattığı tüm alt süreçleri sonlandır"""
+        self.killed += 1
+
+        if self.windows:
+            # taskkill /T: PowerShell'in başlattığı torunlar dahil tüm ağaç
+            try:
+                killer = await asyncio.create_subprocess_exec(
+                    'taskkill', '/F', '/T', '/PID', str(process.pid),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+                await killer.wait()
+            except Exception as e:
+                self.logger.error("Süreç ağacı sonlandırılamadı: %s", e)
+        else:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+        await process.wait()
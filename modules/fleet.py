@@ -0,0 +1,432 @@
+"""
+Filo (Agent/Collector) Modülü
+Tarama sonuçlarını çok sayıda uç noktadan merkezi bir toplayıcıya gönderme
+"""
+
+import asyncio
+import json
+import os
+import platform
+import sqlite3
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Çerçeve: 4 baytlık uzunluk (big-endian) + zlib ile sıkıştırılmış JSON
+FRAME_HEADER = struct.Struct('!I')
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+# Açılmış çerçeve sınırı (sıkıştırma bombasına karşı)
+MAX_DECOMPRESSED = 64 * 1024 * 1024
+
+RISK_ORDER = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+
+
+def encode_frame(obj):
+    """Nesneyi sıkıştırılmış çerçeveye çevir"""
+    payload = zlib.compress(json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader):
+    """
+    Akıştan bir çerçeve oku
+
+    Returns:
+        object: Çözülmüş JSON nesnesi (bağlantı kapandıysa None)
+
+    Raises:
+        ConnectionError: Bağlantı çerçevenin ortasında kapandı
+        ValueError: Çerçeve sınırları aşıyor
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Çerçeve çok büyük: {length} bayt")
+
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError(f"Çerçeve yarım kaldı: {len(e.partial)}/{length} bayt") from None
+    decompressor = zlib.decompressobj()
+    data = decompressor.decompress(payload, MAX_DECOMPRESSED)
+    if decompressor.unconsumed_tail:
+        raise ValueError(f"Açılmış çerçeve {MAX_DECOMPRESSED} baytı aşıyor")
+    return json.loads(data.decode('utf-8'))
+
+
+def _is_number(value):
+    """JSON sayısı mı (bool hariç)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_result(result):
+    """
+    Agent'tan gelen kompakt sonucu doğrula
+
+    Raises:
+        ValueError: Sonuç compact_result biçiminde değilse
+    """
+    if not isinstance(result, dict):
+        raise ValueError("Sonuç bir nesne değil")
+    if not _is_number(result.get('ts')) or not _is_number(result.get('duration')):
+        raise ValueError("Sonuçta sayısal 'ts' / 'duration' yok")
+
+    findings = result.get('findings')
+    if not isinstance(findings, list):
+        raise ValueError("Sonuçta 'findings' listesi yok")
+    for finding in findings:
+        if not isinstance(finding, list) or not finding or not isinstance(finding[0], str):
+            raise ValueError("Geçersiz bulgu: [risk, mesaj] bekleniyor")
+
+
+def compact_result(scan_result, host=None):
+    """
+    Tarama sonucunu gönderim için küçült
+
+    Args:
+        scan_result: perform_scan çıktısı
+        host: Uç nokta adı (varsayılan: platform.node())
+
+    Returns:
+        dict: Kompakt sonuç
+    """
+    scan_info = scan_result.get('scan_info', {})
+
+    return {
+        'host': host or platform.node(),
+        'ts': time.time(),
+        'system': scan_info.get('system', ''),
+        'duration': round(scan_info.get('duration', 0), 3),
+        'checks': scan_info.get('total_checks', 0),
+        'findings': [
+            [vuln.get('risk', 'medium'), vuln.get('message', '')]
+            for vuln in scan_result.get('vulnerabilities', [])
+        ]
+    }
+
+
+class FleetStore:
+    """Toplayıcı sonuçları için indeksli SQLite deposu"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY,
+                host TEXT NOT NULL,
+                ts REAL NOT NULL,
+                received REAL NOT NULL,
+                system TEXT,
+                duration REAL,
+                vulnerability_count INTEGER,
+                max_risk INTEGER,
+                findings TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_host_ts ON results (host, ts);
+            CREATE INDEX IF NOT EXISTS idx_results_ts ON results (ts);
+        ''')
+        self.conn.commit()
+
+    def insert_many(self, results):
+        """Sonuçları tek işlemde yaz"""
+        received = time.time()
+        rows = [
+            (
+                str(r.get('host', '')),
+                float(r.get('ts', received)),
+                received,
+                r.get('system', ''),
+                r.get('duration', 0),
+                len(r.get('findings', [])),
+                max((RISK_ORDER.get(f[0], 0) for f in r.get('findings', [])), default=0),
+                json.dumps(r.get('findings', []), separators=(',', ':'), ensure_ascii=False)
+            )
+            for r in results
+        ]
+
+        with self.conn:
+            self.conn.executemany(
+                'INSERT INTO results (host, ts, received, system, duration, '
+                'vulnerability_count, max_risk, findings) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+        return len(rows)
+
+    def count(self):
+        """Toplam sonuç sayısı"""
+        return self.conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def latest(self, host=None, limit=50):
+        """
+        En yeni sonuçlar
+
+        Args:
+            host: Yalnızca bu uç noktanın sonuçları
+            limit: En fazla kayıt
+        """
+        if host:
+            cursor = self.conn.execute(
+                'SELECT host, ts, vulnerability_count, max_risk FROM results '
+                'WHERE host = ? ORDER BY ts DESC LIMIT ?', (host, limit)
+            )
+        else:
+            cursor = self.conn.execute(
+                'SELECT host, ts, vulnerability_count, max_risk FROM results '
+                'ORDER BY ts DESC LIMIT ?', (limit,)
+            )
+
+        return [
+            {'host': h, 'ts': ts, 'vulnerability_count': count, 'max_risk': risk}
+            for h, ts, count, risk in cursor
+        ]
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        self.conn.close()
+
+
+class FleetCollector:
+    """Çok sayıda agent'tan eşzamanlı sonuç toplayan uzun ömürlü sunucu"""
+
+    def __init__(self, logger, db_path, host='0.0.0.0', port=8765,
+                 queue_size=10000, write_batch=500):
+        """
+        Args:
+            logger: Logger nesnesi
+            db_path: SQLite veritabanı yolu
+            host: Dinlenecek adres
+            port: Dinlenecek port
+            queue_size: Yazılmayı bekleyen en fazla sonuç (dolunca agent'lar bekletilir)
+            write_batch: Tek işlemde yazılacak en fazla sonuç
+        """
+        self.logger = logger
+        self.db_path = db_path
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.write_batch = write_batch
+
+        self.received = 0
+        self.written = 0
+
+        self._store = None
+        self._queue = None
+        self._server = None
+        self._writer_task = None
+        # SQLite bağlantısı tek bir thread'den kullanılır
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fleet-db')
+
+    async def start(self):
+        """Sunucuyu ve yazıcı görevini başlat"""
+        loop = asyncio.get_running_loop()
+        self._store = await loop.run_in_executor(self._db_executor, FleetStore, self.db_path)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._writer_task = asyncio.ensure_future(self._write_loop())
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+        # Port 0 verildiyse atanan portu kaydet
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info("Collector dinliyor: %s:%s", self.host, self.port)
+
+    async def serve_forever(self):
+        """Durdurulana kadar çalış"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Yeni bağlantıları kes, kuyruğu diske boşalt ve kapat"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        if self._queue is not None:
+            await self._queue.join()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+
+        if self._store is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._db_executor, self._store.close)
+        self._db_executor.shutdown(wait=True)
+        self.logger.info("Collector durduruldu: %s sonuç yazıldı", self.written)
+
+    async def _handle(self, reader, writer):
+        """Tek bir agent bağlantısı: çerçeveleri oku, kuyruğa koy, onayla"""
+        peer = writer.get_extra_info('peername')
+
+        try:
+            while True:
+                batch = await read_frame(reader)
+                if batch is None:
+                    break
+
+                # Bozuk sonuç yazıcı görevine ulaşmadan tüm çerçeve reddedilir
+                if not isinstance(batch, list):
+                    raise ValueError("Çerçeve bir sonuç listesi değil")
+                for result in batch:
+                    validate_result(result)
+
+                for result in batch:
+                    # Kuyruk doluysa burada beklenir; onay gecikir ve agent yavaşlar
+                    await self._queue.put(result)
+                self.received += len(batch)
+
+                writer.write(FRAME_HEADER.pack(len(batch)))
+                await writer.drain()
+        except (ConnectionError, ValueError, zlib.error) as e:
+            self.logger.warning("Agent bağlantı hatası (%s): %s", peer, e)
+        finally:
+            writer.close()
+
+    async def _write_loop(self):
+        """Kuyruktaki sonuçları toplu işlemlerle veritabanına yaz"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.write_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                self.written += await loop.run_in_executor(
+                    self._db_executor, self._store.insert_many, batch
+                )
+            except Exception as e:
+                # Yazıcı görevi ayakta kalmalı; aksi halde onaylanan sonuçlar kaybolur
+                self.logger.error("Sonuçlar yazılamadı: %s", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+class FleetAgent:
+    """Taramayı çalıştırıp sonucu toplayıcıya gönderen başsız agent"""
+
+    def __init__(self, logger, scanner, collector_host, collector_port,
+                 batch_size=50, queue_size=1000, host=None):
+        """
+        Args:
+            logger: Logger nesnesi
+            scanner: SecurityScanner nesnesi (yalnızca gönderim için None olabilir)
+            collector_host: Toplayıcı adresi
+            collector_port: Toplayıcı portu
+            batch_size: Bir çerçevedeki en fazla sonuç
+            queue_size: Gönderilmeyi bekleyen en fazla sonuç (taşarsa en eskisi atılır)
+            host: Sonuçlarda kullanılacak uç nokta adı
+        """
+        self.logger = logger
+        self.scanner = scanner
+        self.collector_host = collector_host
+        self.collector_port = collector_port
+        self.batch_size = batch_size
+        self.host = host or platform.node()
+
+        self.pending = deque(maxlen=queue_size)
+        self.sent = 0
+
+        self._reader = None
+        self._writer = None
+
+    def enqueue(self, result):
+        """Gönderilecek kompakt sonucu kuyruğa ekle"""
+        if len(self.pending) == self.pending.maxlen:
+            self.logger.warning("Agent kuyruğu dolu, en eski sonuç atıldı")
+        self.pending.append(result)
+
+    async def flush(self):
+        """
+        Kuyruktaki sonuçları toplu olarak gönder
+
+        Her çerçeve için toplayıcının onayı beklenir; onaylanmayan sonuçlar
+        kuyruğun başına geri konur.
+        """
+        while self.pending:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.collector_host, self.collector_port
+                )
+
+            batch = [self.pending.popleft() for _ in range(min(self.batch_size, len(self.pending)))]
+
+            try:
+                self._writer.write(encode_frame(batch))
+                await self._writer.drain()
+                ack = await self._reader.readexactly(FRAME_HEADER.size)
+            except (ConnectionError, asyncio.IncompleteReadError, OSError):
+                self.pending.extendleft(reversed(batch))
+                await self.disconnect()
+                raise
+
+            self.sent += FRAME_HEADER.unpack(ack)[0]
+
+    async def disconnect(self):
+        """Toplayıcı bağlantısını kapat"""
+        writer, self._writer, self._reader = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def run(self, interval=None, max_backoff=300):
+        """
+        Tarama yap ve sonucu gönder
+
+        Args:
+            interval: Taramalar arası saniye (None = tek tarama)
+            max_backoff: Gönderim hatasında en uzun bekleme
+        """
+        backoff = 1
+
+        try:
+            while True:
+                result = await self.scanner.perform_scan_async()
+                self.enqueue(compact_result(result, self.host))
+
+                try:
+                    await self.flush()
+                    backoff = 1
+                except (ConnectionError, asyncio.IncompleteReadError, OSError) as e:
+                    self.logger.warning(
+                        "Collector'a gönderilemedi (%s); %s sonuç bekliyor", e, len(self.pending)
+                    )
+                    if interval is None:
+                        raise
+                    backoff = min(max_backoff, backoff * 2)
+
+                if interval is None:
+                    break
+                await asyncio.sleep(max(interval, backoff if self.pending else 0))
+        finally:
+            await self.disconnect()
+
+
+def parse_address(value, default_port=8765):
+    """'host:port' metnini (host, port) çiftine çevir ('[::1]:8765' desteklenir)"""
+    host, sep, port = value.rpartition(':')
+    if not sep or not port.isdigit():
+        return value.strip('[]'), default_port
+    return host.strip('[]') or '0.0.0.0', int(port)
+
+
+def default_db_path():
+    """Varsayılan toplayıcı veritabanı yolu (data/fleet.db)"""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'fleet.db')
+
@@ -0,0 +1,542 @@
+"""
+Tarama Geçmişi Modülü
+Tarama geçmişi için yalnızca eklenen, indeksli SQLite deposu
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+# Geçmiş kayıtlarında sütun olarak tutulan alanlar; diğerleri 'extra' JSON'unda
+HISTORY_COLUMNS = ('ts', 'host', 'date', 'system', 'duration', 'vulnerability_count')
+
+DATE_FORMAT = '%d.%m.%Y %H:%M:%S'
+
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+
+# Özet çözünürlükleri (inceden kabaya) ve kova genişlikleri, saniye
+ROLLUP_LEVELS = (
+    ('hour', 3600),
+    ('day', 86400),
+    ('week', 7 * 86400)
+)
+
+# Haftalık kovalar pazartesi 00:00 UTC'de başlar (epoch 0 perşembedir)
+WEEK_OFFSET = 4 * 86400
+
+# Özet satırlarında "tümü" anlamındaki anahtar
+ALL = '*'
+
+# Çözünürlük başına saklama süresi, gün (0 = sınırsız)
+DEFAULT_ROLLUP_RETENTION = {'hour': 14, 'day': 730, 'week': 0}
+
+
+class HistoryStore:
+    """Tarama geçmişi deposu (tarama başına O(1) ekleme)"""
+    
+    def __init__(self, logger, db_path, rollup_retention=None):
+        """
+        Args:
+            logger: Logger nesnesi
+            db_path: SQLite veritabanı yolu (data/scan_history.db)
+            rollup_retention: Çözünürlük başına özet saklama süresi, gün ({'hour': 14, ...})
+        """
+        self.logger = logger
+        self.db_path = db_path
+        self.rollup_retention = dict(DEFAULT_ROLLUP_RETENTION, **(rollup_retention or {}))
+        self._lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        
+        has_rollups = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rollups'"
+        ).fetchone() is not None
+        
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS scans (
+                id INTEGER PRIMARY KEY,
+                ts REAL NOT NULL,
+                host TEXT NOT NULL,
+                date TEXT,
+                system TEXT,
+                duration REAL,
+                vulnerability_count INTEGER NOT NULL DEFAULT 0,
+                extra TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_scans_ts ON scans (ts);
+            CREATE INDEX IF NOT EXISTS idx_scans_host_ts ON scans (host, ts);
+            CREATE TABLE IF NOT EXISTS aggregates (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_scans INTEGER NOT NULL DEFAULT 0,
+                total_vulnerabilities INTEGER NOT NULL DEFAULT 0,
+                last_scan_id INTEGER,
+                last_scan_ts REAL,
+                most_vulnerable_id INTEGER,
+                most_vulnerable_count INTEGER,
+                risk_low INTEGER NOT NULL DEFAULT 0,
+                risk_medium INTEGER NOT NULL DEFAULT 0,
+                risk_high INTEGER NOT NULL DEFAULT 0,
+                risk_critical INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS rollups (
+                resolution TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                check_id TEXT NOT NULL,
+                risk TEXT NOT NULL,
+                scans INTEGER NOT NULL DEFAULT 0,
+                findings INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (resolution, bucket, check_id, risk)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        ''')
+        
+        # Toplam satırı yoksa (yeni veya toplamlardan önceki veritabanı) ham geçmişten oluştur
+        created = self.conn.execute('INSERT OR IGNORE INTO aggregates (id) VALUES (1)').rowcount
+        self.conn.commit()
+        if created:
+            self.rebuild_aggregates()
+        
+        # Özetlerden önceki veritabanı: bulgu ayrıntısı yok, tarama toplamlarıyla doldur
+        if not has_rollups:
+            with self._lock, self.conn:
+                rows = self.conn.execute('SELECT ts, vulnerability_count FROM scans').fetchall()
+                for ts, vuln_count in rows:
+                    self._rollup(ts, vuln_count, ())
+    
+    def append(self, entry, findings=()):
+        """
+        Tarama kaydı ekle
+        
+        Args:
+            entry: Geçmiş kaydı (date, vulnerability_count, duration, system, ts, host, ...)
+            findings: Zaman özetleri için bulgular [(check_id, risk)]
+        
+        Returns:
+            int: Kayıt kimliği
+        """
+        row = self._row(entry)
+        
+        # Kayıt, toplamlar ve zaman özetleri aynı işlemde güncellenir
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO scans (ts, host, date, system, duration, vulnerability_count, extra) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                row
+            )
+            self._accumulate(cursor.lastrowid, row[0], row[5], entry.get('risk_counts') or {})
+            self._rollup(row[0], row[5], findings)
+            return cursor.lastrowid
+    
+    def count(self, host=None):
+        """Kayıt sayısı"""
+        where, params = self._where(host=host)
+        with self._lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM scans{where}', params).fetchone()[0]
+    
+    def page(self, limit=10, offset=0, host=None, start=None, end=None, before_id=None):
+        """
+        Yeniden eskiye sayfalı kayıtlar
+        
+        Büyük geçmişte offset yerine önceki sayfanın son kimliğiyle (before_id)
+        sayfalama yapılması önerilir.
+        
+        Args:
+            limit: Sayfa boyutu
+            offset: Atlanacak kayıt
+            host: Yalnızca bu uç noktanın kayıtları
+            start: Başlangıç zamanı (epoch, dahil)
+            end: Bitiş zamanı (epoch, hariç)
+            before_id: Bu kimlikten eski kayıtlar
+        
+        Returns:
+            list: Geçmiş kayıtları (dict)
+        """
+        where, params = self._where(host, start, end, before_id)
+        sql = f'SELECT * FROM scans{where} ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?'
+        
+        with self._lock:
+            rows = self.conn.execute(sql, params + [int(limit), int(offset)]).fetchall()
+        return [self._entry(row) for row in rows]
+    
+    def range(self, start=None, end=None, host=None):
+        """
+        Zaman aralığındaki kayıtlar (eskiden yeniye)
+        
+        Args:
+            start: Başlangıç zamanı (epoch, dahil)
+            end: Bitiş zamanı (epoch, hariç)
+            host: Yalnızca bu uç noktanın kayıtları
+        
+        Yields:
+            dict: Geçmiş kaydı
+        """
+        where, params = self._where(host, start, end)
+        sql = f'SELECT * FROM scans{where} ORDER BY ts, id'
+        
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        for row in rows:
+            yield self._entry(row)
+    
+    def statistics(self):
+        """
+        Özet istatistikler (yazma anında tutulan toplamlardan, O(1))
+        
+        Returns:
+            dict: total_scans, total_vulnerabilities, risk_counts, last_scan, most_vulnerable_scan
+        """
+        with self._lock:
+            aggregates = self._read_aggregates()
+            last = self._get(aggregates.pop('last_scan_id'))
+            worst = self._get(aggregates.pop('most_vulnerable_id'))
+        
+        aggregates['last_scan'] = last
+        aggregates['most_vulnerable_scan'] = worst
+        return aggregates
+    
+    def rebuild_aggregates(self):
+        """
+        Toplamları ham geçmişten yeniden hesapla (doğrulama / onarım)
+        
+        Returns:
+            tuple: (önceki toplamlar, yeni toplamlar)
+        """
+        with self._lock, self.conn:
+            before = self._read_aggregates()
+            self._rebuild_aggregates()
+            after = self._read_aggregates()
+        
+        return before, after
+    
+    def _rebuild_aggregates(self):
+        """Toplamları sıfırlayıp ham geçmişten topla (çağıran işlemi ve kilidi tutar)"""
+        self.conn.execute(
+            'UPDATE aggregates SET total_scans = 0, total_vulnerabilities = 0, '
+            'last_scan_id = NULL, last_scan_ts = NULL, most_vulnerable_id = NULL, '
+            'most_vulnerable_count = NULL, risk_low = 0, risk_medium = 0, '
+            'risk_high = 0, risk_critical = 0 WHERE id = 1'
+        )
+        
+        rows = self.conn.execute(
+            'SELECT id, ts, vulnerability_count, extra FROM scans ORDER BY id'
+        ).fetchall()
+        for scan_id, ts, vuln_count, extra in rows:
+            risk_counts = json.loads(extra).get('risk_counts', {}) if extra else {}
+            self._accumulate(scan_id, ts, vuln_count, risk_counts)
+    
+    def trend(self, start, end, resolution='auto', by=None, max_points=500):
+        """
+        Zaman aralığındaki açık eğilimi (özet tablolarından)
+        
+        İstenen çözünürlükten ince seviyeye inilmez; 'auto' için kova sayısı
+        max_points'i aşmayan en ince seviye seçilir. Aralığın başı seviyenin
+        saklama süresinden eskiyse bir üst seviyeye geçilir.
+        
+        Args:
+            start: Başlangıç zamanı (epoch, dahil)
+            end: Bitiş zamanı (epoch, hariç)
+            resolution: 'hour', 'day', 'week' veya 'auto'
+            by: None, 'check' veya 'risk' (kova başına kırılım)
+            max_points: 'auto' için en fazla kova sayısı
+        
+        Returns:
+            dict: resolution ve buckets [{'start', 'scans', 'findings', 'by'}]
+        """
+        if by not in (None, 'check', 'risk'):
+            raise ValueError(f"Geçersiz kırılım: {by}")
+        
+        level, width = self._pick_level(start, end, resolution, max_points)
+        first = self._bucket(start, level, width)
+        
+        with self._lock:
+            totals = self.conn.execute(
+                'SELECT bucket, scans, findings FROM rollups '
+                'WHERE resolution = ? AND bucket >= ? AND bucket < ? AND check_id = ? AND risk = ? '
+                'ORDER BY bucket',
+                (level, first, end, ALL, ALL)
+            ).fetchall()
+            
+            breakdown = []
+            if by:
+                column = 'check_id' if by == 'check' else 'risk'
+                breakdown = self.conn.execute(
+                    f'SELECT bucket, {column}, SUM(findings) FROM rollups '
+                    'WHERE resolution = ? AND bucket >= ? AND bucket < ? AND check_id != ? '
+                    f'GROUP BY bucket, {column}',
+                    (level, first, end, ALL)
+                ).fetchall()
+        
+        buckets = {
+            bucket: {'start': bucket, 'scans': scans, 'findings': findings}
+            for bucket, scans, findings in totals
+        }
+        
+        if by:
+            for bucket in buckets.values():
+                bucket['by'] = {}
+            for bucket, key, count in breakdown:
+                if bucket in buckets:
+                    buckets[bucket]['by'][key] = count
+        
+        return {'resolution': level, 'buckets': list(buckets.values())}
+    
+    def prune_rollups(self, now=None):
+        """
+        Saklama süresini aşan ince özet kovalarını sil
+        
+        Kaba seviyeler aynı veriyi tuttuğu için uzun vadeli eğilim kaybolmaz.
+        
+        Returns:
+            int: Silinen satır sayısı
+        """
+        now = datetime.now().timestamp() if now is None else now
+        removed = 0
+        
+        with self._lock, self.conn:
+            for level, _ in ROLLUP_LEVELS:
+                days = self.rollup_retention.get(level) or 0
+                if days > 0:
+                    removed += self.conn.execute(
+                        'DELETE FROM rollups WHERE resolution = ? AND bucket < ?',
+                        (level, now - days * 86400)
+                    ).rowcount
+        
+        return removed
+    
+    def clear(self):
+        """Tüm geçmişi ve toplamları sil"""
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM scans')
+            self.conn.execute('DELETE FROM aggregates')
+            self.conn.execute('INSERT INTO aggregates (id) VALUES (1)')
+            self.conn.execute('DELETE FROM rollups')
+    
+    def migrate_json(self, json_path):
+        """
+        Eski scan_history.json dosyasını tek işlemde aktar
+        
+        Kayıtlar, toplamlar, zaman özetleri ve aktarım işareti (meta: kaynak
+        yolu, değiştirilme zamanı, boyut) aynı işlemde yazılır. Dosya ardından
+        '.migrated' uzantısıyla yeniden adlandırılır; yeniden adlandırma
+        başarısız olur ya da süreç arada kapanırsa işaret sayesinde dosya
+        ikinci kez aktarılmaz. Boş veya okunamayan dosyalara dokunulmaz.
+        
+        Returns:
+            int: Aktarılan kayıt sayısı
+        """
+        if not os.path.exists(json_path) or os.path.getsize(json_path) == 0:
+            return 0
+        
+        stat = os.stat(json_path)
+        marker_key = f"migrated:{os.path.abspath(json_path)}"
+        marker = json.dumps({'mtime': stat.st_mtime, 'size': stat.st_size})
+        
+        with self._lock:
+            done = self.conn.execute('SELECT value FROM meta WHERE key = ?', (marker_key,)).fetchone()
+        if done is not None and done[0] == marker:
+            self._rename_migrated(json_path)
+            return 0
+        
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            self.logger.error("Eski geçmiş okunamadı: %s", e)
+            return 0
+        
+        if not isinstance(entries, list):
+            return 0
+        
+        rows = [self._row(self._legacy_entry(entry)) for entry in entries if isinstance(entry, dict)]
+        
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT INTO scans (ts, host, date, system, duration, vulnerability_count, extra) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            for row in rows:
+                self._rollup(row[0], row[5], ())
+            self._rebuild_aggregates()
+            self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (marker_key, marker))
+        
+        self.logger.info("%s tarama geçmişi kaydı SQLite'a aktarıldı", len(rows))
+        self._rename_migrated(json_path)
+        return len(rows)
+    
+    def _rename_migrated(self, json_path):
+        """Aktarılmış dosyayı '.migrated' olarak adlandır (başarısızsa sonraki açılışta yeniden denenir)"""
+        try:
+            os.replace(json_path, json_path + '.migrated')
+        except OSError as e:
+            self.logger.warning("Aktarılan geçmiş dosyası yeniden adlandırılamadı: %s", e)
+    
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self._lock:
+            self.conn.close()
+    
+    def _accumulate(self, scan_id, ts, vuln_count, risk_counts):
+        """Tek kaydı toplamlara ekle (çağıran işlemi ve kilidi tutar)"""
+        risks = [int(risk_counts.get(level, 0)) for level in RISK_LEVELS]
+        
+        self.conn.execute(
+            '''UPDATE aggregates SET
+                total_scans = total_scans + 1,
+                total_vulnerabilities = total_vulnerabilities + ?,
+                last_scan_id = CASE WHEN last_scan_ts IS NULL OR ? >= last_scan_ts
+                                    THEN ? ELSE last_scan_id END,
+                last_scan_ts = MAX(COALESCE(last_scan_ts, ?), ?),
+                most_vulnerable_id = CASE WHEN most_vulnerable_count IS NULL OR ? > most_vulnerable_count
+                                          THEN ? ELSE most_vulnerable_id END,
+                most_vulnerable_count = MAX(COALESCE(most_vulnerable_count, ?), ?),
+                risk_low = risk_low + ?,
+                risk_medium = risk_medium + ?,
+                risk_high = risk_high + ?,
+                risk_critical = risk_critical + ?
+            WHERE id = 1''',
+            [vuln_count, ts, scan_id, ts, ts, vuln_count, scan_id, vuln_count, vuln_count] + risks
+        )
+    
+    def _rollup(self, ts, vuln_count, findings):
+        """Taramayı her çözünürlükteki kovasına ekle (çağıran işlemi ve kilidi tutar)"""
+        counts = {}
+        for check_id, risk in findings:
+            key = (check_id or ALL, (risk or 'medium').lower())
+            counts[key] = counts.get(key, 0) + 1
+        
+        for level, width in ROLLUP_LEVELS:
+            bucket = self._bucket(ts, level, width)
+            rows = [(level, bucket, ALL, ALL, 1, vuln_count)]
+            rows.extend(
+                (level, bucket, check_id, risk, 1, count)
+                for (check_id, risk), count in counts.items()
+            )
+            self.conn.executemany(
+                'INSERT INTO rollups (resolution, bucket, check_id, risk, scans, findings) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (resolution, bucket, check_id, risk) DO UPDATE SET '
+                'scans = scans + excluded.scans, findings = findings + excluded.findings',
+                rows
+            )
+    
+    def _pick_level(self, start, end, resolution, max_points):
+        """Eğilim sorgusu için özet seviyesi"""
+        names = [level for level, _ in ROLLUP_LEVELS]
+        if resolution != 'auto' and resolution not in names:
+            raise ValueError(f"Geçersiz çözünürlük: {resolution}")
+        
+        now = datetime.now().timestamp()
+        candidates = ROLLUP_LEVELS if resolution == 'auto' else ROLLUP_LEVELS[names.index(resolution):]
+        
+        for level, width in candidates:
+            days = self.rollup_retention.get(level) or 0
+            if days > 0 and start < now - days * 86400:
+                continue
+            if resolution == 'auto' and (end - start) / width > max_points:
+                continue
+            return level, width
+        
+        return candidates[-1]
+    
+    @staticmethod
+    def _bucket(ts, level, width):
+        """Zamanın bulunduğu kovanın başlangıcı (UTC)"""
+        offset = WEEK_OFFSET if level == 'week' else 0
+        return int((ts - offset) // width * width + offset)
+    
+    def _read_aggregates(self):
+        """Toplam satırını sözlük olarak oku"""
+        row = self.conn.execute(
+            'SELECT total_scans, total_vulnerabilities, last_scan_id, most_vulnerable_id, '
+            'risk_low, risk_medium, risk_high, risk_critical FROM aggregates WHERE id = 1'
+        ).fetchone()
+        
+        return {
+            'total_scans': row[0],
+            'total_vulnerabilities': row[1],
+            'last_scan_id': row[2],
+            'most_vulnerable_id': row[3],
+            'risk_counts': dict(zip(RISK_LEVELS, row[4:]))
+        }
+    
+    def _get(self, scan_id):
+        """Kimliğe göre kayıt (birincil anahtar araması)"""
+        if scan_id is None:
+            return None
+        row = self.conn.execute('SELECT * FROM scans WHERE id = ?', (scan_id,)).fetchone()
+        return self._entry(row) if row else None
+    
+    @staticmethod
+    def _legacy_entry(entry):
+        """JSON kayıtlarına eksik ts / host alanlarını ekle"""
+        entry = dict(entry)
+        if 'ts' not in entry:
+            try:
+                entry['ts'] = datetime.strptime(entry.get('date', ''), DATE_FORMAT).timestamp()
+            except ValueError:
+                entry['ts'] = 0.0
+        entry.setdefault('host', '')
+        return entry
+    
+    @staticmethod
+    def _row(entry):
+        """Kaydı tablo satırına çevir"""
+        extra = {key: value for key, value in entry.items() if key not in HISTORY_COLUMNS}
+        ts = entry.get('ts')
+        return (
+            float(datetime.now().timestamp() if ts is None else ts),
+            str(entry.get('host', '')),
+            entry.get('date'),
+            entry.get('system'),
+            entry.get('duration'),
+            int(entry.get('vulnerability_count', 0)),
+            json.dumps(extra, separators=(',', ':'), ensure_ascii=False) if extra else None
+        )
+    
+    @staticmethod
+    def _entry(row):
+        """Tablo satırını geçmiş kaydına çevir"""
+        scan_id, ts, host, date, system, duration, vuln_count, extra = row
+        entry = {
+            'id': scan_id,
+            'ts': ts,
+            'host': host,
+            'date': date,
+            'system': system,
+            'duration': duration,
+            'vulnerability_count': vuln_count
+        }
+        if extra:
+            entry.update(json.loads(extra))
+        return entry
+    
+    @staticmethod
+    def _where(host=None, start=None, end=None, before_id=None):
+        """WHERE ifadesi ve parametreleri"""
+        clauses = []
+        params = []
+        
+        if host is not None:
+            clauses.append('host = ?')
+            params.append(host)
+        if start is not None:
+            clauses.append('ts >= ?')
+            params.append(float(start))
+        if end is not None:
+            clauses.append('ts < ?')
+            params.append(float(end))
+        if before_id is not None:
+            clauses.append('id < ?')
+            params.append(int(before_id))
+        
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        return where, params
\ No newline at end of file
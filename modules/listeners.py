@@ -0,0 +1,281 @@
+"""
+Dinleyen Soket Envanteri Modülü
+İşletim sisteminin soket tablosundan dinleyen portları ve sahip süreçleri okuma
+"""
+
+import asyncio
+import ipaddress
+import os
+import socket
+import sys
+from collections import namedtuple
+
+
+Listener = namedtuple('Listener', ['protocol', 'address', 'port', 'scope', 'pid', 'process'])
+
+# /proc/net/tcp* durum kodları
+TCP_LISTEN = '0A'
+UDP_UNCONNECTED = '07'
+
+PROC_NET_TABLES = (
+    ('tcp', 'tcp', False),
+    ('tcp6', 'tcp', True),
+    ('udp', 'udp', False),
+    ('udp6', 'udp', True)
+)
+
+
+def bind_scope(address):
+    """
+    Bağlanılan adresin kapsamını belirle
+
+    Returns:
+        str: 'loopback', 'wildcard' veya 'specific'
+    """
+    try:
+        ip = ipaddress.ip_address(address.split('%', 1)[0])
+    except ValueError:
+        return 'specific'
+
+    if ip.is_unspecified:
+        return 'wildcard'
+    if ip.is_loopback:
+        return 'loopback'
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        return bind_scope(str(ip.ipv4_mapped))
+    return 'specific'
+
+
+def _decode_proc_address(value, ipv6):
+    """/proc/net/* 'ADRES:PORT' onaltılık alanını çöz"""
+    hex_addr, hex_port = value.split(':')
+    raw = bytes.fromhex(hex_addr)
+
+    # Çekirdek her 32 bitlik kelimeyi yerel bayt sırasıyla yazar
+    if sys.byteorder == 'little':
+        raw = b''.join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+
+    family = socket.AF_INET6 if ipv6 else socket.AF_INET
+    return socket.inet_ntop(family, raw), int(hex_port, 16)
+
+
+def iter_proc_net(path, protocol, ipv6):
+    """
+    /proc/net/{tcp,udp}[6] tablosunu satır satır oku
+
+    Yields:
+        tuple: (protocol, address, port, inode) - yalnızca dinleyen soketler
+    """
+    wanted = TCP_LISTEN if protocol == 'tcp' else UDP_UNCONNECTED
+
+    with open(path, 'r', encoding='ascii', errors='ignore') as f:
+        next(f, None)  # Başlık satırı
+
+        for line in f:
+            fields = line.split()
+            if len(fields) < 10 or fields[3] != wanted:
+                continue
+
+            address, port = _decode_proc_address(fields[1], ipv6)
+            yield protocol, address, port, fields[9]
+
+
+def parse_netstat_line(line):
+    """
+    'netstat -ano' çıktısının tek satırını çözümle
+
+    Durum sütunu Windows diline göre değiştiği için dinleyen TCP soketleri
+    yabancı adresin '0.0.0.0:0' / '[::]:0' olmasıyla tanınır.
+
+    Returns:
+        tuple | None: (protocol, address, port, pid) veya dinleyen soket değilse None
+    """
+    fields = line.split()
+    if len(fields) < 4:
+        return None
+
+    protocol = fields[0].lower()
+    if protocol not in ('tcp', 'udp'):
+        return None
+
+    local, foreign, pid = fields[1], fields[2], fields[-1]
+    if protocol == 'tcp' and foreign not in ('0.0.0.0:0', '[::]:0'):
+        return None
+    if protocol == 'udp' and foreign != '*:*':
+        return None
+
+    address, _, port = local.rpartition(':')
+    if not port.isdigit():
+        return None
+
+    return protocol, address.strip('[]'), int(port), int(pid) if pid.isdigit() else None
+
+
+def parse_tasklist_line(line):
+    """
+    'tasklist /FO CSV /NH' satırını çözümle
+
+    Returns:
+        tuple | None: (pid, süreç adı)
+    """
+    fields = [field.strip('"') for field in line.strip().split('","')]
+    if len(fields) >= 2 and fields[1].isdigit():
+        return int(fields[1]), fields[0]
+    return None
+
+
+def _socket_owners(inodes, proc_root='/proc'):
+    """
+    Soket inode'larını sahip süreçlerle eşleştir
+
+    Tüm inode'lar bulununca tarama durur; erişilemeyen süreçler atlanır.
+
+    Returns:
+        dict: {inode: pid}
+    """
+    owners = {}
+    remaining = set(inodes)
+
+    try:
+        pids = [name for name in os.listdir(proc_root) if name.isdigit()]
+    except OSError:
+        return owners
+
+    for pid in pids:
+        fd_dir = os.path.join(proc_root, pid, 'fd')
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+
+        for fd in fds:
+            try:
+                target = os.readlink(os.path.join(fd_dir, fd))
+            except OSError:
+                continue
+
+            if target.startswith('socket:['):
+                inode = target[8:-1]
+                if inode in remaining:
+                    owners[inode] = int(pid)
+                    remaining.discard(inode)
+
+        if not remaining:
+            break
+
+    return owners
+
+
+def _process_name(pid, proc_root='/proc'):
+    """Linux'ta süreç adını oku"""
+    try:
+        with open(os.path.join(proc_root, str(pid), 'comm'), 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class ListenerInventory:
+    """İşletim sisteminden dinleyen soket envanteri"""
+
+    def __init__(self, logger, proc_root='/proc'):
+        self.logger = logger
+        self.proc_root = proc_root
+        self.system = sys.platform
+
+    def available(self):
+        """Bu platformda envanter okunabiliyor mu"""
+        if self.system == 'win32':
+            return True
+        return os.access(os.path.join(self.proc_root, 'net', 'tcp'), os.R_OK)
+
+    async def listeners_async(self, stream, tcp_ports=None, udp_ports=None):
+        """
+        Dinleyen soketleri event loop'u bloklamadan döndür
+
+        Windows'ta netstat / tasklist çıktısı stream ile satır satır
+        ayrıştırılır; diğer platformlarda /proc okuması thread'de yapılır.
+
+        Args:
+            stream: async stream(command, on_line) çalıştırıcısı (SecurityChecks.stream_command)
+            tcp_ports: İlgilenilen TCP portları (None = tümü)
+            udp_ports: İlgilenilen UDP portları (None = tümü, boş = hiçbiri)
+
+        Returns:
+            list: Listener kayıtları
+        """
+        keep = self._port_filter(tcp_ports, udp_ports)
+
+        if self.system != 'win32':
+            loop = asyncio.get_running_loop()
+            records = await loop.run_in_executor(None, self._linux_listeners, keep)
+        else:
+            found = []
+            names = {}
+
+            def on_netstat(line):
+                entry = parse_netstat_line(line)
+                if entry is not None and keep(entry[0], entry[2]):
+                    found.append(entry)
+
+            def on_tasklist(line):
+                entry = parse_tasklist_line(line)
+                if entry is not None:
+                    names[entry[0]] = entry[1]
+
+            await stream(['netstat', '-ano'], on_netstat)
+            if found:
+                await stream(['tasklist', '/FO', 'CSV', '/NH'], on_tasklist)
+
+            records = [
+                Listener(protocol, address, port, bind_scope(address), pid, names.get(pid))
+                for protocol, address, port, pid in found
+            ]
+
+        records.sort(key=lambda r: (r.protocol, r.port, r.address))
+        return records
+
+    @staticmethod
+    def _port_filter(tcp_ports, udp_ports):
+        """Protokol / port süzgeci"""
+        wanted = {
+            'tcp': None if tcp_ports is None else set(tcp_ports),
+            'udp': None if udp_ports is None else set(udp_ports)
+        }
+
+        def keep(protocol, port):
+            ports = wanted[protocol]
+            return ports is None or port in ports
+
+        return keep
+
+    def _linux_listeners(self, keep):
+        """/proc/net tablolarından dinleyen soketler"""
+        found = []
+
+        for table, protocol, ipv6 in PROC_NET_TABLES:
+            path = os.path.join(self.proc_root, 'net', table)
+            if not os.path.exists(path):
+                continue
+
+            try:
+                for proto, address, port, inode in iter_proc_net(path, protocol, ipv6):
+                    if keep(proto, port):
+                        found.append((proto, address, port, inode))
+            except OSError as e:
+                self.logger.warning("%s okunamadı: %s", path, e)
+
+        owners = _socket_owners({inode for *_, inode in found}, self.proc_root)
+        names = {}
+        records = []
+
+        for protocol, address, port, inode in found:
+            pid = owners.get(inode)
+            if pid is not None and pid not in names:
+                names[pid] = _process_name(pid, self.proc_root)
+
+            records.append(Listener(
+                protocol, address, port, bind_scope(address), pid, names.get(pid)
+            ))
+
+        return records
\ No newline at end of file
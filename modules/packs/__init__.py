@@ -0,0 +1,4 @@
+"""
+Kontrol Paketleri
+modules.registry tarafından platforma göre tembel yüklenen kontrol modülleri
+"""
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Ağ Kontrol Paketi
+Platformdan bağımsız açık port kontrolü
+"""
+
+import asyncio
+import socket
+
+from modules.registry import check
+from modules.portscan import PortScanner, RISKY_PORTS, UDP_PROBES, local_addresses, parse_ports
+from modules.listeners import ListenerInventory
+
+
+@check('open_ports', 'Açık Portlar', platform='any', cost=0.5, risk='high', order=30)
+async def check_open_ports(ctx):
+    """Açık portları kontrol et"""
+    try:
+        settings = ctx.config.get('port_scan', {})
+        ports = parse_ports(settings.get('ports', 'risky'))
+        udp_ports = parse_ports(settings.get('udp_ports', sorted(UDP_PROBES))) if settings.get('udp', False) else []
+        
+        method = settings.get('method', 'auto')
+        inventory = ListenerInventory(ctx.logger)
+        loop = asyncio.get_running_loop()
+        
+        # Envanter satır satır okunur; seçici döngüsü event loop'u durdurmasın
+        if method == 'inventory' or (method == 'auto' and inventory.available()):
+            tcp_filter = None if settings.get('ports') == 'all' else ports
+            listeners = await inventory.listeners_async(ctx.stream_command, tcp_filter, udp_ports)
+            open_ports, exposed_count = _describe_listeners(listeners)
+            evidence = _port_evidence(listeners)
+        else:
+            scanner = PortScanner.from_config(ctx.logger, settings)
+            targets = _port_scan_targets(settings)
+            results = await loop.run_in_executor(None, scanner.scan, targets, ports, udp_ports, ctx.deadline)
+            open_ports = _describe_probe_results(results)
+            exposed_count = len(open_ports)
+            evidence = _port_evidence(results)
+        
+        if open_ports:
+            ports_str = ', '.join(open_ports)
+            port_count = len(open_ports)
+            
+            # Risk seviyesi belirleme (yalnızca loopback'e bağlı portlar dışarıdan erişilemez)
+            risk = 'low'
+            if exposed_count >= 3:
+                risk = 'high'
+            elif exposed_count >= 2:
+                risk = 'medium'
+            
+            return {
+                'message': f'{port_count} adet açık port tespit edildi',
+                'details': f'Açık portlar: {ports_str}',
+                'evidence': evidence,
+                'risk': risk,
+                'solution': 'Kullanılmayan servisleri kapatın ve güvenlik duvarı kurallarını gözden geçirin'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("Port taramasında hata: %s", e)
+    
+    return None
+
+
+def _port_label(port, protocol, service):
+    """Port için 'port[/udp] (servis)' açıklaması"""
+    label = str(port) if protocol == 'tcp' else f"{port}/udp"
+    if service:
+        label += f" ({service})"
+    return label
+
+
+def _port_evidence(entries):
+    """
+    Parmak izi kanıtı: sıralı (protokol, port) çiftleri
+    
+    Bağlama adresi, süreç adı ve PID yalnızca 'details' içinde yer alır;
+    servis yeniden başlasa da parmak izi değişmez:
+    
+    >>> from modules.diff import fingerprint
+    >>> from modules.listeners import Listener
+    >>> before = [Listener('tcp', '0.0.0.0', 445, 'wildcard', 4, 'System'),
+    ...           Listener('udp', '0.0.0.0', 161, 'wildcard', 1200, 'snmp.exe')]
+    >>> after = [Listener('udp', '0.0.0.0', 161, 'wildcard', 3408, 'snmp.exe'),
+    ...          Listener('tcp', '0.0.0.0', 445, 'wildcard', 4, 'System')]
+    >>> fingerprint('open_ports', _port_evidence(before)) == fingerprint('open_ports', _port_evidence(after))
+    True
+    """
+    return sorted({(entry.protocol, entry.port) for entry in entries})
+
+
+def _describe_probe_results(results):
+    """
+    Bağlantı denemesi sonuçlarını açıklamalara çevir
+    
+    Returns:
+        list: Açık port açıklamaları (aynı port birden fazla adreste açıksa bir kez)
+    """
+    open_ports = []
+    
+    for result in results:
+        label = _port_label(result.port, result.protocol, result.service)
+        if label not in open_ports:
+            open_ports.append(label)
+    
+    return open_ports
+
+
+def _describe_listeners(listeners):
+    """
+    Dinleyen soket envanterini açıklamalara çevir
+    
+    Returns:
+        tuple: (açık port açıklamaları, dışarıdan erişilebilir port sayısı)
+    """
+    grouped = {}
+    for listener in listeners:
+        grouped.setdefault((listener.protocol, listener.port), []).append(listener)
+    
+    open_ports = []
+    exposed_count = 0
+    
+    for (protocol, port), entries in grouped.items():
+        service = RISKY_PORTS.get(port) if protocol == 'tcp' else UDP_PROBES.get(port, ('',))[0]
+        scopes = {entry.scope for entry in entries}
+        
+        if 'wildcard' in scopes:
+            bind = 'tüm arayüzler'
+        elif scopes == {'loopback'}:
+            bind = 'yalnızca loopback'
+        else:
+            bind = ', '.join(sorted({entry.address for entry in entries if entry.scope != 'loopback'}))
+        
+        if scopes != {'loopback'}:
+            exposed_count += 1
+        
+        owners = sorted({
+            f"{entry.process or '?'} (pid {entry.pid})"
+            for entry in entries if entry.pid is not None
+        })
+        owner_text = f"; {', '.join(owners)}" if owners else ''
+        
+        open_ports.append(f"{_port_label(port, protocol, service)} [{bind}{owner_text}]")
+    
+    return open_ports, exposed_count
+
+
+def _port_scan_targets(settings):
+    """
+    Port taraması hedeflerini belirle
+    
+    Args:
+        settings: config.json 'port_scan' bölümü
+    
+    Returns:
+        list: IPv4/IPv6 hedef adresleri
+    """
+    targets = list(settings.get('targets', ['127.0.0.1']))
+    include_ipv6 = settings.get('include_ipv6', True) and socket.has_ipv6
+    
+    if include_ipv6 and '::1' not in targets:
+        targets.append('::1')
+    
+    if settings.get('include_interfaces', False):
+        for address in local_addresses(include_ipv6):
+            if address not in targets:
+                targets.append(address)
+    
+    return targets
\ No newline at end of file
@@ -0,0 +1,538 @@
+"""
+Windows Kontrol Paketi
+Windows'a özgü güvenlik kontrolleri (yalnızca Windows'ta içe aktarılır)
+"""
+
+import re
+
+from modules.datasources import requires
+from modules.registry import check
+
+
+# Kontrollerin okuduğu kayıt defteri anahtarları
+UAC_KEY = 'HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System'
+RDP_KEY = 'HKLM\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server'
+AUTORUN_KEY = 'HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\Explorer'
+PS_LOGGING_KEY = 'HKLM\\SOFTWARE\\Policies\\Microsoft\\Windows\\PowerShell\\ScriptBlockLogging'
+WSH_KEY = 'HKLM\\SOFTWARE\\Microsoft\\Windows Script Host\\Settings'
+DESKTOP_KEY = 'HKCU\\Control Panel\\Desktop'
+
+
+def _as_int(value):
+    """Kayıt defteri değerini tamsayıya çevir (çevrilemezse None)"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+@check('windows_defender', 'Windows Defender', platform='Windows', cost=1.5, risk='critical', order=10)
+@requires(services=['WinDefend'])
+async def check_windows_defender(ctx):
+    """Windows Defender durumunu kontrol et"""
+    try:
+        # PowerShell ile Windows Defender durumunu kontrol et
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'powershell',
+            '-Command',
+            'Get-MpComputerStatus | Select-Object AntivirusEnabled, RealTimeProtectionEnabled'
+        ])
+        
+        if returncode == 0 and stdout:
+            # AntivirusEnabled ve RealTimeProtectionEnabled kontrol et
+            if 'False' in stdout:
+                details = "Windows Defender veya gerçek zamanlı koruma devre dışı"
+                
+                return {
+                    'message': 'Windows Defender tam olarak aktif değil',
+                    'details': details,
+                    'risk': 'high',
+                    'solution': 'Windows Güvenliği > Virüs ve tehdit koruması bölümünden Windows Defender\'ı etkinleştirin'
+                }
+        
+        # Alternatif kontrol: Windows Defender servisi
+        status = await ctx.service_status('WinDefend')
+        
+        if status is None or status == 'Stopped':
+            return {
+                'message': 'Windows Defender servisi çalışmıyor',
+                'details': 'WinDefend servisi durdurulmuş veya mevcut değil',
+                'risk': 'critical',
+                'solution': 'Windows Defender servisini başlatın: services.msc > Windows Defender'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("Windows Defender kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('firewall', 'Güvenlik Duvarı', platform='Windows', cost=0.3, risk='high', order=20)
+async def check_firewall(ctx):
+    """Güvenlik duvarı durumunu kontrol et"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'netsh', 'advfirewall', 'show', 'allprofiles', 'state'
+        ])
+        
+        if returncode == 0 and stdout:
+            # Kapalı profilleri bul
+            off_profiles = []
+            
+            if 'Domain Profile' in stdout:
+                domain_section = stdout.split('Domain Profile')[1].split('\n')[0:3]
+                if any('OFF' in line for line in domain_section):
+                    off_profiles.append('Domain')
+            
+            if 'Private Profile' in stdout:
+                private_section = stdout.split('Private Profile')[1].split('\n')[0:3]
+                if any('OFF' in line for line in private_section):
+                    off_profiles.append('Private')
+            
+            if 'Public Profile' in stdout:
+                public_section = stdout.split('Public Profile')[1].split('\n')[0:3]
+                if any('OFF' in line for line in public_section):
+                    off_profiles.append('Public')
+            
+            if off_profiles:
+                profiles_str = ', '.join(off_profiles)
+                return {
+                    'message': f'Güvenlik duvarı bazı profillerde kapalı',
+                    'details': f'Kapalı profiller: {profiles_str}',
+                    'evidence': off_profiles,
+                    'risk': 'high',
+                    'solution': 'Windows Güvenliği > Güvenlik duvarı ve ağ koruması bölümünden güvenlik duvarını tüm profillerde etkinleştirin'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("Güvenlik duvarı kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('admin_account', 'Administrator Hesabı', platform='Windows', cost=0.3, risk='medium', order=40)
+async def check_admin_account(ctx):
+    """Administrator hesabı durumunu kontrol et"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'net', 'user', 'Administrator'
+        ])
+        
+        if returncode == 0 and stdout:
+            # Hesap aktif mi kontrol et
+            if 'Account active' in stdout and 'Yes' in stdout:
+                return {
+                    'message': 'Varsayılan Administrator hesabı aktif',
+                    'details': 'Administrator hesabı güvenlik riski oluşturur',
+                    'risk': 'medium',
+                    'solution': 'Administrator hesabını devre dışı bırakın: net user Administrator /active:no'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("Administrator hesabı kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('password_policy', 'Şifre Politikası', platform='Windows', cost=0.3, risk='medium', order=50)
+async def check_password_policy(ctx):
+    """Şifre politikasını kontrol et"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'net', 'accounts'
+        ])
+        
+        if returncode == 0 and stdout:
+            issues = []
+            
+            # Minimum şifre uzunluğu
+            min_length_match = re.search(r'Minimum password length\s*:\s*(\d+)', stdout)
+            if min_length_match:
+                min_length = int(min_length_match.group(1))
+                if min_length < 8:
+                    issues.append(f'Minimum şifre uzunluğu çok düşük ({min_length} karakter)')
+            
+            # Maksimum şifre yaşı
+            max_age_match = re.search(r'Maximum password age \(days\)\s*:\s*(\d+|Unlimited)', stdout)
+            if max_age_match:
+                max_age = max_age_match.group(1)
+                if max_age == 'Unlimited' or (max_age.isdigit() and int(max_age) > 90):
+                    issues.append('Şifre süresiz veya çok uzun (90+ gün)')
+            
+            # Şifre geçmişi
+            history_match = re.search(r'Length of password history maintained\s*:\s*(\d+)', stdout)
+            if history_match:
+                history = int(history_match.group(1))
+                if history < 5:
+                    issues.append(f'Şifre geçmişi yetersiz ({history} önceki şifre)')
+            
+            if issues:
+                return {
+                    'message': 'Zayıf şifre politikası tespit edildi',
+                    'details': '; '.join(issues),
+                    'risk': 'medium',
+                    'solution': 'Güvenlik Politikası düzenleyicisinde şifre politikalarını güçlendirin (secpol.msc)'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("Şifre politikası kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('auto_updates', 'Otomatik Güncellemeler', platform='Windows', cost=1.0, risk='high', order=60)
+@requires(services=['wuauserv'])
+async def check_auto_updates(ctx):
+    """Otomatik güncellemeleri kontrol et"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'powershell',
+            '-Command',
+            '(New-Object -ComObject Microsoft.Update.AutoUpdate).Settings.NotificationLevel'
+        ])
+        
+        if returncode == 0 and stdout.strip():
+            level = stdout.strip()
+            
+            # Notification Level:
+            # 0 = Not configured
+            # 1 = Disabled
+            # 2 = Notify before download
+            # 3 = Notify before installation
+            # 4 = Scheduled installation (İdeal)
+            
+            if level in ['0', '1', '2']:
+                level_text = {
+                    '0': 'Yapılandırılmamış',
+                    '1': 'Devre dışı',
+                    '2': 'İndirmeden önce bildirim'
+                }
+                
+                return {
+                    'message': 'Otomatik güncellemeler tam olarak etkin değil',
+                    'details': f'Güncelleme seviyesi: {level_text.get(level, level)}',
+                    'risk': 'medium',
+                    'solution': 'Windows Update ayarlarından otomatik güncellemeleri etkinleştirin'
+                }
+        
+        # Alternatif kontrol: Windows Update servisi
+        if await ctx.service_status('wuauserv') == 'Stopped':
+            return {
+                'message': 'Windows Update servisi çalışmıyor',
+                'details': 'wuauserv servisi durdurulmuş',
+                'risk': 'high',
+                'solution': 'Windows Update servisini başlatın ve otomatik başlatmaya ayarlayın'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("Otomatik güncelleme kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('shared_folders', 'Paylaşılan Klasörler', platform='Windows', cost=0.3, risk='medium', order=70)
+async def check_shared_folders(ctx):
+    """Paylaşılan klasörleri kontrol et"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'net', 'share'
+        ])
+        
+        if returncode == 0 and stdout:
+            # Satırları ayır ve paylaşımları filtrele
+            lines = stdout.split('\n')
+            shares = []
+            
+            for line in lines:
+                line = line.strip()
+                # Başlık ve boş satırları atla
+                if not line or 'Share name' in line or line.startswith('-') or 'The command' in line:
+                    continue
+                
+                # Varsayılan sistem paylaşımlarını atla
+                if any(default in line for default in ['IPC$', 'ADMIN$', 'C$', 'D$', 'print$']):
+                    continue
+                
+                # Paylaşım adını al
+                share_name = line.split()[0] if line.split() else None
+                if share_name:
+                    shares.append(share_name)
+            
+            if shares:
+                shares_str = ', '.join(shares)
+                share_count = len(shares)
+                
+                # Risk seviyesi
+                risk = 'low'
+                if share_count >= 3:
+                    risk = 'medium'
+                
+                return {
+                    'message': f'{share_count} adet dosya paylaşımı tespit edildi',
+                    'details': f'Paylaşımlar: {shares_str}',
+                    'evidence': shares,
+                    'risk': risk,
+                    'solution': 'Gereksiz dosya paylaşımlarını kaldırın ve paylaşım izinlerini gözden geçirin'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("Paylaşılan klasör kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('uac_settings', 'UAC Ayarları', platform='Windows', cost=0.1, risk='high', order=80)
+@requires(registry=[(UAC_KEY, 'EnableLUA')])
+async def check_uac_settings(ctx):
+    """UAC (User Account Control) ayarlarını kontrol et"""
+    try:
+        value = _as_int(await ctx.registry_value(UAC_KEY, 'EnableLUA'))
+        
+        if value == 0:
+            return {
+                'message': 'UAC (Kullanıcı Hesabı Denetimi) devre dışı',
+                'details': 'Sistem yönetici izinleri konusunda uyarmıyor',
+                'risk': 'high',
+                'solution': 'Denetim Masası > Kullanıcı Hesapları > UAC ayarlarını değiştir'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("UAC kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('remote_desktop', 'Uzak Masaüstü', platform='Windows', cost=0.1, risk='medium', order=90)
+@requires(registry=[(RDP_KEY, 'fDenyTSConnections')])
+async def check_remote_desktop(ctx):
+    """Uzak Masaüstü (RDP) durumunu kontrol et"""
+    try:
+        value = _as_int(await ctx.registry_value(RDP_KEY, 'fDenyTSConnections'))
+        
+        # 0 = RDP Etkin, 1 = RDP Devre Dışı
+        if value == 0:
+            return {
+                'message': 'Uzak Masaüstü (RDP) etkin',
+                'details': 'RDP güvenlik riski oluşturabilir',
+                'risk': 'medium',
+                'solution': 'Kullanılmıyorsa RDP\'yi devre dışı bırakın veya güçlü kimlik doğrulama kullanın'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("RDP kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('usb_autorun', 'USB Otomatik Çalıştırma', platform='Windows', cost=0.1, risk='medium', order=100)
+@requires(registry=[(AUTORUN_KEY, 'NoDriveTypeAutoRun')])
+async def check_usb_autorun(ctx):
+    """USB otomatik çalıştırma kontrolü"""
+    try:
+        value = _as_int(await ctx.registry_value(AUTORUN_KEY, 'NoDriveTypeAutoRun'))
+        
+        # 255 (0xFF) = Tüm sürücülerde autorun kapalı (GÜVENLİ)
+        # Düşük değer = Autorun açık (RİSKLİ)
+        if value is not None and value not in (0x0, 0xFF):
+            return None  # Güvenli
+        
+        # Kayıt yoksa veya 0x0 ise tehlikeli
+        return {
+            'message': 'USB otomatik çalıştırma etkin',
+            'details': 'USB bellekler zararlı yazılım yayabilir',
+            'risk': 'medium',
+            'solution': 'USB autorun\'ı devre dışı bırakın: gpedit.msc > Bilgisayar Yapılandırması > Yönetim Şablonları'
+        }
+    
+    except Exception as e:
+        ctx.logger.error("USB autorun kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('bitlocker', 'BitLocker Şifreleme', platform='Windows', cost=1.5, risk='medium', order=110)
+async def check_bitlocker(ctx):
+    """BitLocker disk şifreleme kontrolü"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'powershell',
+            '-Command',
+            'Get-BitLockerVolume | Select-Object MountPoint, ProtectionStatus'
+        ])
+        
+        if returncode == 0 and stdout:
+            # ProtectionStatus: Off = Şifresiz, On = Şifreli
+            if 'Off' in stdout or 'ProtectionStatus' not in stdout:
+                return {
+                    'message': 'Disk şifreleme (BitLocker) kapalı',
+                    'details': 'Verileriniz fiziksel erişimde korumasız',
+                    'risk': 'medium',
+                    'solution': 'BitLocker\'ı etkinleştirin: Denetim Masası > BitLocker Sürücü Şifrelemesi'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("BitLocker kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('smb_v1', 'SMBv1 Protokol', platform='Windows', cost=3.0, risk='critical', order=120)
+async def check_smb_v1(ctx):
+    """SMB v1 protokol kontrolü (Eski ve tehlikeli)"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'powershell',
+            '-Command',
+            'Get-WindowsOptionalFeature -Online -FeatureName SMB1Protocol'
+        ])
+        
+        if returncode == 0 and stdout:
+            if 'State' in stdout and 'Enabled' in stdout:
+                return {
+                    'message': 'SMBv1 protokolü etkin (TEHLİKELİ!)',
+                    'details': 'WannaCry ve NotPetya bu protokolü kullandı',
+                    'risk': 'critical',
+                    'solution': 'SMBv1\'i devre dışı bırakın: Denetim Masası > Windows Özellikleri > SMB 1.0/CIFS'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("SMB v1 kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('powershell_logging', 'PowerShell Logging', platform='Windows', cost=0.1, risk='medium', order=130)
+@requires(registry=[(PS_LOGGING_KEY, 'EnableScriptBlockLogging')])
+async def check_powershell_logging(ctx):
+    """PowerShell Script Block Logging kontrolü"""
+    try:
+        value = _as_int(await ctx.registry_value(PS_LOGGING_KEY, 'EnableScriptBlockLogging'))
+        
+        if value != 1:
+            return {
+                'message': 'PowerShell Script Block Logging kapalı',
+                'details': 'PowerShell saldırıları tespit edilemiyor',
+                'risk': 'medium',
+                'solution': 'PowerShell logging\'i etkinleştirin: gpedit.msc > Yönetim Şablonları > Windows PowerShell'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("PowerShell logging kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('wsh', 'Windows Script Host', platform='Windows', cost=0.1, risk='low', order=140)
+@requires(registry=[(WSH_KEY, 'Enabled')])
+async def check_wsh(ctx):
+    """Windows Script Host (WSH) kontrolü"""
+    try:
+        # WSH'nin devre dışı olup olmadığını kontrol et
+        value = _as_int(await ctx.registry_value(WSH_KEY, 'Enabled'))
+        
+        # Kayıt yoksa veya 1 ise WSH aktif (Risk)
+        if value != 0:
+            return {
+                'message': 'Windows Script Host (WSH) etkin',
+                'details': 'VBS/JS zararlı script\'leri çalışabilir',
+                'risk': 'low',
+                'solution': 'Gerekmedikçe WSH\'yi devre dışı bırakın: reg add "HKLM\\SOFTWARE\\Microsoft\\Windows Script Host\\Settings" /v Enabled /t REG_DWORD /d 0 /f'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("WSH kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('guest_account', 'Misafir Hesabı', platform='Windows', cost=0.3, risk='medium', order=150)
+async def check_guest_account(ctx):
+    """Misafir hesabı kontrolü"""
+    try:
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'net', 'user', 'Guest'
+        ])
+        
+        if returncode == 0 and stdout:
+            if 'Account active' in stdout and 'Yes' in stdout:
+                return {
+                    'message': 'Misafir (Guest) hesabı aktif',
+                    'details': 'Yetkisiz erişime kapı açar',
+                    'risk': 'medium',
+                    'solution': 'Guest hesabını devre dışı bırakın: net user Guest /active:no'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("Guest hesabı kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('blank_passwords', 'Boş Şifreler', platform='Windows', cost=0.3, risk='high', order=160)
+async def check_blank_passwords(ctx):
+    """Boş şifreli hesaplar kontrolü"""
+    try:
+        # Boş şifre politikası kontrolü
+        stdout, stderr, returncode = await ctx.run_command_async([
+            'net', 'accounts'
+        ])
+        
+        if returncode == 0 and stdout:
+            # Minimum şifre uzunluğu 0 ise boş şifreye izin veriliyor
+            if 'Minimum password length' in stdout and ': 0' in stdout:
+                return {
+                    'message': 'Boş şifrelere izin veriliyor',
+                    'details': 'Kullanıcılar şifresiz hesap oluşturabilir',
+                    'risk': 'high',
+                    'solution': 'Minimum şifre uzunluğunu artırın: net accounts /minpwlen:8'
+                }
+    
+    except Exception as e:
+        ctx.logger.error("Boş şifre kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('screen_saver_password', 'Ekran Koruyucu Şifre', platform='Windows', cost=0.1, risk='low', order=170)
+@requires(registry=[(DESKTOP_KEY, 'ScreenSaverIsSecure')])
+async def check_screen_saver_password(ctx):
+    """Ekran koruyucu şifre kontrolü"""
+    try:
+        value = _as_int(await ctx.registry_value(DESKTOP_KEY, 'ScreenSaverIsSecure'))
+        
+        # 0 veya kayıt yoksa şifre koruması yok
+        if value is None or value == 0:
+            return {
+                'message': 'Ekran koruyucu şifre koruması yok',
+                'details': 'Bilgisayar başında olmadığınızda başkaları erişebilir',
+                'risk': 'low',
+                'solution': 'Ekran koruyucu şifresini etkinleştirin: Ayarlar > Kişiselleştirme > Kilit ekranı'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("Ekran koruyucu kontrolünde hata: %s", e)
+    
+    return None
+
+
+@check('network_discovery', 'Ağ Keşfi', platform='Windows', cost=0.1, risk='low', order=180)
+@requires(services=['FDResPub'])
+async def check_network_discovery(ctx):
+    """Ağ keşfi (Network Discovery) kontrolü"""
+    try:
+        # FDResPub servisi Network Discovery için gerekli
+        if await ctx.service_status('FDResPub') == 'Running':
+            return {
+                'message': 'Ağ keşfi (Network Discovery) etkin',
+                'details': 'Bilgisayarınız ağda görünür durumda',
+                'risk': 'low',
+                'solution': 'Genel ağlarda Network Discovery\'yi kapatın: Denetim Masası > Ağ ve Paylaşım Merkezi'
+            }
+    
+    except Exception as e:
+        ctx.logger.error("Network Discovery kontrolünde hata: %s", e)
+    
+    return None
\ No newline at end of file
@@ -0,0 +1,349 @@
+"""
+Port Tarama Modülü
+Bloklamayan soketlerle (selectors) eşzamanlı TCP/UDP port taraması
+"""
+
+import errno
+import selectors
+import socket
+import sys
+import time
+from collections import deque, namedtuple
+
+
+# Yaygın riskli portlar
+RISKY_PORTS = {
+    21: 'FTP',
+    22: 'SSH',
+    23: 'Telnet',
+    25: 'SMTP',
+    135: 'RPC',
+    139: 'NetBIOS',
+    445: 'SMB',
+    1433: 'SQL Server',
+    3306: 'MySQL',
+    3389: 'RDP',
+    5900: 'VNC',
+    8080: 'HTTP Proxy'
+}
+
+# UDP servisleri ve yanıt almak için gönderilen sorgular
+UDP_PROBES = {
+    # NetBIOS Name Service: '*' için NBSTAT sorgusu
+    137: ('NetBIOS-NS', b'\x13\x37\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+                        b'\x20CKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA\x00\x00\x21\x00\x01'),
+    # SNMP v2c GetNextRequest (community: public, OID 1.3.6.1.2.1)
+    161: ('SNMP', b'\x30\x26\x02\x01\x01\x04\x06public\xa1\x19\x02\x04\x13\x37\x13\x37'
+                  b'\x02\x01\x00\x02\x01\x00\x30\x0b\x30\x09\x06\x05\x2b\x06\x01\x02\x01\x05\x00'),
+    # SSDP M-SEARCH
+    1900: ('SSDP', b'M-SEARCH * HTTP/1.1\r\nHOST: 239.255.255.250:1900\r\n'
+                   b'MAN: "ssdp:discover"\r\nMX: 1\r\nST: ssdp:all\r\n\r\n')
+}
+
+PortResult = namedtuple('PortResult', ['host', 'port', 'protocol', 'service'])
+
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}
+
+
+def parse_ports(spec):
+    """
+    Port tanımını port listesine çevir
+
+    Args:
+        spec: 'all', 'risky', port listesi veya '1-1024,3389' biçiminde metin
+
+    Returns:
+        list: Sıralı, tekrarsız port numaraları
+    """
+    if spec in (None, 'risky'):
+        return sorted(RISKY_PORTS)
+    if spec == 'all':
+        return list(range(1, 65536))
+
+    if isinstance(spec, str):
+        spec = spec.split(',')
+
+    ports = set()
+    for item in spec:
+        if isinstance(item, int):
+            ports.add(item)
+            continue
+
+        item = str(item).strip()
+        if '-' in item:
+            start, end = item.split('-', 1)
+            ports.update(range(int(start), int(end) + 1))
+        elif item:
+            ports.add(int(item))
+
+    return sorted(p for p in ports if 0 < p < 65536)
+
+
+def local_addresses(include_ipv6=True):
+    """
+    Yerel arayüz adreslerini döndür
+
+    Returns:
+        list: Bağlantı noktası taraması için IPv4/IPv6 adresleri
+    """
+    addresses = []
+    families = (socket.AF_INET, socket.AF_INET6) if include_ipv6 else (socket.AF_INET,)
+
+    try:
+        infos = socket.getaddrinfo(socket.gethostname(), None)
+    except socket.gaierror:
+        infos = []
+
+    for family, _, _, _, sockaddr in infos:
+        if family in families and sockaddr[0] not in addresses:
+            addresses.append(sockaddr[0])
+
+    return addresses
+
+
+class PortScanner:
+    """Bloklamayan, eşzamanlı port tarayıcı"""
+
+    def __init__(self, logger, concurrency=512, rate=0, timeout=0.3,
+                 min_timeout=0.05, max_timeout=1.5):
+        """
+        Args:
+            logger: Logger nesnesi
+            concurrency: Aynı anda açık tutulacak en fazla soket
+            rate: Saniyedeki en fazla bağlantı denemesi (0 = sınırsız)
+            timeout: RTT ölçülene kadar kullanılacak zaman aşımı
+            min_timeout: Uyarlanabilir zaman aşımının alt sınırı
+            max_timeout: Uyarlanabilir zaman aşımının üst sınırı
+        """
+        self.logger = logger
+        self.concurrency = self._limit_concurrency(concurrency)
+        self.rate = rate
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+
+        # RFC 6298 tarzı RTT kestirimi
+        self.timeout = timeout
+        self.srtt = None
+        self.rttvar = None
+
+    @classmethod
+    def from_config(cls, logger, settings):
+        """config.json 'port_scan' bölümünden tarayıcı oluştur"""
+        return cls(
+            logger,
+            concurrency=settings.get('concurrency', 512),
+            rate=settings.get('rate', 0),
+            timeout=settings.get('timeout', 0.3),
+            min_timeout=settings.get('min_timeout', 0.05),
+            max_timeout=settings.get('max_timeout', 1.5)
+        )
+
+    @staticmethod
+    def _limit_concurrency(concurrency):
+        """Eşzamanlılığı işletim sistemi soket sınırlarına göre kısıtla"""
+        limit = max(1, int(concurrency))
+
+        if sys.platform == 'win32':
+            # select() Windows'ta 512 soketle sınırlı
+            return min(limit, 500)
+
+        try:
+            import resource
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft != resource.RLIM_INFINITY:
+                limit = min(limit, max(1, soft - 64))
+        except (ImportError, ValueError, OSError):
+            pass
+
+        return limit
+
+    def _observe_rtt(self, rtt):
+        """Ölçülen bağlantı süresiyle zaman aşımını güncelle"""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+
+        self.timeout = min(self.max_timeout, max(self.min_timeout, self.srtt + 4 * self.rttvar))
+
+    def scan(self, targets, ports, udp_ports=(), deadline=None):
+        """
+        Hedeflerdeki portları eşzamanlı tara
+
+        Args:
+            targets: IPv4/IPv6 adresleri
+            ports: TCP port numaraları
+            udp_ports: UDP port numaraları (UDP_PROBES içindekiler sorgulanır)
+            deadline: time.monotonic() cinsinden bitiş zamanı (None = sınırsız)
+
+        Returns:
+            list: Açık portlar (PortResult)
+        """
+        probes = []
+        for host in targets:
+            family = socket.AF_INET6 if ':' in host else socket.AF_INET
+            probes.extend((family, host, port, 'tcp') for port in ports)
+            probes.extend((family, host, port, 'udp') for port in udp_ports)
+
+        start = time.monotonic()
+        results = self._run(iter(probes), deadline)
+        self.logger.info(
+            "Port taraması: %s deneme, %s açık, %.2f saniye (zaman aşımı %.3f s)",
+            len(probes), len(results), time.monotonic() - start, self.timeout
+        )
+
+        results.sort(key=lambda r: (r.protocol, r.port, r.host))
+        return results
+
+    def _run(self, probes, deadline):
+        """Seçici döngüsü: soketleri açar, yanıtları toplar, süresi dolanları kapatır"""
+        selector = selectors.DefaultSelector()
+        active = {}
+        order = deque()
+        results = []
+
+        tokens = float(self.rate)
+        last_refill = time.monotonic()
+        pending = next(probes, None)
+
+        try:
+            while pending is not None or active:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    self.logger.warning("Port taraması süre sınırına ulaştı")
+                    break
+
+                # Hız sınırı (token bucket)
+                if self.rate:
+                    tokens = min(float(self.rate), tokens + (now - last_refill) * self.rate)
+                    last_refill = now
+
+                # Yeni denemeler başlat
+                while pending is not None and len(active) < self.concurrency:
+                    if self.rate and tokens < 1:
+                        break
+
+                    family, host, port, protocol = pending
+                    try:
+                        sock = self._open(family, host, port, protocol)
+                    except OSError as e:
+                        if e.errno in (errno.EMFILE, errno.ENFILE) and active:
+                            break  # Soketler kapanınca tekrar dene
+                        pending = next(probes, None)
+                        continue
+
+                    tokens -= 1
+                    pending = next(probes, None)
+
+                    if sock is True:
+                        results.append(PortResult(host, port, protocol, self._service(port, protocol)))
+                        self._observe_rtt(time.monotonic() - now)
+                        continue
+                    if sock is None:
+                        self._observe_rtt(time.monotonic() - now)
+                        continue
+
+                    events = selectors.EVENT_WRITE if protocol == 'tcp' else selectors.EVENT_READ
+                    selector.register(sock, events, (host, port, protocol, now))
+                    active[sock.fileno()] = sock
+                    order.append((now, sock))
+
+                if not active:
+                    if pending is not None and self.rate:
+                        time.sleep(1.0 / self.rate)
+                    continue
+
+                # Yanıtları işle
+                wait = max(0.0, min(self.timeout, order[0][0] + self.timeout - now)) if order else self.timeout
+                for key, _ in selector.select(timeout=wait):
+                    sock = key.fileobj
+                    host, port, protocol, started = key.data
+
+                    if self._is_open(sock, protocol):
+                        results.append(PortResult(host, port, protocol, self._service(port, protocol)))
+                        self._observe_rtt(time.monotonic() - started)
+                    elif protocol == 'tcp':
+                        self._observe_rtt(time.monotonic() - started)
+
+                    self._close(selector, active, sock)
+
+                # Süresi dolanlar filtrelenmiş / yanıtsız kabul edilir
+                now = time.monotonic()
+                while order:
+                    started, sock = order[0]
+                    if sock.fileno() != -1 and now - started < self.timeout:
+                        break
+                    order.popleft()
+                    if sock.fileno() != -1:
+                        self._close(selector, active, sock)
+        finally:
+            for sock in list(active.values()):
+                self._close(selector, active, sock)
+            selector.close()
+
+        return results
+
+    @staticmethod
+    def _open(family, host, port, protocol):
+        """
+        Bloklamayan bağlantı denemesi başlat
+
+        Returns:
+            socket | True | None: Bekleyen soket, hemen açık (True) veya hemen kapalı (None)
+        """
+        if protocol == 'udp':
+            sock = socket.socket(family, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            try:
+                # connect(): ICMP port unreachable yanıtları recv() hatası olarak döner
+                sock.connect((host, port))
+                sock.send(UDP_PROBES.get(port, ('', b'\x00'))[1])
+            except OSError:
+                sock.close()
+                return None
+            return sock
+
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        err = sock.connect_ex((host, port))
+
+        if err == 0:
+            sock.close()
+            return True
+        if err in _IN_PROGRESS:
+            return sock
+
+        sock.close()
+        return None
+
+    @staticmethod
+    def _is_open(sock, protocol):
+        """Soket olayı açık port anlamına mı geliyor"""
+        if protocol == 'tcp':
+            return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+
+        try:
+            return bool(sock.recv(4096))
+        except OSError:
+            return False
+
+    @staticmethod
+    def _close(selector, active, sock):
+        """Soketi seçiciden çıkar ve kapat"""
+        fd = sock.fileno()
+        if active.get(fd) is sock:
+            del active[fd]
+            try:
+                selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+        sock.close()
+
+    @staticmethod
+    def _service(port, protocol):
+        """Port için bilinen servis adı"""
+        if protocol == 'udp':
+            return UDP_PROBES.get(port, ('',))[0]
+        return RISKY_PORTS.get(port, '')
@@ -0,0 +1,232 @@
+"""
+Kontrol Kayıt Defteri Modülü
+Güvenlik kontrollerinin bildirimsel tanımları ve kontrol paketlerinin tembel yüklenmesi
+"""
+
+import importlib
+import logging
+import os
+import sys
+from collections import namedtuple
+
+
+CheckSpec = namedtuple('CheckSpec', [
+    'id',         # Kararlı kontrol kimliği (ör. 'smb_v1')
+    'name',       # Arayüzde gösterilen ad
+    'func',       # async def check(ctx) -> dict | None
+    'platform',   # 'Windows', 'Linux', 'Darwin' veya 'any'
+    'cost',       # Beklenen süre (saniye)
+    'timeout',    # Kontrol başına süre bütçesi (None = yapılandırmadaki check_timeout)
+    'sources',    # Toplu okunan veri kaynakları ({'registry': ..., 'services': ...})
+    'risk',       # Kontrolün üretebileceği en yüksek risk seviyesi
+    'depends',    # Önce tamamlanması gereken kontrol kimlikleri
+    'order'       # Sonuç listesindeki sıra
+])
+
+# Yerleşik kontrol paketleri: (modül, platform)
+BUILTIN_PACKS = [
+    ('modules.packs.windows', 'Windows'),
+    ('modules.packs.network', 'any')
+]
+
+# Harici paketler için entry point grubu; ad 'Windows:paket' biçimindeyse
+# yalnızca o platformda yüklenir
+ENTRY_POINT_GROUP = 'securityscanner.checks'
+
+
+class CheckRegistry:
+    """Kontrol tanımlarının kayıt defteri"""
+
+    def __init__(self, packs=None):
+        self._specs = {}
+        self._packs = list(BUILTIN_PACKS if packs is None else packs)
+        self._loaded = set()
+        self._entry_points_loaded = set()
+
+    def register(self, spec):
+        """Kontrol tanımı ekle"""
+        if spec.id in self._specs and self._specs[spec.id].func is not spec.func:
+            raise ValueError(f"Kontrol kimliği zaten kayıtlı: {spec.id}")
+        self._specs[spec.id] = spec
+        return spec
+
+    def check(self, check_id, name, platform='any', cost=1.0, risk='medium',
+              depends=(), order=100, timeout=None):
+        """
+        Kontrol fonksiyonunu kaydeden dekoratör
+
+        Args:
+            check_id: Kararlı kontrol kimliği
+            name: Arayüzde gösterilen ad
+            platform: Kontrolün çalıştığı platform ('any' = hepsi)
+            cost: Beklenen süre (saniye)
+            risk: Üretilebilecek en yüksek risk seviyesi
+            depends: Önce tamamlanması gereken kontrol kimlikleri
+            order: Sonuç listesindeki sıra
+            timeout: Kontrol başına süre bütçesi (saniye)
+        """
+        def decorator(func):
+            self.register(CheckSpec(
+                id=check_id,
+                name=name,
+                func=func,
+                platform=platform,
+                cost=cost,
+                timeout=timeout,
+                sources=getattr(func, 'data_sources', {}),
+                risk=risk,
+                depends=tuple(depends),
+                order=order
+            ))
+            func.check_id = check_id
+            return func
+        return decorator
+
+    def add_pack(self, module_name, platform='any'):
+        """Yüklenecek kontrol paketi ekle"""
+        if (module_name, platform) not in self._packs:
+            self._packs.append((module_name, platform))
+
+    def load_packs(self, system, logger=None):
+        """
+        Platformla eşleşen paketleri içe aktar
+
+        Eşleşmeyen paketler hiç içe aktarılmaz (ör. Linux'ta Windows kontrolleri).
+
+        Args:
+            system: platform.system() değeri
+            logger: Harici paket hataları için Logger (varsayılan: modül logger'ı)
+        """
+        for module_name, pack_platform in self._packs:
+            if module_name in self._loaded or not _matches(pack_platform, system):
+                continue
+            importlib.import_module(module_name)
+            self._loaded.add(module_name)
+
+        self._load_entry_points(system, logger or logging.getLogger(__name__))
+
+    def _load_entry_points(self, system, logger):
+        """
+        Kurulu dağıtımların bildirdiği harici paketleri yükle
+
+        Yüklenemeyen paket loglanıp atlanır; taramanın geri kalanı etkilenmez.
+        """
+        if system in self._entry_points_loaded:
+            return
+        self._entry_points_loaded.add(system)
+
+        # importlib.metadata içe aktarması başlangıç süresini katlar; grubu
+        # bildiren dağıtım yoksa hiç yüklenmez
+        if not _declares_entry_points(ENTRY_POINT_GROUP):
+            return
+
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            return
+
+        try:
+            eps = entry_points()
+            group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, 'select') \
+                else eps.get(ENTRY_POINT_GROUP, [])
+        except Exception:
+            return
+
+        for ep in group:
+            pack_platform, sep, _ = ep.name.partition(':')
+            if sep and not _matches(pack_platform, system):
+                continue
+            if ep.value in self._loaded:
+                continue
+            # Tekrar denenmez; bozuk paket her taramada yeniden loglanmasın
+            self._loaded.add(ep.value)
+            try:
+                ep.load()
+            except Exception as e:
+                logger.error("Kontrol paketi yüklenemedi: %s: %s", ep.name, e)
+
+    def specs(self, system, ids=None, logger=None):
+        """
+        Platformda çalışacak kontrol tanımlarını sırayla döndür
+
+        Args:
+            system: platform.system() değeri
+            ids: Yalnızca bu kimlikler (None = hepsi)
+            logger: Paket yükleme hataları için Logger
+
+        Returns:
+            list: CheckSpec listesi
+        """
+        self.load_packs(system, logger)
+
+        selected = [
+            spec for spec in self._specs.values()
+            if _matches(spec.platform, system) and (ids is None or spec.id in ids)
+        ]
+
+        if ids is not None:
+            unknown = set(ids) - {spec.id for spec in selected}
+            if unknown:
+                raise KeyError(f"Bilinmeyen veya bu platformda çalışmayan kontroller: {', '.join(sorted(unknown))}")
+
+        return sorted(selected, key=lambda spec: (spec.order, spec.id))
+
+    def get(self, check_id):
+        """Kimliğe göre kontrol tanımı (yüklenmediyse None)"""
+        return self._specs.get(check_id)
+
+
+def _declares_entry_points(group):
+    """
+    sys.path'teki dağıtımlardan biri grubu bildiriyor mu (hızlı ön kontrol)
+
+    Yalnızca *.dist-info / *.egg-info altındaki entry_points.txt dosyalarında
+    '[grup]' başlığı aranır.
+
+    importlib.metadata de dağıtımları sys.path girdilerindeki aynı dizinlerden
+    bulur: PEP 660 düzenlenebilir kurulumlar site-packages'a .dist-info yazar,
+    'setup.py develop' kurulumlarının .egg-info'su .pth ile sys.path'e eklenen
+    kaynak dizinindedir, .egg dizinlerinde EGG-INFO okunur. Ön kontrol yalnızca
+    yanlış pozitif verebilir (sıkıştırılmış .egg); o durumda tam arama yapılır.
+    """
+    header = f"[{group}]"
+
+    for path in sys.path:
+        if path.endswith('.egg'):
+            if not os.path.isdir(path):
+                return True
+            try:
+                with open(os.path.join(path, 'EGG-INFO', 'entry_points.txt'), 'r', encoding='utf-8') as f:
+                    if header in f.read():
+                        return True
+            except OSError:
+                pass
+            continue
+
+        try:
+            entries = os.scandir(path or '.')
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(('.dist-info', '.egg-info')):
+                    continue
+                try:
+                    with open(os.path.join(entry.path, 'entry_points.txt'), 'r', encoding='utf-8') as f:
+                        if header in f.read():
+                            return True
+                except OSError:
+                    continue
+
+    return False
+
+
+def _matches(spec_platform, system):
+    """Platform eşleşmesi (büyük/küçük harf duyarsız)"""
+    return spec_platform == 'any' or spec_platform.lower() == str(system).lower()
+
+
+# Varsayılan kayıt defteri ve dekoratör
+registry = CheckRegistry()
+check = registry.check
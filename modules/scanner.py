@@ -1,294 +1,677 @@
-"""
-Güvenlik Tarama Motoru
-Ana tarama mantığı ve kontrol yönetimi
-"""
-
-import time
-import platform
-from datetime import datetime
-import json
-import os
-
-from modules.checks import SecurityChecks
-
-
-class SecurityScanner:
-    """Güvenlik tarama motoru"""
-    
-    def __init__(self, logger):
-        self.logger = logger
-        self.checks = SecurityChecks(logger)
-        self.last_scan_result = None
-        self.scan_history = []
-        self.config = self.load_config()
-        
-        # Veri klasörünü oluştur
-        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        os.makedirs(self.data_dir, exist_ok=True)
-        
-        # Geçmişi yükle
-        self.load_history()
-    
-    def load_config(self):
-        """Yapılandırmayı yükle"""
-        default_config = {
-            'auto_report': False,
-            'report_format': 'txt',
-            'log_level': 'INFO',
-            'detailed_scan': True,
-            'scan_timeout': 30
-        }
-        
-        try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), 
-                'data', 
-                'config.json'
-            )
-            
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    default_config.update(loaded_config)
-                    self.logger.info("Yapılandırma yüklendi")
-        except Exception as e:
-            self.logger.error(f"Yapılandırma yüklenemedi: {e}")
-        
-        return default_config
-    
-    def save_config(self):
-        """Yapılandırmayı kaydet"""
-        try:
-            config_path = os.path.join(self.data_dir, 'config.json')
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            self.logger.info("Yapılandırma kaydedildi")
-        except Exception as e:
-            self.logger.error(f"Yapılandırma kaydedilemedi: {e}")
-    
-    def load_history(self):
-        """Tarama geçmişini yükle"""
-        try:
-            history_path = os.path.join(self.data_dir, 'scan_history.json')
-            
-            if os.path.exists(history_path):
-                with open(history_path, 'r', encoding='utf-8') as f:
-                    self.scan_history = json.load(f)
-                    self.logger.info(f"{len(self.scan_history)} tarama geçmişi yüklendi")
-        except Exception as e:
-            self.logger.error(f"Geçmiş yüklenemedi: {e}")
-            self.scan_history = []
-    
-    def save_history(self):
-        """Tarama geçmişini kaydet"""
-        try:
-            history_path = os.path.join(self.data_dir, 'scan_history.json')
-            with open(history_path, 'w', encoding='utf-8') as f:
-                json.dump(self.scan_history, f, indent=4, ensure_ascii=False)
-            self.logger.info("Tarama geçmişi kaydedildi")
-        except Exception as e:
-            self.logger.error(f"Geçmiş kaydedilemedi: {e}")
-    
-    def perform_scan(self, progress_callback=None):
-        """
-        Güvenlik taraması yap
-        
-        Args:
-            progress_callback: İlerleme bildirimi için callback fonksiyonu
-            
-        Returns:
-            dict: Tarama sonuçları
-        """
-        self.logger.info("Güvenlik taraması başlatıldı")
-        start_time = time.time()
-        
-        # Kontrol listesi
-        check_list = [
-            ("Windows Defender", self.checks.check_windows_defender),
-            ("Güvenlik Duvarı", self.checks.check_firewall),
-            ("Açık Portlar", self.checks.check_open_ports),
-            ("Administrator Hesabı", self.checks.check_admin_account),
-            ("Şifre Politikası", self.checks.check_password_policy),
-            ("Otomatik Güncellemeler", self.checks.check_auto_updates),
-            ("Paylaşılan Klasörler", self.checks.check_shared_folders),
-            ("UAC Ayarları", self.checks.check_uac_settings),
-            ("Uzak Masaüstü", self.checks.check_remote_desktop),
-            ("USB Otomatik Çalıştırma", self.checks.check_usb_autorun),
-            ("BitLocker Şifreleme", self.checks.check_bitlocker),
-            ("SMBv1 Protokol", self.checks.check_smb_v1),
-            ("PowerShell Logging", self.checks.check_powershell_logging),
-            ("Windows Script Host", self.checks.check_wsh),
-            ("Misafir Hesabı", self.checks.check_guest_account),
-            ("Boş Şifreler", self.checks.check_blank_passwords),
-            ("Ekran Koruyucu Şifre", self.checks.check_screen_saver_password),
-            ("Ağ Keşfi", self.checks.check_network_discovery),
-        ]
-        
-        vulnerabilities = []
-        total_checks = len(check_list)
-        
-        # Her kontrolü çalıştır
-        for idx, (check_name, check_func) in enumerate(check_list, 1):
-            self.logger.info(f"Kontrol yapılıyor: {check_name}")
-            
-            # İlerleme callback'i varsa çağır
-            if progress_callback:
-                progress_callback(check_name, idx, total_checks)
-            
-            try:
-                # Kontrolü çalıştır
-                result = check_func()
-                
-                if result:
-                    vulnerabilities.append(result)
-                    self.logger.warning(f"Güvenlik açığı bulundu: {result['message']}")
-                
-                # Gerçekçi tarama süresi için kısa bekleme
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.logger.error(f"{check_name} kontrolünde hata: {e}")
-        
-        # Tarama süresi
-        duration = time.time() - start_time
-        
-        # Tarama bilgileri
-        scan_info = {
-            'date': datetime.now().strftime('%d.%m.%Y %H:%M:%S'),
-            'system': f"{platform.system()} {platform.release()}",
-            'duration': duration,
-            'total_checks': total_checks,
-            'vulnerabilities_found': len(vulnerabilities)
-        }
-        
-        # Sonuçları kaydet
-        self.last_scan_result = {
-            'vulnerabilities': vulnerabilities,
-            'scan_info': scan_info
-        }
-        
-        # Geçmişe ekle
-        history_entry = {
-            'date': scan_info['date'],
-            'vulnerability_count': len(vulnerabilities),
-            'duration': duration,
-            'system': scan_info['system']
-        }
-        self.scan_history.append(history_entry)
-        self.save_history()
-        
-        self.logger.info(f"Tarama tamamlandı: {len(vulnerabilities)} açık bulundu, {duration:.2f} saniye")
-        
-        # Otomatik rapor oluşturma
-        if self.config.get('auto_report', False):
-            self.generate_report(self.config.get('report_format', 'txt'))
-        
-        return self.last_scan_result
-    
-    def get_history(self):
-        """Tarama geçmişini döndür"""
-        return self.scan_history
-    
-    def get_config(self):
-        """Yapılandırmayı döndür"""
-        return self.config
-    
-    def update_config(self, key, value):
-        """Yapılandırmayı güncelle"""
-        self.config[key] = value
-        self.save_config()
-        self.logger.info(f"Yapılandırma güncellendi: {key} = {value}")
-    
-    def generate_report(self, format_type='txt'):
-        """
-        Rapor oluştur
-        
-        Args:
-            format_type: Rapor formatı ('txt', 'json', 'html')
-            
-        Returns:
-            str: Oluşturulan rapor dosyasının yolu veya None
-        """
-        if not self.last_scan_result:
-            self.logger.warning("Rapor oluşturulamadı: Tarama sonucu yok")
-            return None
-        
-        try:
-            from utils.report import ReportGenerator
-            
-            report_gen = ReportGenerator(self.logger)
-            filename = report_gen.generate(
-                self.last_scan_result,
-                format_type
-            )
-            
-            self.logger.info(f"Rapor oluşturuldu: {filename}")
-            return filename
-            
-        except ImportError:
-            self.logger.error("ReportGenerator modülü yüklenemedi")
-            return None
-        except Exception as e:
-            self.logger.error(f"Rapor oluşturulamadı: {e}")
-            return None
-    
-    def get_last_scan(self):
-        """Son tarama sonucunu döndür"""
-        return self.last_scan_result
-    
-    def clear_history(self):
-        """Tarama geçmişini temizle"""
-        self.scan_history = []
-        self.save_history()
-        self.logger.info("Tarama geçmişi temizlendi")
-    
-    def export_scan_data(self, filepath):
-        """
-        Tarama verilerini dışa aktar
-        
-        Args:
-            filepath: Dışa aktarılacak dosya yolu
-        """
-        try:
-            export_data = {
-                'last_scan': self.last_scan_result,
-                'history': self.scan_history,
-                'config': self.config,
-                'export_date': datetime.now().strftime('%d.%m.%Y %H:%M:%S')
-            }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=4, ensure_ascii=False)
-            
-            self.logger.info(f"Tarama verileri dışa aktarıldı: {filepath}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Veri dışa aktarılamadı: {e}")
-            return False
-    
-    def get_statistics(self):
-        """
-        Tarama istatistiklerini döndür
-        
-        Returns:
-            dict: İstatistikler
-        """
-        if not self.scan_history:
-            return {
-                'total_scans': 0,
-                'total_vulnerabilities': 0,
-                'average_vulnerabilities': 0,
-                'last_scan_date': 'Henüz tarama yapılmadı'
-            }
-        
-        total_vulns = sum(scan.get('vulnerability_count', 0) for scan in self.scan_history)
-        avg_vulns = total_vulns / len(self.scan_history) if self.scan_history else 0
-        
-        return {
-            'total_scans': len(self.scan_history),
-            'total_vulnerabilities': total_vulns,
-            'average_vulnerabilities': round(avg_vulns, 2),
-            'last_scan_date': self.scan_history[-1].get('date', 'Bilinmiyor') if self.scan_history else 'Bilinmiyor',
-            'most_vulnerable_scan': max(self.scan_history, key=lambda x: x.get('vulnerability_count', 0)) if self.scan_history else None
-        }
\ No newline at end of file
+"""
+Güvenlik Tarama Motoru
+Ana tarama mantığı ve kontrol yönetimi
+"""
+
+import asyncio
+import time
+import platform
+from datetime import datetime
+import json
+import os
+
+from modules.checks import SecurityChecks, CHECK_DEADLINE
+from modules.registry import registry
+from modules.costmodel import CostModel
+from modules.history import HistoryStore
+from modules.archive import FindingsArchive
+from modules.diff import diff_scans, fingerprint
+
+REPORT_FORMATS = ('txt', 'json', 'html')
+
+
+class SecurityScanner:
+    """Güvenlik tarama motoru"""
+    
+    def __init__(self, logger):
+        self.logger = logger
+        self.last_scan_result = None
+        self._history = None
+        self._archive = None
+        self.last_scan_position = None
+        self.config = self.load_config()
+        self.checks = SecurityChecks(logger, self.config)
+        
+        # Veri klasörünü oluştur
+        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        os.makedirs(self.data_dir, exist_ok=True)
+        
+        # Geçmiş kontrol sürelerinden beklenen maliyetler
+        self.cost_model = CostModel(logger, os.path.join(self.data_dir, 'check_costs.json'))
+    
+    def load_config(self):
+        """Yapılandırmayı yükle"""
+        default_config = {
+            'auto_report': False,
+            'report_format': 'txt',
+            'log_level': 'INFO',
+            'detailed_scan': True,
+            'scan_timeout': 30,
+            'check_timeout': 15,
+            'check_timeouts': {},
+            'max_workers': 8,
+            'persistent_shell': True,
+            'max_processes': 4,
+            'max_output_bytes': 1048576,
+            'rollup_retention': {'hour': 14, 'day': 730, 'week': 0},
+            'report_retention': {'keep': 0, 'days': 0, 'compress_days': 30},
+            'port_scan': {
+                'method': 'auto',
+                'targets': ['127.0.0.1'],
+                'ports': 'risky',
+                'include_ipv6': True,
+                'include_interfaces': False,
+                'udp': False,
+                'concurrency': 512,
+                'rate': 0,
+                'timeout': 0.3
+            }
+        }
+        
+        try:
+            config_path = os.path.join(
+                os.path.dirname(os.path.dirname(__file__)), 
+                'data', 
+                'config.json'
+            )
+            
+            if os.path.exists(config_path):
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    loaded_config = json.load(f)
+                    default_config.update(loaded_config)
+                    self.logger.info("Yapılandırma yüklendi")
+        except Exception as e:
+            self.logger.error("Yapılandırma yüklenemedi: %s", e)
+        
+        return default_config
+    
+    def save_config(self):
+        """Yapılandırmayı kaydet"""
+        try:
+            config_path = os.path.join(self.data_dir, 'config.json')
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            self.logger.info("Yapılandırma kaydedildi")
+        except Exception as e:
+            self.logger.error("Yapılandırma kaydedilemedi: %s", e)
+    
+    @property
+    def history(self):
+        """Tarama geçmişi deposu (ilk erişimde açılır, eski JSON geçmişi aktarılır)"""
+        if self._history is None:
+            self._history = HistoryStore(
+                self.logger,
+                os.path.join(self.data_dir, 'scan_history.db'),
+                rollup_retention=self.config.get('rollup_retention')
+            )
+            self._history.migrate_json(os.path.join(self.data_dir, 'scan_history.json'))
+        return self._history
+    
+    @property
+    def archive(self):
+        """Sütunlu bulgu arşivi (ilk erişimde açılır)"""
+        if self._archive is None:
+            self._archive = FindingsArchive(self.logger, os.path.join(self.data_dir, 'archive'))
+        return self._archive
+    
+    def add_history(self, entry, vulnerabilities=()):
+        """
+        Geçmişe kayıt ekle ve zaman özetlerini güncelle
+        
+        Args:
+            entry: Geçmiş kaydı
+            vulnerabilities: Taramada bulunan açıklar (özetler ve bulgu arşivi için)
+        
+        Returns:
+            int: Geçmiş kaydının kimliği veya None
+        """
+        findings = [(vuln.get('check_id'), vuln.get('risk', 'medium')) for vuln in vulnerabilities]
+        scan_id = None
+        
+        try:
+            scan_id = self.history.append(entry, findings)
+            self.history.prune_rollups()
+        except Exception as e:
+            self.logger.error("Geçmiş kaydedilemedi: %s", e)
+        
+        try:
+            self.last_scan_position = self.archive.append(entry['ts'], vulnerabilities)
+        except Exception as e:
+            self.logger.error("Bulgular arşivlenemedi: %s", e)
+        
+        return scan_id
+    
+    def perform_scan(self, progress_callback=None, check_ids=None, record=True):
+        """
+        Güvenlik taraması yap
+        
+        perform_scan_async çekirdeğini yeni bir event loop içinde çalıştıran
+        senkron sarmalayıcıdır; çalışan bir event loop içinden çağrılmamalıdır.
+        
+        Args:
+            progress_callback: İlerleme bildirimi için callback fonksiyonu
+            check_ids: Yalnızca bu kontrolleri çalıştır (None = platformdaki tümü)
+            record: Geçmişe ve maliyet modeline kaydet
+        
+        Returns:
+            dict: Tarama sonuçları
+        """
+        return asyncio.run(self.perform_scan_async(progress_callback, check_ids, record))
+    
+    async def perform_scan_async(self, progress_callback=None, check_ids=None, record=True):
+        """
+        Güvenlik taraması yap (asyncio)
+        
+        Args:
+            progress_callback: İlerleme bildirimi için callback fonksiyonu
+            check_ids: Yalnızca bu kontrolleri çalıştır (None = platformdaki tümü)
+            record: Geçmişe ve maliyet modeline kaydet
+        
+        Returns:
+            dict: Tarama sonuçları
+        """
+        self.logger.info("Güvenlik taraması başlatıldı")
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        
+        # Komut önbelleği tarama kapsamlıdır
+        self.checks.reset_cache()
+        
+        # Platformla eşleşen kontrol tanımları (paketler burada tembel yüklenir)
+        specs = registry.specs(self.checks.system, check_ids, self.logger)
+        
+        # Tüm tarama için süre bütçesi (0 = sınırsız)
+        scan_timeout = float(self.config.get('scan_timeout', 30) or 0)
+        scan_deadline = time.monotonic() + scan_timeout if scan_timeout > 0 else None
+        
+        # Kayıt defteri / servis verilerini kaynak türü başına tek çağrıda oku
+        await asyncio.ensure_future(self._prefetch(specs, scan_deadline))
+        
+        total_checks = len(specs)
+        results = [None] * total_checks
+        statuses = {}
+        durations = {}
+        max_workers = max(1, int(self.config.get('max_workers', 8)))
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        predicted = {spec.id: self.cost_model.expected(spec) for spec in specs}
+        predicted_duration = self.cost_model.predict_makespan(specs, max_workers)
+        
+        # Bağımlılıklar: seçili olmayan kontrollere bağımlılık yok sayılır
+        done_events = {spec.id: asyncio.Event() for spec in specs}
+        
+        async def run_indexed(idx, spec):
+            try:
+                for dependency in spec.depends:
+                    if dependency in done_events:
+                        await done_events[dependency].wait()
+                
+                async with semaphore:
+                    check_start = time.perf_counter()
+                    deadline = self._check_deadline(spec, scan_deadline)
+                    
+                    # Görev kendi bağlam kopyasında çalışır; komutlar bu sınırı görür
+                    CHECK_DEADLINE.set(deadline)
+                    
+                    try:
+                        status, result = await asyncio.wait_for(
+                            self._run_check(spec),
+                            None if deadline is None else max(0.0, deadline - time.monotonic())
+                        )
+                    except asyncio.TimeoutError:
+                        self.logger.warning("%s kontrolü süre sınırını aştı ve iptal edildi", spec.name)
+                        status, result = 'timeout', None
+                    
+                    statuses[spec.id] = status
+                    durations[spec.id] = time.perf_counter() - check_start
+                    return idx, spec, result
+            finally:
+                done_events[spec.id].set()
+        
+        # En uzun beklenen kontroller önce başlar (semafor FIFO sırasıyla verir);
+        # sonuçlar kayıt sırasına göre toplanır
+        index = {spec.id: idx for idx, spec in enumerate(specs)}
+        tasks = [
+            asyncio.ensure_future(run_indexed(index[spec.id], spec))
+            for spec in self.cost_model.dispatch_order(specs)
+        ]
+        
+        for completed, task in enumerate(asyncio.as_completed(tasks), 1):
+            idx, spec, result = await task
+            results[idx] = result
+            
+            # İlerleme callback'i varsa çağır
+            if progress_callback:
+                progress_callback(spec.name, completed, total_checks)
+        
+        vulnerabilities = [result for result in results if result]
+        
+        # İptal edilen kontrollerden arta kalan komutlar da sonlandırılsın
+        await self.checks.cancel_pending()
+        
+        cache_stats = self.checks.get_cache_stats()
+        executor_stats = self.checks.runner.get_stats()
+        self.checks.reset_cache()
+        
+        timed_out = [spec.name for spec in specs if statuses.get(spec.id) == 'timeout']
+        if timed_out:
+            self.logger.warning("Süre sınırını aşan kontroller: %s", ', '.join(timed_out))
+        
+        check_timings = self._compare_timings(predicted, durations)
+        
+        # Yarıda kesilen kontrollerin süresi gerçek maliyeti yansıtmaz
+        if record:
+            self.cost_model.update({
+                check_id: d for check_id, d in durations.items() if statuses.get(check_id) != 'timeout'
+            })
+        
+        # Tarama süresi
+        duration = time.time() - start_time
+        
+        # Tarama bilgileri
+        scan_info = {
+            'date': datetime.now().strftime('%d.%m.%Y %H:%M:%S'),
+            'host': platform.node(),
+            'system': f"{platform.system()} {platform.release()}",
+            'duration': duration,
+            'total_checks': total_checks,
+            'vulnerabilities_found': len(vulnerabilities),
+            'command_cache': cache_stats,
+            'executor': executor_stats,
+            'predicted_duration': predicted_duration,
+            'check_timings': check_timings,
+            'check_status': {spec.id: statuses.get(spec.id, 'timeout') for spec in specs},
+            'timed_out': timed_out,
+            'scan_timeout': scan_timeout
+        }
+        
+        # Sonuçları kaydet
+        self.last_scan_result = {
+            'vulnerabilities': vulnerabilities,
+            'scan_info': scan_info
+        }
+        
+        # Geçmişe ekle
+        risk_counts = {}
+        for vuln in vulnerabilities:
+            risk = vuln.get('risk', 'medium').lower()
+            risk_counts[risk] = risk_counts.get(risk, 0) + 1
+        
+        history_entry = {
+            'ts': start_time,
+            'host': scan_info['host'],
+            'date': scan_info['date'],
+            'vulnerability_count': len(vulnerabilities),
+            'duration': duration,
+            'system': scan_info['system'],
+            'risk_counts': risk_counts,
+            'check_durations': {check_id: round(d, 3) for check_id, d in durations.items()}
+        }
+        if record:
+            # Raporlar dizine tarama kimliğiyle kaydedilir
+            scan_info['scan_id'] = await loop.run_in_executor(None, self.add_history, history_entry, vulnerabilities)
+            await loop.run_in_executor(None, self.cost_model.save)
+        
+        self.logger.info("Tarama tamamlandı: %s açık bulundu, %.2f saniye", len(vulnerabilities), duration)
+        
+        # Otomatik rapor oluşturma ('all' veya liste: tüm formatlar tek geçişte)
+        if self.config.get('auto_report', False):
+            report_format = self.config.get('report_format', 'txt')
+            if report_format == 'all' or isinstance(report_format, list):
+                formats = REPORT_FORMATS if report_format == 'all' else report_format
+                await loop.run_in_executor(None, self.generate_reports, formats)
+            else:
+                await loop.run_in_executor(None, self.generate_report, report_format)
+        
+        return self.last_scan_result
+    
+    async def _prefetch(self, specs, deadline):
+        """Toplu veri okumasını tarama süre sınırı içinde çalıştır (ayrı görevde)"""
+        CHECK_DEADLINE.set(deadline)
+        await self.checks.prefetch(specs)
+    
+    def _check_deadline(self, spec, scan_deadline):
+        """
+        Kontrolün bitiş zamanı
+        
+        Bütçe sırası: config 'check_timeouts' > kontrol tanımı > config 'check_timeout'.
+        Hiçbir kontrol tarama süre sınırını aşamaz.
+        
+        Returns:
+            float | None: time.monotonic() cinsinden bitiş zamanı (None = sınırsız)
+        """
+        budget = self.config.get('check_timeouts', {}).get(spec.id, spec.timeout)
+        if budget is None:
+            budget = self.config.get('check_timeout', 15)
+        
+        deadline = time.monotonic() + float(budget) if budget else None
+        
+        if scan_deadline is not None:
+            deadline = scan_deadline if deadline is None else min(deadline, scan_deadline)
+        
+        return deadline
+    
+    async def _run_check(self, spec):
+        """
+        Tek bir kontrolü çalıştır
+        
+        Args:
+            spec: Kontrol tanımı (CheckSpec)
+        
+        Returns:
+            tuple: (durum, bulunan güvenlik açığı veya None);
+                   durum 'ok', 'finding' veya 'error'
+        """
+        self.logger.info("Kontrol yapılıyor: %s", spec.name)
+        
+        try:
+            result = await spec.func(self.checks)
+            
+            if result:
+                result.setdefault('check_id', spec.id)
+                result['fingerprint'] = fingerprint(spec.id, result.get('evidence'))
+                self.logger.warning("Güvenlik açığı bulundu: %s", result['message'])
+                return 'finding', result
+            
+            return 'ok', None
+        
+        except Exception as e:
+            self.logger.error("%s kontrolünde hata: %s", spec.name, e)
+            return 'error', None
+    
+    def _compare_timings(self, predicted, durations, tolerance=2.0, min_seconds=0.5):
+        """
+        Tahmini ve gerçekleşen kontrol sürelerini karşılaştır
+        
+        Beklenenden belirgin şekilde yavaşlayan kontroller loglanır.
+        
+        Returns:
+            dict: {check_id: {'predicted': saniye, 'actual': saniye}}
+        """
+        timings = {}
+        
+        for check_id, actual in durations.items():
+            expected = predicted.get(check_id, 0.0)
+            timings[check_id] = {
+                'predicted': round(expected, 3),
+                'actual': round(actual, 3)
+            }
+            
+            if actual >= min_seconds and actual > expected * tolerance:
+                self.logger.warning(
+                    "%s kontrolü beklenenden yavaş: %.2f s (tahmin %.2f s)", check_id, actual, expected
+                )
+        
+        return timings
+    
+    def close(self):
+        """Tarayıcı kaynaklarını (kalıcı kabuk oturumu, geçmiş veritabanı vb.) serbest bırak"""
+        self.checks.close()
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+    
+    def get_history(self, limit=10, offset=0, start=None, end=None, host=None):
+        """
+        Tarama geçmişini yeniden eskiye sayfalı döndür
+        
+        Args:
+            limit: Sayfa boyutu
+            offset: Atlanacak kayıt
+            start: Başlangıç zamanı (epoch, dahil)
+            end: Bitiş zamanı (epoch, hariç)
+            host: Yalnızca bu uç noktanın kayıtları
+        
+        Returns:
+            list: Geçmiş kayıtları
+        """
+        try:
+            return self.history.page(limit, offset, host=host, start=start, end=end)
+        except Exception as e:
+            self.logger.error("Geçmiş okunamadı: %s", e)
+            return []
+    
+    def get_trend(self, start, end, resolution='auto', by=None):
+        """
+        Açık sayılarının zaman içindeki eğilimi
+        
+        Args:
+            start: Başlangıç zamanı (epoch veya datetime)
+            end: Bitiş zamanı (epoch veya datetime)
+            resolution: 'hour', 'day', 'week' veya 'auto'
+            by: None, 'check' veya 'risk'
+        
+        Returns:
+            dict: resolution ve buckets [{'start', 'scans', 'findings', 'by'}]
+        """
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        if isinstance(end, datetime):
+            end = end.timestamp()
+        
+        return self.history.trend(start, end, resolution, by)
+    
+    def get_check_history(self, check_id):
+        """
+        Kontrolün bulgu geçmişi (ilk / son görülme)
+        
+        Args:
+            check_id: Kontrol kimliği
+        
+        Returns:
+            dict: first_seen, last_seen (bulgu ayrıntılarıyla) ve occurrences
+        """
+        return {
+            'check_id': check_id,
+            'first_seen': self.archive.first_seen(check_id),
+            'last_seen': self.archive.last_seen(check_id),
+            'occurrences': self.archive.occurrences(check_id)
+        }
+    
+    def get_baseline(self):
+        """
+        Son taramadan önceki arşivlenmiş tarama (fark raporu için)
+        
+        Son tarama kaydedilmediyse arşivdeki en yeni tarama kullanılır.
+        
+        Returns:
+            dict: vulnerabilities ve scan_info veya None
+        """
+        try:
+            if self.last_scan_position is not None:
+                if self.last_scan_position == 0:
+                    return None
+                return self.archive.scan_findings(self.last_scan_position - 1)
+            return self.archive.scan_findings(-1)
+        except Exception as e:
+            self.logger.error("Önceki tarama okunamadı: %s", e)
+            return None
+    
+    def diff_scans(self, old=-2, new=-1):
+        """
+        Arşivdeki iki taramayı karşılaştır
+        
+        Args:
+            old: Önceki taramanın arşiv sırası (negatif değerler sondan sayılır)
+            new: Sonraki taramanın arşiv sırası
+        
+        Returns:
+            dict: new, resolved, persisting, changed ve summary; tarama yoksa None
+        """
+        old_result = self.archive.scan_findings(old)
+        new_result = self.archive.scan_findings(new)
+        
+        if old_result is None or new_result is None:
+            return None
+        
+        return diff_scans(old_result, new_result)
+    
+    def get_config(self):
+        """Yapılandırmayı döndür"""
+        return self.config
+    
+    def update_config(self, key, value):
+        """Yapılandırmayı güncelle"""
+        self.config[key] = value
+        self.save_config()
+        self.logger.info("Yapılandırma güncellendi: %s = %s", key, value)
+    
+    def generate_report(self, format_type='txt', delta=False):
+        """
+        Rapor oluştur
+        
+        Args:
+            format_type: Rapor formatı ('txt', 'json', 'html')
+            delta: Önceki taramaya göre yalnızca değişiklikleri yaz ('txt', 'json')
+        
+        Returns:
+            str: Oluşturulan rapor dosyasının yolu veya None
+        """
+        if not self.last_scan_result:
+            self.logger.warning("Rapor oluşturulamadı: Tarama sonucu yok")
+            return None
+        
+        try:
+            from utils.report import ReportGenerator
+            
+            report_gen = ReportGenerator(self.logger, self.config.get('report_retention'))
+            filename = report_gen.generate(
+                self.last_scan_result,
+                format_type,
+                baseline=(self.get_baseline() or {}) if delta else None
+            )
+            
+            self.logger.info("Rapor oluşturuldu: %s", filename)
+            return filename
+        
+        except ImportError:
+            self.logger.error("ReportGenerator modülü yüklenemedi")
+            return None
+        except Exception as e:
+            self.logger.error("Rapor oluşturulamadı: %s", e)
+            return None
+    
+    def generate_reports(self, formats=REPORT_FORMATS, delta=False):
+        """
+        Son taramadan birden çok formatta rapor oluştur (tek geçiş, ortak dosya adı)
+        
+        Args:
+            formats: Rapor formatları
+            delta: Önceki taramaya göre fark raporu ('txt', 'json')
+        
+        Returns:
+            dict: {format: dosya yolu}; tarama yoksa boş
+        """
+        if not self.last_scan_result:
+            self.logger.warning("Rapor oluşturulamadı: Tarama sonucu yok")
+            return {}
+        
+        try:
+            from utils.report import ReportGenerator
+            
+            return ReportGenerator(self.logger, self.config.get('report_retention')).generate(
+                self.last_scan_result,
+                baseline=(self.get_baseline() or {}) if delta else None,
+                formats=formats
+            )
+        
+        except Exception as e:
+            self.logger.error("Rapor oluşturulamadı: %s", e)
+            return {}
+    
+    def get_last_scan(self):
+        """Son tarama sonucunu döndür"""
+        return self.last_scan_result
+    
+    def clear_history(self):
+        """Tarama geçmişini temizle"""
+        try:
+            self.history.clear()
+            self.archive.clear()
+            self.logger.info("Tarama geçmişi temizlendi")
+        except Exception as e:
+            self.logger.error("Geçmiş temizlenemedi: %s", e)
+    
+    def export_scan_data(self, filepath):
+        """
+        Tarama verilerini dışa aktar
+        
+        Args:
+            filepath: Dışa aktarılacak dosya yolu
+        """
+        try:
+            export_data = {
+                'last_scan': self.last_scan_result,
+                'history': list(self.history.range()),
+                'config': self.config,
+                'export_date': datetime.now().strftime('%d.%m.%Y %H:%M:%S')
+            }
+            
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=4, ensure_ascii=False)
+            
+            self.logger.info("Tarama verileri dışa aktarıldı: %s", filepath)
+            return True
+        
+        except Exception as e:
+            self.logger.error("Veri dışa aktarılamadı: %s", e)
+            return False
+    
+    def get_statistics(self):
+        """
+        Tarama istatistiklerini döndür
+        
+        Değerler her kayıtta güncellenen toplamlardan okunur; geçmiş
+        büyüdükçe yavaşlamaz.
+        
+        Returns:
+            dict: İstatistikler
+        """
+        try:
+            stats = self.history.statistics()
+        except Exception as e:
+            self.logger.error("İstatistikler okunamadı: %s", e)
+            stats = {'total_scans': 0}
+        
+        if not stats['total_scans']:
+            return {
+                'total_scans': 0,
+                'total_vulnerabilities': 0,
+                'average_vulnerabilities': 0,
+                'risk_counts': {},
+                'last_scan_date': 'Henüz tarama yapılmadı'
+            }
+        
+        total_scans = stats['total_scans']
+        total_vulns = stats['total_vulnerabilities']
+        
+        return {
+            'total_scans': total_scans,
+            'total_vulnerabilities': total_vulns,
+            'average_vulnerabilities': round(total_vulns / total_scans, 2),
+            'risk_counts': stats['risk_counts'],
+            'last_scan_date': (stats['last_scan'] or {}).get('date') or 'Bilinmiyor',
+            'most_vulnerable_scan': stats['most_vulnerable_scan']
+        }
+    
+    def rebuild_statistics(self):
+        """
+        İstatistik toplamlarını ham geçmişten yeniden hesapla
+        
+        Returns:
+            list: Farklı çıkan alanlar [(alan, önceki, yeni)]; tutarlıysa boş
+        """
+        before, after = self.history.rebuild_aggregates()
+        
+        drift = [
+            (key, before[key], after[key])
+            for key in after
+            if before[key] != after[key]
+        ]
+        
+        if drift:
+            self.logger.warning("İstatistik toplamları düzeltildi: %s", ', '.join(key for key, _, _ in drift))
+        else:
+            self.logger.info("İstatistik toplamları doğrulandı")
+        
+        return drift
\ No newline at end of file
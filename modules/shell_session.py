@@ -0,0 +1,289 @@
+"""
+Kalıcı Kabuk Oturumu Modülü
+Tek bir yorumlayıcı sürecine stdin üzerinden komut gönderme
+"""
+
+import atexit
+import queue
+import subprocess
+import threading
+import time
+import uuid
+
+
+class ShellSession:
+    """
+    Uzun ömürlü kabuk oturumu
+
+    Yorumlayıcı bir kez başlatılır; her komut stdin'e yazılır ve yanıtın
+    sonu, komuttan sonra yazdırılan benzersiz bir ayraç satırıyla belirlenir:
+
+        <komut çıktısı>
+        __SHELL_<uuid>__ <çıkış_kodu>
+
+    Süreç çökerse veya komut zaman aşımına uğrarsa oturum sonlandırılır ve
+    bir sonraki komutta yeniden başlatılır.
+    """
+
+    DIALECTS = {
+        'powershell': ['powershell', '-NoLogo', '-NoProfile', '-NonInteractive', '-Command', '-'],
+        'posix': ['bash', '--noprofile', '--norc']
+    }
+
+    def __init__(self, logger, dialect='powershell', argv=None):
+        """
+        Args:
+            logger: Logger nesnesi
+            dialect: Komut çerçeveleme biçimi ('powershell' veya 'posix')
+            argv: Yorumlayıcı komutu (varsayılan: dialect için tanımlı komut)
+        """
+        if dialect not in self.DIALECTS:
+            raise ValueError(f"Bilinmeyen kabuk türü: {dialect}")
+
+        self.logger = logger
+        self.dialect = dialect
+        self.argv = list(argv or self.DIALECTS[dialect])
+        self.restarts = 0
+
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+        # Çalışan komutun iptal işareti; abort() yalnızca sahibine uygulanır
+        self._owner = None
+        self._owner_lock = threading.Lock()
+        self._atexit_registered = False
+
+    def is_alive(self):
+        """Yorumlayıcı süreci çalışıyor mu"""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Yorumlayıcıyı başlat (zaten çalışıyorsa bir şey yapma)"""
+        if self.is_alive():
+            return
+
+        creationflags = 0
+        if hasattr(subprocess, 'CREATE_NO_WINDOW'):
+            creationflags = subprocess.CREATE_NO_WINDOW
+
+        self._process = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            bufsize=1,
+            creationflags=creationflags
+        )
+
+        # Her süreç için yeni kuyruk: eski süreçten kalan satırlar karışmasın
+        self._lines = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_stdout,
+            args=(self._process.stdout, self._lines),
+            name='shell-session-reader',
+            daemon=True
+        )
+        reader.start()
+
+        if self.dialect == 'powershell':
+            self._write(
+                "$ProgressPreference = 'SilentlyContinue'; "
+                "[Console]::OutputEncoding = [System.Text.Encoding]::UTF8\n"
+            )
+
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+
+        self.logger.info("Kabuk oturumu başlatıldı: %s (pid %s)", self.argv[0], self._process.pid)
+
+    def execute(self, command, timeout=5, cancel=None):
+        """
+        Komutu oturumda çalıştır
+
+        Oturum kilidini beklerken geçen süre zaman aşımına dahildir; kilit
+        alındığında cancel işaretlenmişse komut hiç gönderilmez.
+
+        Args:
+            command: Çalıştırılacak komut metni
+            timeout: Zaman aşımı süresi
+            cancel: İptal işareti (threading.Event, abort() ile işaretlenir)
+
+        Returns:
+            tuple: (stdout, stderr, returncode)
+        """
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=max(timeout, 0)):
+            self.logger.warning("Kabuk oturumu meşgul, komut zaman aşımına uğradı: %s", command)
+            return "", "Timeout", -1
+
+        try:
+            if cancel is not None and cancel.is_set():
+                return "", "Cancelled", -1
+
+            with self._owner_lock:
+                self._owner = cancel
+            try:
+                return self._run(command, deadline)
+            finally:
+                with self._owner_lock:
+                    self._owner = None
+        finally:
+            self._lock.release()
+
+    def _run(self, command, deadline):
+        """Komutu gönderip yanıtı bekle (çağıran oturum kilidini tutar)"""
+        marker = f"__SHELL_{uuid.uuid4().hex}__"
+
+        try:
+            self.start()
+            self._write(self._frame(command, marker))
+        except (OSError, ValueError):
+            # Boru kırıldıysa oturumu bir kez yeniden başlatıp dene
+            self._kill()
+            try:
+                self.start()
+                self._write(self._frame(command, marker))
+            except (OSError, ValueError) as e:
+                self.logger.error("Kabuk oturumu başlatılamadı: %s", e)
+                self._kill()
+                return "", str(e), -1
+
+        return self._collect(command, marker, deadline)
+
+    def abort(self, cancel):
+        """
+        İptal edilen komutu beklemeden durdur
+
+        Başka bir thread'den çağrılabilir. cancel işaretlenir; komut henüz
+        kilidi beklerken hiç çalışmaz. Yorumlayıcı yalnızca çalışan komut bu
+        işarete aitse sonlandırılır (execute() "Session terminated" ile döner,
+        oturum sonraki komutta yeniden başlar); başka bir kontrolün komutuna
+        dokunulmaz.
+
+        Args:
+            cancel: execute() çağrısına verilen iptal işareti
+        """
+        cancel.set()
+        with self._owner_lock:
+            if self._owner is not cancel:
+                return
+            if self.is_alive():
+                self.logger.warning("Kabuk oturumu iptal edildi")
+            self._kill()
+
+    def restart(self):
+        """Oturumu sonlandırıp yeniden başlat"""
+        with self._lock:
+            self._kill()
+            self.start()
+
+    def close(self):
+        """Oturumu kapat"""
+        process = self._process
+        if process is None:
+            return
+
+        try:
+            if process.poll() is None:
+                process.stdin.close()
+                process.wait(timeout=2)
+        except Exception:
+            pass
+        finally:
+            self._kill()
+
+    def _frame(self, command, marker):
+        """Komutu ayraç satırı üretecek şekilde çerçevele"""
+        if self.dialect == 'powershell':
+            return (
+                "$Error.Clear(); "
+                f"try {{ & {{ {command} }} 2>$null | Out-String -Width 4096 -Stream }} catch {{ }}; "
+                f"[Console]::Out.WriteLine('{marker} ' + [int]($Error.Count -gt 0)); "
+                "[Console]::Out.Flush()\n\n"
+            )
+
+        return f"{command}\nprintf '%s %d\\n' '{marker}' \"$?\"\n"
+
+    def _collect(self, command, marker, deadline):
+        """Ayraç satırına kadar çıktıyı topla (deadline: time.monotonic() bitiş zamanı)"""
+        lines = self._lines
+        output = []
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.warning("Kabuk komutu zaman aşımına uğradı: %s", command)
+                self._kill()
+                return "", "Timeout", -1
+
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+
+            if line is None:
+                self.logger.warning("Kabuk oturumu beklenmedik şekilde sonlandı")
+                self._kill()
+                return ''.join(output), "Session terminated", -1
+
+            pos = line.find(marker)
+            if pos < 0:
+                output.append(line)
+                continue
+
+            # Komut çıktısı satır sonuyla bitmediyse ayraçtan önceki kısım çıktıdır
+            if pos > 0:
+                output.append(line[:pos])
+
+            code = line[pos + len(marker):].strip()
+            returncode = int(code) if code.lstrip('-').isdigit() else -1
+            return ''.join(output), "", returncode
+
+    def _write(self, text):
+        """Yorumlayıcının stdin'ine yaz"""
+        self._process.stdin.write(text)
+        self._process.stdin.flush()
+
+    def _kill(self):
+        """Süreci zorla sonlandır"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if process.poll() is None:
+            self.restarts += 1
+            try:
+                process.kill()
+                process.wait(timeout=2)
+            except Exception:
+                pass
+
+        # Yorumlayıcının alt süreçleri stdout'u açık tutabilir; bekleyen
+        # _collect() okuyucu thread'in EOF görmesini beklemeden dönsün.
+        # stdout'u okuyucu thread kapatır (okuma sürerken close() bloklanır)
+        if self._lines is not None:
+            self._lines.put(None)
+
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _read_stdout(stream, lines):
+        """stdout satırlarını kuyruğa aktar (arka plan thread'i)"""
+        try:
+            for line in stream:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            lines.put(None)
+            try:
+                stream.close()
+            except Exception:
+                pass
@@ -1,14 +1,29 @@
-"""
-Utils Package
-Yardımcı araçlar ve fonksiyonlar
-"""
-
-from .logger import Logger
-from .report import ReportGenerator
-
-__all__ = [
-    'Logger',
-    'ReportGenerator'
-]
-
-__version__ = '1.0.0'
\ No newline at end of file
+"""
+Utils Package
+Yardımcı araçlar ve fonksiyonlar
+
+Alt modüller ilk erişimde yüklenir.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'Logger': '.logger',
+    'ReportGenerator': '.report'
+}
+
+__all__ = [
+    'Logger',
+    'ReportGenerator'
+]
+
+__version__ = '1.0.0'
+
+
+def __getattr__(name):
+    """Dışa aktarılan sınıfları ilk erişimde yükle (PEP 562)"""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,329 @@
+"""
+Filo Rapor Birleştirme Modülü
+Çok sayıda security_report_*.json dosyasını sınırlı bellekle tek filo özetinde toplama
+
+Dosyalar süreç havuzunda ayrıştırılır; her işçi ana sürece yalnızca kompakt bir
+özet döndürür. Büyük raporlar bütünüyle yüklenmez, bulgular tek tek çözülür.
+Her uç noktanın en yeni raporu filonun güncel durumu sayılır. Saklama
+politikasının sıkıştırdığı .json.gz raporlar da okunur.
+"""
+
+import gzip
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+
+RISK_LEVELS = ('critical', 'high', 'medium', 'low')
+
+# Bu boyutun altındaki raporlar tek seferde okunur (json.load daha hızlıdır)
+STREAM_THRESHOLD = 1024 * 1024
+
+READ_CHUNK = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class _Stream:
+    """raw_decode için parça parça doldurulan metin tamponu"""
+    
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def fill(self):
+        """Tampona bir parça daha oku; dosya bittiyse False"""
+        if self.eof:
+            return False
+        chunk = self.f.read(READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        # Tüketilen kısım atılır; bellekte en fazla bir öğe + bir parça kalır
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def find(self, token):
+        """Belirteci bul ve sonrasına konumlan"""
+        while True:
+            index = self.buffer.find(token, self.pos)
+            if index >= 0:
+                self.pos = index + len(token)
+                return True
+            # Belirteç parça sınırına denk gelebilir
+            self.pos = max(self.pos, len(self.buffer) - len(token))
+            if not self.fill():
+                return False
+    
+    def skip(self, characters):
+        """Boşluk ve verilen karakterleri atla; sıradaki karakteri döndür"""
+        while True:
+            while self.pos < len(self.buffer) and (
+                self.buffer[self.pos].isspace() or self.buffer[self.pos] in characters
+            ):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+    
+    def decode(self):
+        """Sıradaki JSON değerini çöz (eksikse tamponu doldurarak)"""
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return value
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+
+
+def _open_report(path):
+    """Raporu metin olarak aç (.gz ise açarak)"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_report(path):
+    """
+    Raporu akış halinde oku
+    
+    Yields:
+        tuple: ('scan_info', dict), ardından her bulgu için ('finding', dict)
+    """
+    with _open_report(path) as f:
+        stream = _Stream(f)
+        
+        if stream.find('"scan_info"') and stream.skip(':') == '{':
+            yield 'scan_info', stream.decode()
+        
+        if not stream.find('"vulnerabilities"') or stream.skip(':') != '[':
+            return
+        stream.pos += 1
+        
+        while stream.skip(',') not in ('', ']'):
+            yield 'finding', stream.decode()
+
+
+def summarize_report(path):
+    """
+    Tek raporun kompakt özeti (işçi süreçte çalışır)
+    
+    Bulgular kontrol kimliğiyle gruplanır (yoksa mesajla); parmak izi uç
+    noktaya özgü kanıt içerdiğinden filo genelinde gruplamaya uygun değildir.
+    
+    Returns:
+        tuple: (host, ts, risk_counts, [(anahtar, mesaj, risk)]) veya hata durumunda None
+    """
+    try:
+        # Sıkıştırılmış raporun açılmış boyutu bilinmez; her zaman akışla okunur
+        if not path.endswith('.gz') and os.path.getsize(path) < STREAM_THRESHOLD:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            items = [('scan_info', data.get('scan_info', {}))]
+            items.extend(('finding', vuln) for vuln in data.get('vulnerabilities', []))
+        else:
+            items = iter_report(path)
+        
+        scan_info = {}
+        risk_counts = dict.fromkeys(RISK_LEVELS, 0)
+        findings = []
+        
+        for kind, value in items:
+            if kind == 'scan_info':
+                scan_info = value
+                continue
+            
+            risk = value.get('risk', 'medium').lower()
+            risk_counts[risk] = risk_counts.get(risk, 0) + 1
+            key = value.get('check_id') or value.get('message', '')
+            findings.append((key, value.get('message', ''), risk))
+        
+        host = scan_info.get('host') or 'bilinmiyor'
+        try:
+            ts = datetime.strptime(scan_info.get('date', ''), '%d.%m.%Y %H:%M:%S').timestamp()
+        except ValueError:
+            ts = os.path.getmtime(path)
+        
+        return host, ts, risk_counts, findings
+    
+    except Exception:
+        return None
+
+
+def _summarize_batch(paths):
+    """Dosya grubunu özetle (süreçler arası iletişimi azaltmak için)"""
+    return [summarize_report(path) for path in paths]
+
+
+class FleetAggregator:
+    """Rapor dizininden filo özeti"""
+    
+    def __init__(self, logger, workers=None, batch_size=64):
+        """
+        Args:
+            logger: Logger nesnesi
+            workers: İşçi süreç sayısı (varsayılan: CPU sayısı)
+            batch_size: Bir işçiye tek seferde verilen dosya sayısı
+        """
+        self.logger = logger
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        
+        self.reports = 0
+        self.failed = 0
+        self.duration = 0.0
+        # Uç nokta -> (ts, risk_counts, bulgu anahtarları); yalnızca en yeni rapor
+        self.latest = {}
+        # Bulgu anahtarı -> (mesaj, risk)
+        self.messages = {}
+    
+    def add(self, summary):
+        """Tek rapor özetini birleştir"""
+        if summary is None:
+            self.failed += 1
+            return
+        
+        host, ts, risk_counts, findings = summary
+        self.reports += 1
+        
+        current = self.latest.get(host)
+        if current is not None and current[0] >= ts:
+            return
+        
+        keys = {}
+        for key, message, risk in findings:
+            keys[key] = None
+            self.messages[key] = (message, risk)
+        
+        self.latest[host] = (ts, risk_counts, list(keys))
+    
+    def run(self, directory):
+        """
+        Dizindeki tüm JSON raporlarını (.json ve .json.gz) birleştir
+        
+        Dosya listesi bellekte tutulmaz; havuzda en fazla workers * 4 grup bekler.
+        
+        Returns:
+            FleetAggregator: self
+        """
+        start = time.perf_counter()
+        
+        def batches():
+            batch = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('security_report_') and entry.name.endswith(('.json', '.json.gz')):
+                        batch.append(entry.path)
+                        if len(batch) >= self.batch_size:
+                            yield batch
+                            batch = []
+            if batch:
+                yield batch
+        
+        if self.workers <= 1:
+            for batch in batches():
+                for summary in _summarize_batch(batch):
+                    self.add(summary)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                pending = deque()
+                for batch in batches():
+                    pending.append(pool.submit(_summarize_batch, batch))
+                    if len(pending) >= self.workers * 4:
+                        for summary in pending.popleft().result():
+                            self.add(summary)
+                for future in pending:
+                    for summary in future.result():
+                        self.add(summary)
+        
+        self.duration = time.perf_counter() - start
+        self.logger.info(
+            "%s rapor birleştirildi (%s uç nokta, %s okunamadı, %.2f saniye)",
+            self.reports, len(self.latest), self.failed, self.duration
+        )
+        return self
+    
+    def summary(self, top=20):
+        """
+        Filo özeti
+        
+        Returns:
+            dict: hosts, reports, risk_distribution, top_findings, worst_hosts
+        """
+        risk_distribution = dict.fromkeys(RISK_LEVELS, 0)
+        hosts_per_finding = {}
+        host_scores = []
+        
+        for host, (ts, risk_counts, keys) in self.latest.items():
+            for level in RISK_LEVELS:
+                risk_distribution[level] += risk_counts.get(level, 0)
+            for key in keys:
+                hosts_per_finding.setdefault(key, []).append(host)
+            host_scores.append((tuple(risk_counts.get(level, 0) for level in RISK_LEVELS), host, ts))
+        
+        top_findings = sorted(hosts_per_finding.items(), key=lambda item: -len(item[1]))[:top]
+        host_scores.sort(reverse=True)
+        
+        return {
+            'hosts': len(self.latest),
+            'reports': self.reports,
+            'failed': self.failed,
+            'risk_distribution': risk_distribution,
+            'top_findings': [
+                {
+                    'message': self.messages[key][0],
+                    'risk': self.messages[key][1],
+                    'host_count': len(hosts),
+                    'hosts': sorted(hosts)
+                }
+                for key, hosts in top_findings
+            ],
+            'worst_hosts': [
+                {
+                    'host': host,
+                    'last_scan': datetime.fromtimestamp(ts).strftime('%d.%m.%Y %H:%M:%S'),
+                    'risk_counts': dict(zip(RISK_LEVELS, counts))
+                }
+                for counts, host, ts in host_scores[:top]
+                if any(counts)
+            ]
+        }
+    
+    def as_scan_result(self, top=20):
+        """
+        Filo özetini ReportGenerator'ın yazabileceği tarama sonucu biçimine çevir
+        
+        Her bulgu, etkilediği uç nokta sayısıyla tek kayıt olur; ayrıntılı filo
+        özeti scan_info['fleet'] altında JSON raporuna da girer.
+        """
+        fleet = self.summary(top)
+        
+        vulnerabilities = []
+        for finding in fleet['top_findings']:
+            hosts = finding['hosts']
+            shown = ', '.join(hosts[:10]) + (f' (+{len(hosts) - 10})' if len(hosts) > 10 else '')
+            vulnerabilities.append({
+                'message': f"{finding['message']} ({finding['host_count']} uç nokta)",
+                'details': f"Etkilenen uç noktalar: {shown}",
+                'risk': finding['risk']
+            })
+        
+        return {
+            'vulnerabilities': vulnerabilities,
+            'scan_info': {
+                'date': datetime.now().strftime('%d.%m.%Y %H:%M:%S'),
+                'system': f"Filo: {fleet['hosts']} uç nokta, {fleet['reports']} rapor",
+                'duration': self.duration,
+                'total_checks': fleet['reports'],
+                'fleet': fleet
+            }
+        }
\ No newline at end of file
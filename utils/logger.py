@@ -1,205 +1,806 @@
-"""
-Log Sistemi Modülü
-Program aktivitelerini kaydetme ve izleme
-"""
-
-import logging
-import os
-from datetime import datetime
-
-
-class Logger:
-    """Log yönetimi sınıfı"""
-    
-    def __init__(self, name='SecurityScanner', log_level='INFO'):
-        """
-        Logger başlatıcı
-        
-        Args:
-            name: Logger adı
-            log_level: Log seviyesi (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        """
-        self.name = name
-        self.logger = logging.getLogger(name)
-        
-        # Log seviyesini ayarla
-        level = getattr(logging, log_level.upper(), logging.INFO)
-        self.logger.setLevel(level)
-        
-        # Logs klasörünü oluştur
-        self.log_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'logs'
-        )
-        os.makedirs(self.log_dir, exist_ok=True)
-        
-        # Log dosya yolu
-        log_filename = f"scanner_{datetime.now().strftime('%Y%m%d')}.log"
-        self.log_file = os.path.join(self.log_dir, log_filename)
-        
-        # Handler'ları temizle (çift log yazımını önle)
-        if self.logger.handlers:
-            self.logger.handlers.clear()
-        
-        # Dosya handler
-        file_handler = logging.FileHandler(
-            self.log_file,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(level)
-        
-        # Console handler (sadece WARNING ve üzeri)
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.WARNING)
-        
-        # Format
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        # Handler'ları ekle
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-        
-        self.info(f"Logger başlatıldı: {name}")
-    
-    def debug(self, message):
-        """Debug seviyesi log"""
-        self.logger.debug(message)
-    
-    def info(self, message):
-        """Info seviyesi log"""
-        self.logger.info(message)
-    
-    def warning(self, message):
-        """Warning seviyesi log"""
-        self.logger.warning(message)
-    
-    def error(self, message):
-        """Error seviyesi log"""
-        self.logger.error(message)
-    
-    def critical(self, message):
-        """Critical seviyesi log"""
-        self.logger.critical(message)
-    
-    def log_scan_start(self):
-        """Tarama başlangıcını logla"""
-        self.info("=" * 50)
-        self.info("YENİ TARAMA BAŞLATILDI")
-        self.info("=" * 50)
-    
-    def log_scan_end(self, duration, vulnerability_count):
-        """Tarama bitişini logla"""
-        self.info("=" * 50)
-        self.info(f"TARAMA TAMAMLANDI - {duration:.2f} saniye")
-        self.info(f"Bulunan güvenlik açığı sayısı: {vulnerability_count}")
-        self.info("=" * 50)
-    
-    def log_vulnerability(self, vulnerability):
-        """Güvenlik açığını logla"""
-        self.warning(f"GÜVENLİK AÇIĞI: {vulnerability.get('message', 'Bilinmeyen')}")
-        if vulnerability.get('details'):
-            self.warning(f"  Detay: {vulnerability['details']}")
-        if vulnerability.get('risk'):
-            self.warning(f"  Risk: {vulnerability['risk'].upper()}")
-    
-    def get_log_file_path(self):
-        """Log dosyasının yolunu döndür"""
-        return self.log_file
-    
-    def get_recent_logs(self, lines=50):
-        """Son N satır logu oku"""
-        try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                return all_lines[-lines:] if len(all_lines) > lines else all_lines
-        except Exception as e:
-            self.error(f"Log dosyası okunamadı: {e}")
-            return []
-    
-    def clear_old_logs(self, days=30):
-        """Eski log dosyalarını temizle"""
-        try:
-            current_time = datetime.now()
-            deleted_count = 0
-            
-            for filename in os.listdir(self.log_dir):
-                if filename.startswith('scanner_') and filename.endswith('.log'):
-                    file_path = os.path.join(self.log_dir, filename)
-                    
-                    # Dosya oluşturma tarihini kontrol et
-                    file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                    age_days = (current_time - file_time).days
-                    
-                    if age_days > days:
-                        os.remove(file_path)
-                        deleted_count += 1
-                        self.info(f"Eski log dosyası silindi: {filename}")
-            
-            if deleted_count > 0:
-                self.info(f"{deleted_count} adet eski log dosyası temizlendi")
-                
-        except Exception as e:
-            self.error(f"Eski loglar temizlenirken hata: {e}")
-    
-    def get_log_statistics(self):
-        """Log istatistiklerini döndür"""
-        try:
-            stats = {
-                'total_lines': 0,
-                'info_count': 0,
-                'warning_count': 0,
-                'error_count': 0,
-                'critical_count': 0
-            }
-            
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    stats['total_lines'] += 1
-                    
-                    if ' - INFO - ' in line:
-                        stats['info_count'] += 1
-                    elif ' - WARNING - ' in line:
-                        stats['warning_count'] += 1
-                    elif ' - ERROR - ' in line:
-                        stats['error_count'] += 1
-                    elif ' - CRITICAL - ' in line:
-                        stats['critical_count'] += 1
-            
-            return stats
-            
-        except Exception as e:
-            self.error(f"Log istatistikleri alınamadı: {e}")
-            return None
-    
-    def export_logs(self, output_file):
-        """Logları başka bir dosyaya dışa aktar"""
-        try:
-            with open(self.log_file, 'r', encoding='utf-8') as src:
-                with open(output_file, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
-            
-            self.info(f"Loglar dışa aktarıldı: {output_file}")
-            return True
-            
-        except Exception as e:
-            self.error(f"Log dışa aktarma hatası: {e}")
-            return False
-    
-    def set_level(self, level):
-        """Log seviyesini değiştir"""
-        log_level = getattr(logging, level.upper(), logging.INFO)
-        self.logger.setLevel(log_level)
-        self.info(f"Log seviyesi değiştirildi: {level.upper()}")
-    
-    def __del__(self):
-        """Logger sonlandırıcı"""
-        # Handler'ları kapat
-        for handler in self.logger.handlers[:]:
-            handler.close()
-            self.logger.removeHandler(handler)
\ No newline at end of file
+"""
+Log Sistemi Modülü
+Program aktivitelerini kaydetme ve izleme
+
+Varsayılan kipte kayıtlar sınırlı bir tampona konur ve arka plandaki yazıcı
+iş parçacığı tarafından gruplar halinde biçimlendirilip yazılır; çağıran
+iş parçacığı biçimlendirmeyi ve disk G/Ç'sini beklemez.
+
+Log dosyaları gün değişiminde ve boyut sınırında döndürülür:
+    scanner_YYYYMMDD.log        Günün etkin dosyası
+    scanner_YYYYMMDD.N.log      Boyut sınırında ayrılan parça (N büyüdükçe yeni)
+    *.log.gz                    Arka planda sıkıştırılmış eski dosyalar
+"""
+
+import atexit
+import gzip
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+
+# Tampon dolduğunda: çağıranı beklet veya kaydı düşür
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP = 'drop'
+
+# Sondan okumada blok boyutu (bayt)
+TAIL_BLOCK = 64 * 1024
+
+# Canlı izleyiciler için hatırlanan son döndürme sayısı
+ROTATION_HISTORY = 64
+
+LOG_FILE_PATTERN = re.compile(r'^scanner_(\d{8})(?:\.(\d+))?\.log(\.gz)?$')
+
+
+def log_segments(log_dir):
+    """
+    Klasördeki log dosyaları (eskiden yeniye)
+    
+    Returns:
+        list: [{'path', 'date', 'index', 'compressed', 'size'}]; günün parçasız
+              dosyası o günün en yenisidir (index None)
+    """
+    segments = []
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            match = LOG_FILE_PATTERN.match(entry.name)
+            if not match:
+                continue
+            try:
+                size = entry.stat().st_size
+            except FileNotFoundError:
+                # Arka planda sıkıştırılıp silinmiş
+                continue
+            segments.append({
+                'path': entry.path,
+                'date': match.group(1),
+                'index': int(match.group(2)) if match.group(2) else None,
+                'compressed': bool(match.group(3)),
+                'size': size
+            })
+    
+    segments.sort(key=lambda s: (s['date'], float('inf') if s['index'] is None else s['index']))
+    return segments
+
+
+def tail(path, lines, block_size=TAIL_BLOCK):
+    """
+    Dosyanın son N satırı
+    
+    Düz dosyada sondan geriye blok blok okunur; yalnızca N satırı kapsayan
+    bloklar belleğe alınır. Sıkıştırılmış dosya baştan açılır, ancak bellekte
+    en fazla N satır tutulur.
+    
+    Args:
+        path: Log dosyası (.log veya .log.gz)
+        lines: Satır sayısı
+        block_size: Okuma bloğu (bayt)
+    
+    Returns:
+        list: Satırlar ('\n' ile biten, readlines gibi)
+    """
+    if lines <= 0:
+        return []
+    
+    if path.endswith('.gz'):
+        with _open_segment(path) as f:
+            return list(deque(f, maxlen=lines))
+    
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        
+        # İlk satırın da tam olması için N + 1 satır sonu gerekir
+        while position > 0 and newlines <= lines:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+    
+    result = _split_lines(b''.join(reversed(blocks)))
+    if position > 0:
+        # Baştaki parça bir önceki satırın sonu
+        result = result[1:]
+    return result[-lines:]
+
+
+def _split_lines(data):
+    """Baytları satırlara böl (evrensel satır sonları, readlines gibi)"""
+    text = data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+    result = text.split('\n')
+    last = result.pop()
+    result = [line + '\n' for line in result]
+    if last:
+        result.append(last)
+    return result
+
+
+def _open_log(path):
+    """
+    Log dosyasını ikili kipte aç; arka planda sıkıştırılmışsa .gz halini aç
+    
+    Returns:
+        Dosya nesnesi veya dosya yoksa None
+    """
+    candidates = (path,) if path.endswith('.gz') else (path, path + '.gz')
+    for candidate in candidates:
+        try:
+            return gzip.open(candidate, 'rb') if candidate.endswith('.gz') else open(candidate, 'rb')
+        except FileNotFoundError:
+            continue
+    return None
+
+
+def _read_lines(f, offset):
+    """
+    Konumdan itibaren tamamlanmış satırları üret
+    
+    Returns:
+        int: Son tam satırın bittiği konum
+    """
+    f.seek(offset)
+    pending = b''
+    while True:
+        block = f.read(TAIL_BLOCK)
+        if not block:
+            return offset
+        
+        data = pending + block
+        end = data.rfind(b'\n') + 1
+        pending = data[end:]
+        if end:
+            offset += end
+            yield from _split_lines(data[:end])
+
+
+def _open_segment(path):
+    """Log dosyasını metin olarak aç (.gz ise açarak)"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+class _RecordBuffer:
+    """Yazıcıya giden sınırlı kayıt tamponu"""
+    
+    def __init__(self, capacity, batch_size, flush_level):
+        # deque ekleme / çıkarma işlemleri kilitsiz ve iş parçacığı güvenlidir
+        self.records = deque()
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_level = flush_level
+        # Yazıcıyı süre dolmadan uyandırır (grup doldu, acil kayıt, flush, kapanış)
+        self.wake = threading.Event()
+        # 'block' politikasında yer açılmasını bekleyenler
+        self.space = threading.Condition()
+
+
+class _BufferHandler(logging.Handler):
+    """Kayıtları biçimlendirmeden tampona koyan handler"""
+    
+    def __init__(self, buffer, overflow):
+        super().__init__()
+        self.buffer = buffer
+        self.overflow = overflow
+        self.dropped = 0
+    
+    def emit(self, record):
+        # Handler kilidi altında çalışır; üreticiler birbirini burada sıralar
+        buffer = self.buffer
+        if len(buffer.records) >= buffer.capacity:
+            if self.overflow == OVERFLOW_DROP:
+                self.dropped += 1
+                return
+            with buffer.space:
+                buffer.space.wait_for(lambda: len(buffer.records) < buffer.capacity)
+        
+        # Mesaj, yazıcı iş parçacığında biçimlendirilir
+        buffer.records.append(record)
+        if len(buffer.records) == buffer.batch_size or record.levelno >= buffer.flush_level:
+            buffer.wake.set()
+
+
+class _RotatingFileHandler(logging.FileHandler):
+    """Gün değişiminde ve boyut sınırında dosya değiştiren handler"""
+    
+    def __init__(self, log_dir, max_bytes, on_rotate):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.on_rotate = on_rotate
+        self.day, self.next_day = self._day_bounds()
+        # Döndürme sayacı ve son döndürülen dosyalar: (sıra, yol)
+        self.generation = 0
+        self.rotated = deque(maxlen=ROTATION_HISTORY)
+        super().__init__(self._path(self.day), encoding='utf-8')
+    
+    def emit(self, record):
+        # Eşzamanlı kipte handler kilidi altında çağrılır
+        self.maybe_rotate()
+        super().emit(record)
+    
+    def maybe_rotate(self):
+        """Gerekirse dosyayı döndür (çağıran handler kilidini tutar)"""
+        if time.time() >= self.next_day:
+            # Önceki günün dosyası yerinde kalır
+            target = self.baseFilename
+            self.day, self.next_day = self._day_bounds()
+            self._reopen()
+        elif self.max_bytes and self.stream and os.fstat(self.stream.fileno()).st_size >= self.max_bytes:
+            target = self._segment_path()
+            self.close_stream()
+            try:
+                os.replace(self.baseFilename, target)
+            except OSError:
+                # Windows'ta dosya açık tutuluyorsa (ör. follow okurken) döndürme sonraki gruba kalır
+                self._reopen()
+                return
+            self._reopen()
+        else:
+            return
+        
+        self.generation += 1
+        self.rotated.append((self.generation, target))
+        self.on_rotate()
+    
+    def rotations(self, since=None):
+        """
+        Döndürme durumu (tutarlı anlık görüntü)
+        
+        Args:
+            since: Bu sıradan sonraki döndürmeler listelenir
+        
+        Returns:
+            tuple: (sıra, etkin dosya, [döndürülen dosyalar, eskiden yeniye])
+        """
+        with self.lock:
+            rotated = [path for generation, path in self.rotated if since is not None and generation > since]
+            return self.generation, self.baseFilename, rotated
+    
+    def close_stream(self):
+        """Akışı kapat (kilit çağıranda)"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+    
+    def _reopen(self):
+        """Günün etkin dosyasını aç"""
+        self.close_stream()
+        self.baseFilename = self._path(self.day)
+        self.stream = self._open()
+    
+    def _path(self, day):
+        return os.path.join(self.log_dir, f"scanner_{day}.log")
+    
+    def _segment_path(self):
+        """Günün sıradaki parça adı"""
+        indexes = [
+            segment['index'] for segment in log_segments(self.log_dir)
+            if segment['date'] == self.day and segment['index'] is not None
+        ]
+        return os.path.join(self.log_dir, f"scanner_{self.day}.{max(indexes, default=0) + 1}.log")
+    
+    @staticmethod
+    def _day_bounds():
+        """(bugün 'YYYYMMDD', yarın 00:00 epoch)"""
+        now = datetime.now()
+        tomorrow = datetime(now.year, now.month, now.day) + timedelta(days=1)
+        return now.strftime('%Y%m%d'), tomorrow.timestamp()
+
+
+class _LogArchiver(threading.Thread):
+    """Döndürülen log dosyalarını sıkıştıran ve saklama sınırlarını uygulayan iş parçacığı"""
+    
+    def __init__(self, handler, max_files, max_age_days, max_total_bytes):
+        super().__init__(name='log-archiver', daemon=True)
+        self.handler = handler
+        self.max_files = max_files
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+        self.wake = threading.Event()
+        self.stopping = False
+        # Arka plan geçişi ile elle temizlik (clear_old_logs) çakışmaz
+        self.lock = threading.Lock()
+    
+    def run(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            if self.stopping:
+                return
+            try:
+                self.compress_rotated()
+                self.prune(self.max_files, self.max_age_days, self.max_total_bytes)
+            except Exception:
+                # Logger'ın kendisi burada kullanılamaz (döngüsel kayıt)
+                pass
+    
+    def compress_rotated(self):
+        """
+        Etkin dosya dışındaki sıkıştırılmamış log dosyalarını gzip'le
+        
+        En son döndürülen dosya bir sonraki döndürmeye kadar düz kalır; canlı
+        izleyiciler (follow) kalan satırlara sıkıştırma çözmeden konumla ulaşır.
+        """
+        with self.lock:
+            # Yarıda kalan sıkıştırmaların artıkları
+            for name in os.listdir(self.handler.log_dir):
+                if name.startswith('scanner_') and name.endswith('.gz.tmp'):
+                    os.remove(os.path.join(self.handler.log_dir, name))
+            
+            rotated = [
+                segment for segment in log_segments(self.handler.log_dir)
+                if segment['path'] != self.handler.baseFilename
+            ]
+            for segment in rotated[:-1]:
+                path = segment['path']
+                if segment['compressed'] or self.stopping:
+                    continue
+                
+                tmp_path = path + '.gz.tmp'
+                with open(path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 256 * 1024)
+                os.replace(tmp_path, path + '.gz')
+                os.remove(path)
+    
+    def prune(self, max_files=0, max_age_days=0, max_total_bytes=0):
+        """
+        Saklama sınırlarını aşan en eski log dosyalarını sil (etkin dosya korunur)
+        
+        Args:
+            max_files: En fazla dosya sayısı (0 = sınırsız)
+            max_age_days: Tarihi (dosya adındaki gün) bundan eski dosyalar silinir
+            max_total_bytes: Toplam boyut sınırı (0 = sınırsız)
+        
+        Returns:
+            list: Silinen dosya adları
+        """
+        with self.lock:
+            segments = log_segments(self.handler.log_dir)
+            today = datetime.now()
+            deleted = []
+            kept = 0
+            total = 0
+            
+            # Yeniden eskiye: sınır aşıldıktan sonraki tüm dosyalar silinir
+            for segment in reversed(segments):
+                kept += 1
+                total += segment['size']
+                
+                if segment['path'] == self.handler.baseFilename:
+                    continue
+                
+                age_days = (today - datetime.strptime(segment['date'], '%Y%m%d')).days
+                if ((max_files and kept > max_files)
+                        or (max_age_days and age_days > max_age_days)
+                        or (max_total_bytes and total > max_total_bytes)):
+                    os.remove(segment['path'])
+                    deleted.append(os.path.basename(segment['path']))
+            
+            return deleted
+
+
+class _BatchWriter(threading.Thread):
+    """Tampondaki kayıtları gruplar halinde handler'lara yazan iş parçacığı"""
+    
+    def __init__(self, handler, handlers, flush_interval):
+        super().__init__(name='log-writer', daemon=True)
+        self.handler = handler
+        self.buffer = handler.buffer
+        self.handlers = handlers
+        self.flush_interval = flush_interval
+        self.reported_drops = 0
+    
+    def run(self):
+        buffer = self.buffer
+        while True:
+            buffer.wake.wait(self.flush_interval)
+            buffer.wake.clear()
+            
+            batch = []
+            waiters = []
+            stop = False
+            # Yalnızca uyanma anındaki kayıtlar alınır; üreticiler yazıcıyı oyalayamaz
+            for _ in range(len(buffer.records)):
+                item = buffer.records.popleft()
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+            
+            with buffer.space:
+                buffer.space.notify_all()
+            
+            self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+    
+    def _write(self, batch):
+        """Grubu her handler'a tek yazma ve tek flush ile ilet"""
+        dropped = self.handler.dropped - self.reported_drops
+        if dropped:
+            self.reported_drops += dropped
+            batch.append(logging.makeLogRecord({
+                'name': batch[0].name if batch else 'SecurityScanner',
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': 'Log tamponu dolu: %s kayıt düşürüldü',
+                'args': (dropped,)
+            }))
+        
+        if not batch:
+            return
+        
+        for handler in self.handlers:
+            records = [record for record in batch if record.levelno >= handler.level]
+            if not records:
+                continue
+            
+            if not isinstance(handler, logging.StreamHandler):
+                for record in records:
+                    handler.handle(record)
+                continue
+            
+            parts = []
+            for record in records:
+                try:
+                    parts.append(handler.format(record) + handler.terminator)
+                except Exception:
+                    handler.handleError(record)
+            
+            # Dönen dosyada boyut sınırı grup başına denetlenir
+            step = self.buffer.batch_size if isinstance(handler, _RotatingFileHandler) else len(parts)
+            try:
+                with handler.lock:
+                    for start in range(0, len(parts), max(step, 1)):
+                        if isinstance(handler, _RotatingFileHandler):
+                            handler.maybe_rotate()
+                        handler.stream.write(''.join(parts[start:start + step]))
+                        handler.flush()
+            except Exception:
+                handler.handleError(records[-1])
+
+
+class Logger:
+    """Log yönetimi sınıfı"""
+    
+    def __init__(self, name='SecurityScanner', log_level='INFO', async_mode=True, queue_size=10000,
+                 overflow=OVERFLOW_BLOCK, batch_size=256, flush_interval=0.5, log_dir=None,
+                 max_bytes=10 * 1024 * 1024, max_files=0, max_age_days=30, max_total_bytes=0):
+        """
+        Logger başlatıcı
+        
+        Args:
+            name: Logger adı
+            log_level: Log seviyesi (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            async_mode: Kayıtları tampon üzerinden arka planda yaz
+            queue_size: Tampon kapasitesi (kayıt)
+            overflow: Tampon dolduğunda 'block' (beklet) veya 'drop' (düşür ve say)
+            batch_size: Bu kadar kayıt birikince beklemeden yaz
+            flush_interval: Bekleyen kayıtlar en geç bu kadar saniyede bir yazılır;
+                            ERROR ve üzeri kayıtlar beklemeden yazılır
+            log_dir: Log klasörü (varsayılan: proje kökündeki logs)
+            max_bytes: Etkin dosya bu boyutu aşınca yeni parçaya geç (0 = yalnızca günlük)
+            max_files: En fazla log dosyası (0 = sınırsız)
+            max_age_days: Bundan eski günlerin logları silinir (0 = sınırsız)
+            max_total_bytes: Tüm log dosyalarının toplam boyut sınırı (0 = sınırsız)
+        """
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self._writer = None
+        self._buffer_handler = None
+        self._archiver = None
+        self._handlers = []
+        
+        if overflow not in (OVERFLOW_BLOCK, OVERFLOW_DROP):
+            raise ValueError(f"Geçersiz tampon politikası: {overflow}")
+        
+        # Log seviyesini ayarla
+        level = getattr(logging, log_level.upper(), logging.INFO)
+        self.logger.setLevel(level)
+        
+        # Logs klasörünü oluştur
+        self.log_dir = log_dir or os.path.join(
+            os.path.dirname(os.path.dirname(__file__)),
+            'logs'
+        )
+        os.makedirs(self.log_dir, exist_ok=True)
+        
+        # Handler'ları temizle (çift log yazımını önle)
+        if self.logger.handlers:
+            self.logger.handlers.clear()
+        
+        # Dosya handler (döndürülen dosyalar arka planda sıkıştırılır ve budanır)
+        file_handler = _RotatingFileHandler(self.log_dir, max_bytes, None)
+        file_handler.setLevel(level)
+        self._file_handler = file_handler
+        
+        self._archiver = _LogArchiver(file_handler, max_files, max_age_days, max_total_bytes)
+        file_handler.on_rotate = self._archiver.wake.set
+        self._archiver.start()
+        # Önceki çalıştırmalardan kalan dosyalar için ilk geçiş
+        self._archiver.wake.set()
+        
+        # Console handler (sadece WARNING ve üzeri)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        
+        # Format
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        
+        file_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
+        
+        # Handler'ları ekle
+        if async_mode:
+            self._buffer_handler = _BufferHandler(_RecordBuffer(queue_size, batch_size, logging.ERROR), overflow)
+            self._writer = _BatchWriter(self._buffer_handler, [file_handler, console_handler], flush_interval)
+            self._writer.start()
+            self.logger.addHandler(self._buffer_handler)
+            # Süreç kapanırken tamponda kalanlar yazılır
+            atexit.register(self.close)
+        else:
+            self.logger.addHandler(file_handler)
+            self.logger.addHandler(console_handler)
+        self._handlers = [file_handler, console_handler]
+        
+        self.info("Logger başlatıldı: %s", name)
+    
+    # Mesajlar %-biçimindedir; argümanlar yalnızca seviye etkinse ve yazıcıda birleştirilir
+    def debug(self, message, *args):
+        """Debug seviyesi log"""
+        self.logger.debug(message, *args)
+    
+    def info(self, message, *args):
+        """Info seviyesi log"""
+        self.logger.info(message, *args)
+    
+    def warning(self, message, *args):
+        """Warning seviyesi log"""
+        self.logger.warning(message, *args)
+    
+    def error(self, message, *args):
+        """Error seviyesi log"""
+        self.logger.error(message, *args)
+    
+    def critical(self, message, *args):
+        """Critical seviyesi log"""
+        self.logger.critical(message, *args)
+    
+    @property
+    def log_file(self):
+        """Etkin log dosyasının yolu"""
+        return self._file_handler.baseFilename
+    
+    def log_files(self):
+        """Döndürülmüş dosyalar dahil tüm log dosyaları (eskiden yeniye)"""
+        return [segment['path'] for segment in log_segments(self.log_dir)]
+    
+    @property
+    def dropped(self):
+        """Tampon dolduğu için düşürülen kayıt sayısı"""
+        return self._buffer_handler.dropped if self._buffer_handler else 0
+    
+    def flush(self, timeout=5.0):
+        """Tamponda bekleyen kayıtların yazılmasını bekle"""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._buffer_handler.buffer.records.append(done)
+        self._buffer_handler.buffer.wake.set()
+        done.wait(timeout)
+    
+    def close(self):
+        """Bekleyen kayıtları yaz, yazıcıyı durdur ve handler'ları kapat"""
+        if self._writer is not None:
+            self.logger.removeHandler(self._buffer_handler)
+            if self._writer.is_alive():
+                self._buffer_handler.buffer.records.append(None)
+                self._buffer_handler.buffer.wake.set()
+                self._writer.join(5.0)
+            self._writer = None
+            atexit.unregister(self.close)
+        
+        if self._archiver is not None:
+            self._archiver.stopping = True
+            self._archiver.wake.set()
+            self._archiver.join(5.0)
+            self._archiver = None
+        
+        for handler in self._handlers:
+            handler.close()
+            self.logger.removeHandler(handler)
+    
+    def log_scan_start(self):
+        """Tarama başlangıcını logla"""
+        self.info("=" * 50)
+        self.info("YENİ TARAMA BAŞLATILDI")
+        self.info("=" * 50)
+    
+    def log_scan_end(self, duration, vulnerability_count):
+        """Tarama bitişini logla"""
+        self.info("=" * 50)
+        self.info("TARAMA TAMAMLANDI - %.2f saniye", duration)
+        self.info("Bulunan güvenlik açığı sayısı: %s", vulnerability_count)
+        self.info("=" * 50)
+    
+    def log_vulnerability(self, vulnerability):
+        """Güvenlik açığını logla"""
+        self.warning("GÜVENLİK AÇIĞI: %s", vulnerability.get('message', 'Bilinmeyen'))
+        if vulnerability.get('details'):
+            self.warning("  Detay: %s", vulnerability['details'])
+        if vulnerability.get('risk'):
+            self.warning("  Risk: %s", vulnerability['risk'].upper())
+    
+    def get_log_file_path(self):
+        """Log dosyasının yolunu döndür"""
+        return self.log_file
+    
+    def get_recent_logs(self, lines=50):
+        """
+        Son N satır logu oku (etkin dosya yetmezse önceki parçalardan)
+        
+        Dosya sondan geriye bloklar halinde okunur; okunan bayt miktarı dosya
+        boyutuna değil istenen satır sayısına bağlıdır.
+        """
+        self.flush()
+        try:
+            recent = []
+            for path in reversed(self.log_files()):
+                recent = tail(path, lines - len(recent)) + recent
+                if len(recent) >= lines:
+                    break
+            return recent
+        except Exception as e:
+            self.error("Log dosyası okunamadı: %s", e)
+            return []
+    
+    def follow(self, offset=None, interval=0.5, stop=None):
+        """
+        Etkin log dosyasına eklenen satırları canlı izle
+        
+        Dosya konumu (bayt) üzerinden ilerler; her yoklamada yalnızca yeni
+        baytlar okunur. Yarım satırlar tamamlanana kadar bekletilir. Dosya
+        döndürülürse eskisinin kalan satırları ve aradaki parçalar okunup
+        yenisine geçilir.
+        
+        Args:
+            offset: Başlangıç konumu (bayt, varsayılan: dosya sonu)
+            interval: Yoklama aralığı (saniye)
+            stop: threading.Event; kurulunca üreteç biter
+        
+        Yields:
+            str: Yeni satır ('\n' ile biten)
+        """
+        handler = self._file_handler
+        generation = None
+        
+        while stop is None or not stop.is_set():
+            # Etkin dosya adı döndürmede yeniden kullanılır; dosya, döndürme
+            # sırasıyla birlikte handler kilidi altında açılır
+            with handler.lock:
+                current, active, rotated = handler.rotations(generation)
+                f = _open_log(active) if generation in (None, current) else None
+            
+            if generation is None:
+                generation = current
+                if offset is None:
+                    offset = os.fstat(f.fileno()).st_size if f else 0
+            
+            if current == generation:
+                if f is not None:
+                    with f:
+                        offset = yield from _read_lines(f, offset)
+                if stop is not None:
+                    stop.wait(interval)
+                else:
+                    time.sleep(interval)
+                continue
+            
+            # İlk döndürülen dosya izlenen dosyadır; kalanı konumundan, sonrakiler baştan okunur
+            for index, path in enumerate(rotated):
+                f = _open_log(path)
+                if f is not None:
+                    with f:
+                        yield from _read_lines(f, offset if index == 0 else 0)
+            generation, offset = current, 0
+    
+    def clear_old_logs(self, days=30):
+        """Eski log dosyalarını temizle (yaş, dosya adındaki günden hesaplanır)"""
+        try:
+            deleted = self._archiver.prune(max_age_days=days)
+            for filename in deleted:
+                self.info("Eski log dosyası silindi: %s", filename)
+            
+            if deleted:
+                self.info("%s adet eski log dosyası temizlendi", len(deleted))
+        
+        except Exception as e:
+            self.error("Eski loglar temizlenirken hata: %s", e)
+    
+    def get_log_statistics(self, all_files=False):
+        """
+        Log istatistiklerini döndür
+        
+        Args:
+            all_files: Yalnızca bugünün değil, saklanan tüm log dosyalarını say
+        """
+        self.flush()
+        try:
+            stats = {
+                'total_lines': 0,
+                'info_count': 0,
+                'warning_count': 0,
+                'error_count': 0,
+                'critical_count': 0,
+                'files': 0,
+                'total_bytes': 0
+            }
+            
+            today = self._file_handler.day
+            for segment in log_segments(self.log_dir):
+                if not all_files and segment['date'] != today:
+                    continue
+                
+                stats['files'] += 1
+                stats['total_bytes'] += segment['size']
+                
+                with _open_segment(segment['path']) as f:
+                    for line in f:
+                        stats['total_lines'] += 1
+                        
+                        if ' - INFO - ' in line:
+                            stats['info_count'] += 1
+                        elif ' - WARNING - ' in line:
+                            stats['warning_count'] += 1
+                        elif ' - ERROR - ' in line:
+                            stats['error_count'] += 1
+                        elif ' - CRITICAL - ' in line:
+                            stats['critical_count'] += 1
+            
+            return stats
+        
+        except Exception as e:
+            self.error("Log istatistikleri alınamadı: %s", e)
+            return None
+    
+    def export_logs(self, output_file):
+        """Logları (döndürülmüş ve sıkıştırılmış dosyalar dahil, eskiden yeniye) dışa aktar"""
+        self.flush()
+        try:
+            with open(output_file, 'w', encoding='utf-8') as dst:
+                for path in self.log_files():
+                    with _open_segment(path) as src:
+                        shutil.copyfileobj(src, dst, 256 * 1024)
+            
+            self.info("Loglar dışa aktarıldı: %s", output_file)
+            return True
+        
+        except Exception as e:
+            self.error("Log dışa aktarma hatası: %s", e)
+            return False
+    
+    def set_level(self, level):
+        """Log seviyesini değiştir"""
+        log_level = getattr(logging, level.upper(), logging.INFO)
+        self.logger.setLevel(log_level)
+        self.info("Log seviyesi değiştirildi: %s", level.upper())
+    
+    def __del__(self):
+        """Logger sonlandırıcı"""
+        # Handler'ları kapat
+        self.close()
\ No newline at end of file
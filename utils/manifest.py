@@ -0,0 +1,420 @@
+"""
+Rapor Dizini Modülü
+Oluşturulan raporların meta verisini yazma anında tutan SQLite dizini
+
+Listeleme dosya sistemini dolaşmaz; sayfa başına tek indeksli sorgu yapılır.
+Saklama politikası eski raporları gzip ile sıkıştırır ve sınırı aşanları siler.
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+
+REPORT_PREFIXES = ('security_report_', 'security_delta_')
+
+# Rapor saklama politikası (0 = sınırsız / kapalı)
+#   keep: En fazla tutulacak rapor (bir taramanın tüm format dosyaları tek rapor sayılır)
+#   days: Bu kadar günden eski raporlar silinir
+#   compress_days: Bu kadar günden eski raporlar gzip ile sıkıştırılır
+DEFAULT_RETENTION = {'keep': 0, 'days': 0, 'compress_days': 30}
+
+# Dosya adının uzantısız kökü; aynı raporun formatları (.txt, .json, .html, .gz) bu kökü paylaşır
+_STEM = "CASE WHEN instr(filename, '.') THEN substr(filename, 1, instr(filename, '.') - 1) ELSE filename END"
+
+# Sıkıştırılan raporların kayıtları bu büyüklükteki gruplarla güncellenir
+COMPRESS_BATCH = 256
+
+# Aynı dizinde aynı anda tek saklama geçişi çalışır
+_retention_lock = threading.Lock()
+
+
+class ReportManifest:
+    """Rapor dizini (rapor başına O(1) kayıt, sayfa başına O(sayfa) listeleme)"""
+    
+    def __init__(self, logger, report_dir):
+        """
+        Args:
+            logger: Logger nesnesi
+            report_dir: Rapor klasörü; dizin veritabanı bu klasörde tutulur (manifest.db)
+        """
+        self.logger = logger
+        self.report_dir = report_dir
+        self._lock = threading.Lock()
+        
+        os.makedirs(report_dir, exist_ok=True)
+        
+        self.conn = sqlite3.connect(os.path.join(report_dir, 'manifest.db'), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        
+        created = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reports'"
+        ).fetchone() is None
+        
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS reports (
+                id INTEGER PRIMARY KEY,
+                ts REAL NOT NULL,
+                filename TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                format TEXT NOT NULL,
+                scan_id INTEGER,
+                host TEXT,
+                size INTEGER NOT NULL DEFAULT 0,
+                compressed INTEGER NOT NULL DEFAULT 0,
+                total INTEGER,
+                risk_low INTEGER,
+                risk_medium INTEGER,
+                risk_high INTEGER,
+                risk_critical INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_reports_ts ON reports (ts);
+            CREATE INDEX IF NOT EXISTS idx_reports_format_ts ON reports (format, ts);
+            CREATE INDEX IF NOT EXISTS idx_reports_host_ts ON reports (host, ts);
+            CREATE INDEX IF NOT EXISTS idx_reports_scan ON reports (scan_id);
+        ''')
+        self.conn.commit()
+        
+        # Dizinden önce oluşturulmuş raporlar bir kez taranarak eklenir
+        if created:
+            added, _ = self.sync()
+            if added:
+                self.logger.info("Rapor dizini oluşturuldu: %s mevcut rapor eklendi", added)
+    
+    def record(self, path, kind, format_type, scan_info=None, risk_counts=None, ts=None):
+        """
+        Yazılan raporu dizine ekle
+        
+        Args:
+            path: Rapor dosyasının yolu
+            kind: 'report' veya 'delta'
+            format_type: 'txt', 'json', 'html'
+            scan_info: Taramanın scan_info'su (scan_id, host)
+            risk_counts: Risk dağılımı ({'low': 0, ...})
+            ts: Oluşturulma zamanı (epoch, varsayılan: şimdi)
+        
+        Returns:
+            int: Kayıt kimliği
+        """
+        scan_info = scan_info or {}
+        risks = [risk_counts.get(level, 0) for level in RISK_LEVELS] if risk_counts is not None else [None] * 4
+        total = sum(risks) if risk_counts is not None else None
+        
+        filename = os.path.basename(path)
+        values = [
+            time.time() if ts is None else float(ts),
+            kind,
+            format_type,
+            scan_info.get('scan_id'),
+            scan_info.get('host'),
+            os.path.getsize(path),
+            total
+        ] + risks
+        
+        with self._lock, self.conn:
+            # Dizin ilk açılışta klasörü taradıysa dosya zaten kayıtlıdır; kaydı tamamla.
+            # UPSERT / RETURNING eski SQLite sürümlerinde (Python 3.7 / 3.8) yoktur
+            row = self.conn.execute('SELECT id FROM reports WHERE filename = ?', (filename,)).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    'UPDATE reports SET ts = ?, kind = ?, format = ?, scan_id = ?, host = ?, size = ?, '
+                    'compressed = 0, total = ?, risk_low = ?, risk_medium = ?, risk_high = ?, risk_critical = ? '
+                    'WHERE id = ?',
+                    values + [row[0]]
+                )
+                return row[0]
+            
+            cursor = self.conn.execute(
+                'INSERT INTO reports (ts, kind, format, scan_id, host, size, '
+                'total, risk_low, risk_medium, risk_high, risk_critical, filename) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                values + [filename]
+            )
+            return cursor.lastrowid
+    
+    def count(self, **filters):
+        """Filtreye uyan rapor sayısı (filtreler page ile aynı)"""
+        where, params = self._where(**filters)
+        with self._lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM reports{where}', params).fetchone()[0]
+    
+    def page(self, limit=20, before_id=None, format_type=None, kind=None, host=None,
+             scan_id=None, risk=None, start=None, end=None):
+        """
+        Yeniden eskiye sayfalı raporlar
+        
+        Sayfalama anahtarla yapılır: sonraki sayfa için önceki sayfanın son
+        kaydının kimliği before_id olarak verilir.
+        
+        Args:
+            limit: Sayfa boyutu
+            before_id: Bu kayıttan (zaman sırasında) eski raporlar
+            format_type: Yalnızca bu formattaki raporlar
+            kind: 'report' veya 'delta'
+            host: Yalnızca bu uç noktanın raporları
+            scan_id: Yalnızca bu taramanın raporları
+            risk: Bu seviyede en az bir bulgu içeren raporlar
+            start: Başlangıç zamanı (epoch, dahil)
+            end: Bitiş zamanı (epoch, hariç)
+        
+        Returns:
+            list: Rapor kayıtları (dict)
+        """
+        where, params = self._where(format_type, kind, host, scan_id, risk, start, end)
+        
+        with self._lock:
+            if before_id is not None:
+                anchor = self.conn.execute('SELECT ts, id FROM reports WHERE id = ?', (int(before_id),)).fetchone()
+                if anchor is None:
+                    return []
+                where += (' AND ' if where else ' WHERE ') + '(ts, id) < (?, ?)'
+                params += list(anchor)
+            
+            cursor = self.conn.execute(
+                f'SELECT * FROM reports{where} ORDER BY ts DESC, id DESC LIMIT ?',
+                params + [int(limit)]
+            )
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        
+        return [self._entry(dict(zip(columns, row))) for row in rows]
+    
+    def sync(self):
+        """
+        Dizini klasörle eşitle (dışarıdan silinen / eklenen raporlar)
+        
+        Klasörün tamamı dolaşılır; listeleme bunu gerektirmez, yalnızca elle
+        müdahaleden sonra çağrılır.
+        
+        Returns:
+            tuple: (eklenen, silinen kayıt sayısı)
+        """
+        files = {}
+        with os.scandir(self.report_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(REPORT_PREFIXES) and not entry.name.endswith('.tmp') and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime, stat.st_size)
+        
+        with self._lock, self.conn:
+            known = {row[0] for row in self.conn.execute('SELECT filename FROM reports')}
+            
+            missing = known - files.keys()
+            self.conn.executemany('DELETE FROM reports WHERE filename = ?', [(name,) for name in missing])
+            
+            # Eski dosyalarda risk özeti bilinmez; zaman olarak değiştirilme zamanı alınır
+            added = sorted((files[name][0], name) for name in files.keys() - known)
+            for mtime, name in added:
+                kind, format_type, compressed = self._parse_name(name)
+                self.conn.execute(
+                    'INSERT INTO reports (ts, filename, kind, format, size, compressed) VALUES (?, ?, ?, ?, ?, ?)',
+                    (mtime, name, kind, format_type, files[name][1], compressed)
+                )
+        
+        return len(added), len(missing)
+    
+    def apply_retention(self, keep=0, days=0, compress_days=0, now=None):
+        """
+        Saklama politikasını uygula
+        
+        Önce sınırı aşan raporlar silinir, kalanlardan eskiler sıkıştırılır.
+        Silme rapor başına yapılır; bir taramanın format dosyaları birlikte
+        tutulur veya birlikte silinir.
+        
+        Args:
+            keep: En fazla tutulacak rapor, format dosyaları tek sayılır (0 = sınırsız)
+            days: Bu kadar günden eski raporları sil (0 = sınırsız)
+            compress_days: Bu kadar günden eski raporları gzip ile sıkıştır (0 = kapalı)
+            now: Şimdiki zaman (epoch, test için)
+        
+        Returns:
+            dict: deleted, compressed sayıları; başka geçiş sürüyorsa None
+        """
+        if not _retention_lock.acquire(blocking=False):
+            return None
+        
+        try:
+            now = time.time() if now is None else now
+            deleted = 0
+            compressed = 0
+            
+            expired = []
+            with self._lock:
+                # Raporun zamanı en yeni format dosyasının zamanıdır
+                if keep:
+                    expired += self.conn.execute(
+                        f'SELECT id, filename FROM reports WHERE {_STEM} IN ('
+                        f'SELECT {_STEM} AS stem FROM reports GROUP BY stem '
+                        f'ORDER BY MAX(ts) DESC, MAX(id) DESC LIMIT -1 OFFSET ?)',
+                        (int(keep),)
+                    ).fetchall()
+                if days:
+                    expired += self.conn.execute(
+                        f'SELECT id, filename FROM reports WHERE {_STEM} IN ('
+                        f'SELECT {_STEM} AS stem FROM reports GROUP BY stem HAVING MAX(ts) < ?)',
+                        (now - days * 86400,)
+                    ).fetchall()
+            
+            removed = []
+            for report_id, filename in dict(expired).items():
+                try:
+                    os.remove(os.path.join(self.report_dir, filename))
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    self.logger.error("Rapor silinemedi: %s: %s", filename, e)
+                    continue
+                removed.append((report_id,))
+            
+            # Kayıtlar tek işlemde silinir; yarıda kalırsa sync() eksik dosyaları temizler
+            with self._lock, self.conn:
+                self.conn.executemany('DELETE FROM reports WHERE id = ?', removed)
+            deleted = len(removed)
+            
+            if compress_days:
+                with self._lock:
+                    stale = self.conn.execute(
+                        'SELECT id, filename FROM reports WHERE compressed = 0 AND ts < ?',
+                        (now - compress_days * 86400,)
+                    ).fetchall()
+                
+                for index in range(0, len(stale), COMPRESS_BATCH):
+                    compressed += self._compress_batch(stale[index:index + COMPRESS_BATCH])
+            
+            if deleted or compressed:
+                self.logger.info("Rapor saklama: %s rapor silindi, %s rapor sıkıştırıldı", deleted, compressed)
+            
+            return {'deleted': deleted, 'compressed': compressed}
+        
+        finally:
+            _retention_lock.release()
+    
+    def apply_retention_async(self, policy):
+        """
+        Saklama politikasını arka planda uygula
+        
+        İş parçacığı daemon değildir; süreç sıkıştırma bitmeden kapanmaz.
+        
+        Args:
+            policy: {'keep', 'days', 'compress_days'}
+        
+        Returns:
+            threading.Thread: Başlatılan iş parçacığı
+        """
+        policy = dict(DEFAULT_RETENTION, **(policy or {}))
+        
+        def run():
+            try:
+                self.apply_retention(policy['keep'], policy['days'], policy['compress_days'])
+            except Exception as e:
+                self.logger.error("Rapor saklama politikası uygulanamadı: %s", e)
+        
+        thread = threading.Thread(target=run, name='report-retention')
+        thread.start()
+        return thread
+    
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self._lock:
+            self.conn.close()
+    
+    def _compress_batch(self, rows):
+        """
+        Rapor grubunu sıkıştır; kayıtlar tek işlemde güncellenir
+        
+        Özgün dosyalar ancak kayıtlar .gz dosyasını gösterdikten sonra silinir.
+        
+        Returns:
+            int: Sıkıştırılan rapor sayısı
+        """
+        updates = []
+        missing = []
+        
+        for report_id, filename in rows:
+            try:
+                updates.append((filename + '.gz', self._compress(filename), report_id))
+            except FileNotFoundError:
+                # Dosya dışarıdan silinmiş
+                missing.append((report_id,))
+            except Exception as e:
+                self.logger.error("Rapor sıkıştırılamadı: %s: %s", filename, e)
+        
+        with self._lock, self.conn:
+            self.conn.executemany('UPDATE reports SET filename = ?, size = ?, compressed = 1 WHERE id = ?', updates)
+            self.conn.executemany('DELETE FROM reports WHERE id = ?', missing)
+        
+        for filename, _, _ in updates:
+            os.remove(os.path.join(self.report_dir, filename[:-3]))
+        
+        return len(updates)
+    
+    def _compress(self, filename):
+        """Raporu yanına gzip ile sıkıştır; sıkıştırılmış boyutu döndür"""
+        path = os.path.join(self.report_dir, filename)
+        target = path + '.gz'
+        tmp_path = target + '.tmp'
+        
+        try:
+            with open(path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 256 * 1024)
+            os.replace(tmp_path, target)
+            return os.path.getsize(target)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _entry(self, row):
+        """Veritabanı satırından rapor kaydı"""
+        risks = [row.pop(f'risk_{level}') for level in RISK_LEVELS]
+        row['risk_counts'] = dict(zip(RISK_LEVELS, risks)) if risks[0] is not None else None
+        row['compressed'] = bool(row['compressed'])
+        row['path'] = os.path.join(self.report_dir, row['filename'])
+        return row
+    
+    @staticmethod
+    def _parse_name(filename):
+        """Dosya adından (tür, format, sıkıştırılmış mı)"""
+        compressed = filename.endswith('.gz')
+        if compressed:
+            filename = filename[:-3]
+        kind = 'delta' if filename.startswith('security_delta_') else 'report'
+        return kind, os.path.splitext(filename)[1].lstrip('.'), int(compressed)
+    
+    @staticmethod
+    def _where(format_type=None, kind=None, host=None, scan_id=None, risk=None, start=None, end=None):
+        """WHERE ifadesi ve parametreleri"""
+        clauses = []
+        params = []
+        
+        if format_type is not None:
+            clauses.append('format = ?')
+            params.append(format_type)
+        if kind is not None:
+            clauses.append('kind = ?')
+            params.append(kind)
+        if host is not None:
+            clauses.append('host = ?')
+            params.append(host)
+        if scan_id is not None:
+            clauses.append('scan_id = ?')
+            params.append(int(scan_id))
+        if risk is not None:
+            if risk not in RISK_LEVELS:
+                raise ValueError(f"Geçersiz risk seviyesi: {risk}")
+            clauses.append(f'risk_{risk} > 0')
+        if start is not None:
+            clauses.append('ts >= ?')
+            params.append(float(start))
+        if end is not None:
+            clauses.append('ts < ?')
+            params.append(float(end))
+        
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        return where, params
\ No newline at end of file
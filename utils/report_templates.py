@@ -0,0 +1,365 @@
+"""
+HTML Rapor Şablonları
+Akışlı HTML yazıcısının parçaları; modül yüklenirken bir kez hazırlanır
+"""
+
+# Sabit belge başı (CSS dahil); biçimlendirme gerektirmez
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="tr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Güvenlik Tarama Raporu</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px;
+            color: #333;
+        }
+        
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }
+        
+        .header p {
+            font-size: 1.1em;
+            opacity: 0.9;
+        }
+        
+        .content {
+            padding: 40px;
+        }
+        
+        .info-box {
+            background: #f8f9fa;
+            border-left: 4px solid #667eea;
+            padding: 20px;
+            margin-bottom: 30px;
+            border-radius: 5px;
+        }
+        
+        .info-box h2 {
+            color: #667eea;
+            margin-bottom: 15px;
+            font-size: 1.5em;
+        }
+        
+        .info-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin-top: 15px;
+        }
+        
+        .info-item {
+            background: white;
+            padding: 15px;
+            border-radius: 5px;
+            border: 1px solid #e0e0e0;
+        }
+        
+        .info-item label {
+            font-weight: bold;
+            color: #666;
+            display: block;
+            margin-bottom: 5px;
+            font-size: 0.9em;
+        }
+        
+        .info-item value {
+            color: #333;
+            font-size: 1.1em;
+        }
+        
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 20px;
+            margin: 30px 0;
+        }
+        
+        .summary-card {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            border-top: 4px solid;
+        }
+        
+        .summary-card.critical { border-top-color: #dc3545; }
+        .summary-card.high { border-top-color: #fd7e14; }
+        .summary-card.medium { border-top-color: #ffc107; }
+        .summary-card.low { border-top-color: #28a745; }
+        .summary-card.total { border-top-color: #667eea; }
+        
+        .summary-card .number {
+            font-size: 2.5em;
+            font-weight: bold;
+            margin: 10px 0;
+        }
+        
+        .summary-card .label {
+            color: #666;
+            font-size: 0.9em;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        
+        .vulnerability {
+            background: white;
+            border: 1px solid #e0e0e0;
+            border-radius: 10px;
+            padding: 25px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+            transition: all 0.3s ease;
+        }
+        
+        .vulnerability:hover {
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            transform: translateY(-2px);
+        }
+        
+        .vulnerability-header {
+            display: flex;
+            align-items: center;
+            margin-bottom: 15px;
+        }
+        
+        .vulnerability-number {
+            background: #667eea;
+            color: white;
+            width: 35px;
+            height: 35px;
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-weight: bold;
+            margin-right: 15px;
+        }
+        
+        .vulnerability-title {
+            flex: 1;
+            font-size: 1.2em;
+            font-weight: bold;
+            color: #333;
+        }
+        
+        .risk-badge {
+            padding: 5px 15px;
+            border-radius: 20px;
+            font-size: 0.85em;
+            font-weight: bold;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        
+        .risk-critical { background: #dc3545; color: white; }
+        .risk-high { background: #fd7e14; color: white; }
+        .risk-medium { background: #ffc107; color: #333; }
+        .risk-low { background: #28a745; color: white; }
+        
+        .vulnerability-details {
+            margin: 15px 0;
+            padding: 15px;
+            background: #f8f9fa;
+            border-radius: 5px;
+            color: #666;
+        }
+        
+        .vulnerability-solution {
+            margin-top: 15px;
+            padding: 15px;
+            background: #d4edda;
+            border-left: 4px solid #28a745;
+            border-radius: 5px;
+        }
+        
+        .vulnerability-solution strong {
+            color: #155724;
+            display: block;
+            margin-bottom: 5px;
+        }
+        
+        .no-vulnerabilities {
+            text-align: center;
+            padding: 60px 20px;
+            background: #d4edda;
+            border-radius: 10px;
+            margin: 20px 0;
+        }
+        
+        .no-vulnerabilities .icon {
+            font-size: 4em;
+            margin-bottom: 20px;
+        }
+        
+        .no-vulnerabilities h3 {
+            color: #155724;
+            font-size: 1.8em;
+            margin-bottom: 10px;
+        }
+        
+        .no-vulnerabilities p {
+            color: #155724;
+            font-size: 1.1em;
+        }
+        
+        .footer {
+            background: #f8f9fa;
+            padding: 20px;
+            text-align: center;
+            color: #666;
+            border-top: 1px solid #e0e0e0;
+        }
+        
+        @media print {
+            body {
+                background: white;
+                padding: 0;
+            }
+            
+            .vulnerability {
+                page-break-inside: avoid;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🛡️ Güvenlik Tarama Raporu</h1>
+            <p>Sistem Güvenlik Analizi ve Değerlendirme</p>
+        </div>
+        
+        <div class="content">
+"""
+
+HTML_SCAN_INFO = """            <!-- Tarama Bilgileri -->
+            <div class="info-box">
+                <h2>📋 Tarama Bilgileri</h2>
+                <div class="info-grid">
+                    <div class="info-item">
+                        <label>Tarih</label>
+                        <value>{date}</value>
+                    </div>
+                    <div class="info-item">
+                        <label>Sistem</label>
+                        <value>{system}</value>
+                    </div>
+                    <div class="info-item">
+                        <label>Tarama Süresi</label>
+                        <value>{duration:.2f} saniye</value>
+                    </div>
+                    <div class="info-item">
+                        <label>Toplam Kontrol</label>
+                        <value>{total_checks}</value>
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Özet -->
+            <div class="summary">
+                <div class="summary-card total">
+                    <div class="label">Toplam Açık</div>
+                    <div class="number">{total}</div>
+                </div>
+                <div class="summary-card critical">
+                    <div class="label">Kritik</div>
+                    <div class="number">{critical}</div>
+                </div>
+                <div class="summary-card high">
+                    <div class="label">Yüksek</div>
+                    <div class="number">{high}</div>
+                </div>
+                <div class="summary-card medium">
+                    <div class="label">Orta</div>
+                    <div class="number">{medium}</div>
+                </div>
+                <div class="summary-card low">
+                    <div class="label">Düşük</div>
+                    <div class="number">{low}</div>
+                </div>
+            </div>
+            
+            <!-- Bulgular -->
+"""
+
+HTML_NO_FINDINGS = """
+            <div class="no-vulnerabilities">
+                <div class="icon">✓</div>
+                <h3>Güvenlik Açığı Bulunamadı</h3>
+                <p>Sisteminiz temel güvenlik kontrollerini başarıyla geçti.</p>
+            </div>
+"""
+
+HTML_FINDINGS_TITLE = """
+            <div class="info-box">
+                <h2>🔍 Detaylı Bulgular</h2>
+            </div>
+"""
+
+HTML_FINDING = """
+            <div class="vulnerability">
+                <div class="vulnerability-header">
+                    <div class="vulnerability-number">{index}</div>
+                    <div class="vulnerability-title">{message}</div>
+                    <span class="risk-badge risk-{risk}">{risk_label}</span>
+                </div>
+"""
+
+HTML_FINDING_DETAILS = """
+                <div class="vulnerability-details">
+                    <strong>📌 Detay:</strong><br>
+                    {details}
+                </div>
+"""
+
+HTML_FINDING_SOLUTION = """
+                <div class="vulnerability-solution">
+                    <strong>✓ Çözüm Önerisi:</strong>
+                    {solution}
+                </div>
+"""
+
+HTML_FINDING_END = """
+            </div>
+"""
+
+HTML_FOOTER = """
+        </div>
+        
+        <div class="footer">
+            <p>Bu rapor otomatik olarak oluşturulmuştur.</p>
+            <p><strong>Siber Güvenlik Tarama Aracı v1.0</strong></p>
+            <p>Oluşturulma: {generated}</p>
+        </div>
+    </div>
+</body>
+</html>"""
\ No newline at end of file